@@ -2,7 +2,7 @@ import json
 from pathlib import Path
 
 REQUIRED = [
-  'ledger.jsonl',
+  ('ledger.jsonl', 'ledger.cols'),
   'archive_stats.json',
   'metadata.yaml',
   'h7_trace.png',
@@ -25,7 +25,11 @@ def main():
     if run is None:
         raise SystemExit('No run_* folder found under data/archives')
 
-    missing = [f for f in REQUIRED if not (run / f).exists()]
+    missing = []
+    for f in REQUIRED:
+        options = f if isinstance(f, tuple) else (f,)
+        if not any((run / o).exists() for o in options):
+            missing.append(' | '.join(options))
     out = {
         'repo_root': str(root),
         'latest_run': str(run),
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import List, Optional
 import numpy as np
 
 from ..core.types import Candidate
@@ -14,5 +15,24 @@ class ProposerAdapter(ABC):
         parent: Candidate,
         rng: np.random.Generator,
         child_id: str,
+        sigma: Optional[float] = None,
     ) -> Candidate:
+        """Propose a child of ``parent``; ``sigma`` overrides the step scale for this call only."""
         raise NotImplementedError
+
+    def propose_batch(
+        self,
+        parent: Candidate,
+        rng: np.random.Generator,
+        n: int,
+        id_prefix: str,
+        sigma: Optional[float] = None,
+    ) -> List[Candidate]:
+        """Propose ``n`` children with ids ``f"{id_prefix}{i:03d}"``.
+
+        The default calls ``propose`` in a loop; adapters override it with a
+        vectorized version that consumes ``rng`` the same way.
+        """
+        if sigma is None:
+            return [self.propose(parent, rng, f"{id_prefix}{i:03d}") for i in range(int(n))]
+        return [self.propose(parent, rng, f"{id_prefix}{i:03d}", sigma=sigma) for i in range(int(n))]
@@ -1,10 +1,17 @@
 from __future__ import annotations
+from typing import List, Optional
 import numpy as np
 
-from ..core.types import Candidate
+from ..core.types import Candidate, CandidateBatch
 from .base import ProposerAdapter
 
 
+def _row_norms(x: np.ndarray) -> np.ndarray:
+    # Stacked (1, D) @ (D, 1) products reduce each row like the dot product
+    # inside np.linalg.norm, so batched norms match single-row ones bit for bit.
+    return np.sqrt((x[:, None, :] @ x[:, :, None]).reshape(x.shape[0]))
+
+
 class GaussianNoiseAdapter(ProposerAdapter):
     name = "gaussian_noise"
 
@@ -17,9 +24,11 @@ class GaussianNoiseAdapter(ProposerAdapter):
         parent: Candidate,
         rng: np.random.Generator,
         child_id: str,
+        sigma: Optional[float] = None,
     ) -> Candidate:
         g = parent.genome.astype(np.float32)
-        delta = rng.normal(0.0, self.sigma, size=g.shape).astype(np.float32)
+        scale = self.sigma if sigma is None else float(sigma)
+        delta = rng.normal(0.0, scale, size=g.shape).astype(np.float32)
 
         n = float(np.linalg.norm(delta) + 1e-9)
         if n > self.step_cap:
@@ -29,3 +38,41 @@ class GaussianNoiseAdapter(ProposerAdapter):
         child.tags["delta_norm"] = float(np.linalg.norm(delta))
         child.tags["proposer_adapter"] = self.name
         return child
+
+    def propose_batch(
+        self,
+        parent: Candidate,
+        rng: np.random.Generator,
+        n: int,
+        id_prefix: str,
+        sigma: Optional[float] = None,
+    ) -> List[Candidate]:
+        """Draw all ``n`` deltas as one (n, D) matrix and cap their norms row-wise.
+
+        Children are identical to ``n`` successive ``propose`` calls on the
+        same ``rng``; they come as a ``CandidateBatch`` over one contiguous
+        (n, D) genome array.
+        """
+        n = int(n)
+        g = parent.genome.astype(np.float32).ravel()
+        scale = self.sigma if sigma is None else float(sigma)
+        delta = rng.normal(0.0, scale, size=(n, g.size)).astype(np.float32)
+
+        norms = _row_norms(delta)
+        capped = (norms + np.float32(1e-9)) > self.step_cap
+        if capped.any():
+            factor = np.ones(n, dtype=np.float32)
+            factor[capped] = (self.step_cap / (norms[capped] + np.float32(1e-9)).astype(np.float64)).astype(np.float32)
+            delta *= factor[:, None]
+            norms = _row_norms(delta)
+
+        genomes = delta
+        genomes += g
+        genomes = genomes.reshape((n,) + parent.genome.shape)
+        out = CandidateBatch(genomes=genomes)
+        for i in range(n):
+            child = type(parent)(id=f"{id_prefix}{i:03d}", genome=genomes[i])
+            child.tags["delta_norm"] = float(norms[i])
+            child.tags["proposer_adapter"] = self.name
+            out.append(child)
+        return out
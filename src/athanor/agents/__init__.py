@@ -3,6 +3,7 @@ from .proposer_agent import ProposerAgent
 from .verifier_agent import VerifierAgent
 from .selector_agent import SelectorAgent
 from .archivist_agent import ArchivistAgent
+from .evaluation_cache import EvaluationCache, evaluation_key
 
 __all__ = [
     "TelemetryAgent",
@@ -10,4 +11,6 @@ __all__ = [
     "VerifierAgent",
     "SelectorAgent",
     "ArchivistAgent",
+    "EvaluationCache",
+    "evaluation_key",
 ]
\ No newline at end of file
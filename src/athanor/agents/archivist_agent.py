@@ -1,10 +1,20 @@
 from __future__ import annotations
 from .base import Agent
-from ..evolution.archive import MapElitesArchive
+from ..evolution.archive import MapElitesArchive, DenseMapElitesArchive
 
 class ArchivistAgent(Agent):
-    def __init__(self, bins=(16,16)):
-        self.archive = MapElitesArchive(bins=bins)
+    def __init__(self, bins=(16,16), kind: str = "map", archive=None):
+        """Archivist over a new ``kind`` archive, or over ``archive`` when one is given (e.g. restored)."""
+        if archive is not None:
+            self.archive = archive
+        elif kind == "dense":
+            self.archive = DenseMapElitesArchive(bins=bins)
+        else:
+            self.archive = MapElitesArchive(bins=bins)
 
     def step(self, candidate) -> bool:
-        return bool(self.archive.add(candidate))
\ No newline at end of file
+        return bool(self.archive.add(candidate))
+
+    def step_batch(self, candidates):
+        """Archive a whole generation at once; returns one admitted flag per candidate."""
+        return [bool(ok) for ok in self.archive.add_candidates(candidates)]
\ No newline at end of file
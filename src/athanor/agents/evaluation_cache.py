@@ -0,0 +1,139 @@
+from __future__ import annotations
+import hashlib, json, os
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import numpy as np
+
+from ..core.types import DeltaPhiEstimate
+
+# Rough per-entry bookkeeping cost (dict slot, key string, estimate object).
+_ENTRY_OVERHEAD = 256
+
+
+def evaluation_key(genome: np.ndarray, seed: int, telemetry, verifier, path: str = "batch") -> str:
+    """Content address of one evaluation: genome bytes plus every input that shapes the estimate.
+
+    ``path`` names the code path (batch / fused / serial / stream) and the
+    backend is part of the key, because kernels may differ in the last float bit.
+    """
+    g = np.ascontiguousarray(genome, dtype=np.float32)
+    params = [
+        list(g.shape), int(seed), path,
+        str(getattr(getattr(telemetry, "backend", None), "name", "numpy")),
+        int(telemetry.steps), float(telemetry.noise), str(getattr(telemetry, "precision", "float32")),
+        float(verifier.threshold), str(verifier.mode),
+    ]
+    if getattr(verifier, "early_exit", False) and path == "stream":
+        # The reported prefix depends on where the verdict became decided.
+        params += [int(verifier.chunk), float(verifier.refine_floor)]
+    if getattr(verifier, "robust_samples", 0):
+        params += [int(verifier.robust_samples), float(verifier.robust_sigma), int(verifier.robust_seed)]
+    h = hashlib.sha256(g.tobytes())
+    h.update(json.dumps(params).encode("utf-8"))
+    return h.hexdigest()
+
+
+class EvaluationCache:
+    """Content-addressed cache of ``DeltaPhiEstimate`` summaries.
+
+    Only ``h7`` and the summary dict are stored, never trajectories or
+    per-step arrays; hits come back with empty ``dphi``/``coherence``. The
+    in-memory tier is an LRU bounded by ``max_bytes``. With ``directory``
+    set, entries are also written to ``<directory>/<key[:2]>/<key>.json``
+    (atomically, so concurrent runs can share it) and read back on a memory
+    miss.
+    """
+
+    def __init__(self, max_bytes: int = 64 << 20, directory: Optional[str] = None):
+        self.max_bytes = max(int(max_bytes), 0)
+        self.directory = str(directory) if directory else None
+        self._mem: "OrderedDict[str, tuple]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._mem)
+
+    def get(self, key: str) -> Optional[DeltaPhiEstimate]:
+        item = self._mem.get(key)
+        if item is not None:
+            self._mem.move_to_end(key)
+            self.hits += 1
+            return self._estimate(item[0])
+        payload = self._read_disk(key)
+        if payload is not None:
+            self.disk_hits += 1
+            self._remember(key, payload)
+            return self._estimate(payload)
+        self.misses += 1
+        return None
+
+    def put(self, key: str, est: DeltaPhiEstimate) -> None:
+        payload = {"h7": float(est.h7), "summary": dict(est.summary)}
+        self._remember(key, payload)
+        if self.directory:
+            self._write_disk(key, payload)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": float((self.hits + self.disk_hits) / lookups) if lookups else 0.0,
+            "entries": len(self._mem),
+            "bytes": self.bytes,
+            "evictions": self.evictions,
+        }
+
+    def absorb(self, counters: Dict[str, int]) -> None:
+        """Add lookup counters gathered elsewhere (e.g. in worker processes)."""
+        self.hits += int(counters.get("hits", 0))
+        self.disk_hits += int(counters.get("disk_hits", 0))
+        self.misses += int(counters.get("misses", 0))
+
+    @staticmethod
+    def _estimate(payload: Dict[str, Any]) -> DeltaPhiEstimate:
+        empty = np.zeros((0,), dtype=np.float32)
+        return DeltaPhiEstimate(dphi=empty, coherence=empty, h7=payload["h7"], summary=dict(payload["summary"]))
+
+    def _remember(self, key: str, payload: Dict[str, Any]) -> None:
+        size = len(key) + len(json.dumps(payload)) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        old = self._mem.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._mem[key] = (payload, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, sz) = self._mem.popitem(last=False)
+            self.bytes -= sz
+            self.evictions += 1
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.directory:
+            return None
+        try:
+            with open(self._disk_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, payload: Dict[str, Any]) -> None:
+        path = self._disk_path(key)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import inspect
 import numpy as np
 from .base import Agent
 from ..adapters import GaussianNoiseAdapter, ProposerAdapter
@@ -13,6 +14,7 @@ class ProposerAgent(Agent):
         self.adapter = adapter or GaussianNoiseAdapter(sigma=sigma, step_cap=step_cap)
         self._sigma = float(sigma)
         self._step_cap = float(step_cap)
+        self._per_call_sigma = "sigma" in inspect.signature(self.adapter.propose).parameters
 
     @property
     def sigma(self) -> float:
@@ -38,5 +40,20 @@ class ProposerAgent(Agent):
             setattr(self.adapter, "step_cap", float(value))
         self._step_cap = float(value)
 
-    def step(self, parent, rng: np.random.Generator, child_id: str):
-        return self.adapter.propose(parent=parent, rng=rng, child_id=child_id)
+    def step(self, parent, rng: np.random.Generator, child_id: str, sigma: float | None = None):
+        """Propose one child. ``sigma`` scales this call only; the agent's own sigma is never mutated.
+
+        Adapters whose ``propose`` takes no ``sigma`` argument ignore the override.
+        """
+        if sigma is None or not self._per_call_sigma:
+            return self.adapter.propose(parent=parent, rng=rng, child_id=child_id)
+        return self.adapter.propose(parent=parent, rng=rng, child_id=child_id, sigma=float(sigma))
+
+    def step_batch(self, parent, rng: np.random.Generator, n: int, id_prefix: str, sigma: float | None = None):
+        """Propose ``n`` children with ids ``f"{id_prefix}{i:03d}"`` in one adapter call where supported."""
+        batch = getattr(self.adapter, "propose_batch", None)
+        if batch is None:
+            return [self.step(parent, rng=rng, child_id=f"{id_prefix}{i:03d}", sigma=sigma) for i in range(int(n))]
+        if sigma is None or not self._per_call_sigma:
+            return batch(parent=parent, rng=rng, n=int(n), id_prefix=id_prefix)
+        return batch(parent=parent, rng=rng, n=int(n), id_prefix=id_prefix, sigma=float(sigma))
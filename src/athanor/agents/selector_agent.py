@@ -1,4 +1,5 @@
 from __future__ import annotations
+import numpy as np
 from .base import Agent
 
 class SelectorAgent(Agent):
@@ -12,4 +13,14 @@ class SelectorAgent(Agent):
 
         candidate.score_q = float(q)
         candidate.score_f = float((self.alpha * q) + ((1.0 - self.alpha) * h7))
-        return candidate
\ No newline at end of file
+        return candidate
+
+    def step_batch(self, candidates):
+        dn = np.array([float(c.tags.get("delta_norm", 0.0)) for c in candidates], dtype=np.float64)
+        h7 = np.array([float(c.dphi.h7) if c.dphi else 0.0 for c in candidates], dtype=np.float64)
+        q = 1.0 / (1.0 + dn)
+        f = (self.alpha * q) + ((1.0 - self.alpha) * h7)
+        for c, qk, fk in zip(candidates, q.tolist(), f.tolist()):
+            c.score_q = qk
+            c.score_f = fk
+        return candidates
@@ -1,13 +1,42 @@
 from __future__ import annotations
+import numpy as np
 from .base import Agent
-from ..core.telemetry import capture_trajectory
+from ..backends import ComputeBackend, get_backend
+from ..core.telemetry import TrajectoryStream
+from ..core.types import TelemetryBatch, stack_genomes
 
 class TelemetryAgent(Agent):
-    def __init__(self, steps: int, noise: float, seed: int):
+    def __init__(self, steps: int, noise: float, seed: int, backend: ComputeBackend | None = None,
+                 precision: str = "float32"):
         self.steps = int(steps)
         self.noise = float(noise)
         self.seed  = int(seed)
+        self.precision = str(precision)
+        self.backend = backend if backend is not None else get_backend()
 
     def step(self, candidate):
-        candidate.telemetry = capture_trajectory(candidate.genome, steps=self.steps, noise=self.noise, seed=self.seed)
-        return candidate
\ No newline at end of file
+        candidate.telemetry = self.backend.capture_trajectory(candidate.genome, steps=self.steps, noise=self.noise,
+                                                              seed=self.seed, precision=self.precision)
+        return candidate
+
+    def step_batch(self, candidates, seeds) -> TelemetryBatch:
+        """Capture telemetry for all candidates at once; returns the stacked batch."""
+        genomes = stack_genomes(candidates)
+        batch = self.backend.capture_trajectory_batch(genomes, seeds, steps=self.steps, noise=self.noise,
+                                                      precision=self.precision)
+        return self.attach(candidates, batch)
+
+    def attach(self, candidates, batch: TelemetryBatch) -> TelemetryBatch:
+        """Give each candidate a view of its row of ``batch``."""
+        for k, (c, sd) in enumerate(zip(candidates, batch.meta["seeds"])):
+            c.telemetry = TelemetryBatch(
+                traj=batch.traj[k],
+                meta={"steps": self.steps, "noise": self.noise, "D": int(batch.traj.shape[2]), "seed": sd},
+            )
+        return batch
+
+    def stream(self, candidates, seeds) -> TrajectoryStream:
+        """Chunked capture for early-exit verification; frames match ``step_batch``."""
+        genomes = stack_genomes(candidates)
+        return self.backend.trajectory_stream(genomes, seeds, steps=self.steps, noise=self.noise,
+                                              precision=self.precision)
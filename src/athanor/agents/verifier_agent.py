@@ -1,12 +1,42 @@
 from __future__ import annotations
+import hashlib
+import numpy as np
 from .base import Agent
-from ..core.coherence import estimate
+from ..backends import ComputeBackend, get_backend
+from ..core.coherence import robustness_ensemble, robustness_summaries
+from ..core.types import TelemetryBatch, stack_genomes
+
+# Verdict and reason per band, as returned by ``VerifierAgent.band``.
+VERDICTS = (
+    ("REJECT", "H7 below refine floor"),
+    ("REFINE", "H7 in refine band"),
+    ("APPROVE", "H7>=threshold"),
+)
 
 class VerifierAgent(Agent):
-    def __init__(self, threshold_h7: float = 0.70, dphi_mode: str = "l2", refine_floor: float = 0.50):
+    def __init__(
+        self,
+        threshold_h7: float = 0.70,
+        dphi_mode: str = "l2",
+        refine_floor: float = 0.50,
+        early_exit: bool = False,
+        chunk: int = 8,
+        backend: ComputeBackend | None = None,
+        robust_samples: int = 0,
+        robust_sigma: float = 0.05,
+        robust_floor: float | None = None,
+        robust_seed: int = 0,
+    ):
         self.threshold = float(threshold_h7)
         self.mode = str(dphi_mode)
         self.refine_floor = float(refine_floor)
+        self.early_exit = bool(early_exit)
+        self.chunk = max(int(chunk), 1)
+        self.backend = backend if backend is not None else get_backend()
+        self.robust_samples = max(int(robust_samples), 0)
+        self.robust_sigma = float(robust_sigma)
+        self.robust_floor = None if robust_floor is None else float(robust_floor)
+        self.robust_seed = int(robust_seed)
 
     def step(self, candidate):
         if candidate.telemetry is None:
@@ -14,20 +44,133 @@ class VerifierAgent(Agent):
             candidate.reason  = "missing telemetry"
             return candidate
 
-        est = estimate(candidate.telemetry.traj, threshold=self.threshold, mode=self.mode)
-        candidate.dphi = est
+        est = self.backend.estimate(candidate.telemetry.traj, threshold=self.threshold, mode=self.mode)
+        return self.judge(candidate, est)
 
-        h7 = float(est.h7)
-        if h7 >= self.threshold:
-            candidate.verdict = "APPROVE"
-            candidate.reason  = "H7>=threshold"
-            return candidate
+    def step_batch(self, candidates, batch=None):
+        """Verify many candidates; ``batch`` may carry their stacked (P, steps, D) telemetry."""
+        if batch is not None:
+            traj = batch.traj
+        elif candidates and all(c.telemetry is not None for c in candidates):
+            traj = np.stack([c.telemetry.traj for c in candidates])
+        else:
+            return [self.step(c) for c in candidates]
 
-        if h7 >= self.refine_floor:
-            candidate.verdict = "REFINE"
-            candidate.reason  = "H7 in refine band"
-            return candidate
+        ests = self.backend.estimate_batch(traj, threshold=self.threshold, mode=self.mode)
+        self.add_robustness(ests)
+        for c, est in zip(candidates, ests):
+            self.judge(c, est)
+        return candidates
+
+    def step_fused(self, candidates, telemetry, seeds):
+        """Capture and verify in one backend call (``backend.capture_and_estimate``)."""
+        batch, ests = self.backend.capture_and_estimate(stack_genomes(candidates), seeds, steps=telemetry.steps,
+                                                        noise=telemetry.noise, threshold=self.threshold,
+                                                        mode=self.mode, precision=telemetry.precision)
+        telemetry.attach(candidates, batch)
+        self.add_robustness(ests)
+        for c, est in zip(candidates, ests):
+            self.judge(c, est)
+        return candidates
+
+    def step_stream(self, candidates, stream):
+        """Early-exit verification over a ``TrajectoryStream``.
+
+        Frames are pulled ``chunk`` steps at a time and threshold hits are
+        counted incrementally. With ``hits`` of ``seen`` transitions above
+        threshold, the final h7 lies in ``[hits/n, (hits + n - seen)/n]``; once
+        both ends give the same verdict the candidate stops simulating. Its
+        estimate covers the simulated prefix, whose h7 lies between those
+        bounds, so the verdict equals the full-trajectory one. With a
+        robustness floor, candidates headed for APPROVE are simulated in full
+        so the floor sees the same ΔΦ as full verification.
+        ``steps_simulated`` is recorded in the estimate summary.
+        """
+        n = len(candidates)
+        total = max(stream.steps - 1, 0)
+        hits = np.zeros((n,), dtype=np.int64)
+        seen = np.zeros((n,), dtype=np.int64)
+        first = stream.initial()
+        last = first.copy()
+        frames = [[first[k][None, :]] if stream.steps else [] for k in range(n)]
+
+        active = np.arange(n)
+        while active.size:
+            done = self._decided_mask(hits[active], seen[active], total)
+            for k in active[done].tolist():
+                self._finish(candidates[k], frames[k], stream)
+            active = active[~done]
+            if not active.size:
+                break
+            block = stream.advance(self.chunk, rows=active)
+            seq = np.concatenate([last[active][:, None], block], axis=1)
+            C = self.backend.coherence_from_dphi(self.backend.delta_phi_batch(seq, mode=self.mode))
+            hits[active] += (C >= self.threshold).sum(axis=1)
+            seen[active] += block.shape[1]
+            last[active] = block[:, -1]
+            for j, k in enumerate(active.tolist()):
+                frames[k].append(block[j])
+        return candidates
 
-        candidate.verdict = "REJECT"
-        candidate.reason  = "H7 below refine floor"
-        return candidate
\ No newline at end of file
+    def _decided_mask(self, hits: np.ndarray, seen: np.ndarray, total: int) -> np.ndarray:
+        """Rows whose verdict band no longer depends on the ``total - seen`` unseen transitions."""
+        if total <= 0:
+            return np.ones(hits.shape, dtype=bool)
+        lo = self.band(hits / total)
+        decided = lo == self.band((hits + (total - seen)) / total)
+        if self.robust_floor is not None:
+            # The robustness floor reads the whole ΔΦ, so APPROVE candidates simulate to the end.
+            decided &= (lo != 2) | (seen >= total)
+        return decided
+
+    def _finish(self, candidate, frames, stream):
+        traj = np.concatenate(frames, axis=0) if frames else np.zeros((0, stream.D), dtype=stream.dtype)
+        candidate.telemetry = TelemetryBatch(
+            traj=traj,
+            meta={"steps": int(traj.shape[0]), "noise": stream.noise, "D": stream.D, "early_exit": True},
+        )
+        # Same kernel as the full-trajectory path, so hit counts agree exactly.
+        est = self.backend.estimate_batch(traj[None], threshold=self.threshold, mode=self.mode)[0]
+        est.summary["steps_simulated"] = int(traj.shape[0])
+        self.judge(candidate, est)
+
+    def band(self, h7) -> np.ndarray:
+        """Verdict band per h7 value: index into ``VERDICTS`` (0 REJECT, 1 REFINE, 2 APPROVE)."""
+        h7 = np.asarray(h7)
+        return np.where(h7 >= self.threshold, 2, np.where(h7 >= self.refine_floor, 1, 0))
+
+    def verdict_for(self, h7: float):
+        """(verdict, reason) for an h7 value."""
+        return VERDICTS[int(self.band(h7))]
+
+    def add_robustness(self, ests) -> None:
+        """Add robustness fields to every estimate that lacks them (cached estimates already carry theirs).
+
+        Each estimate gets ``robust_samples`` bounded-noise perturbations of
+        its ΔΦ, scored as one (samples, n) block; quantiles are taken for all
+        of them at once. The ensemble's random stream is keyed on the ΔΦ
+        bytes, so the result does not depend on evaluation order or on how
+        candidates are split across workers.
+        """
+        todo = [e for e in ests if "immunity_q05" not in e.summary] if self.robust_samples else []
+        if not todo:
+            return
+        K = self.robust_samples
+        immunity = np.empty((len(todo), K), dtype=np.float64)
+        drift = np.empty((len(todo), K), dtype=np.float64)
+        for k, est in enumerate(todo):
+            d = np.ascontiguousarray(est.dphi)
+            key = int.from_bytes(hashlib.blake2b(d.tobytes(), digest_size=8).digest(), "little")
+            rng = np.random.default_rng([self.robust_seed, key])
+            immunity[k], drift[k] = robustness_ensemble(d, self.robust_sigma, K, rng=rng, C=est.coherence)
+        for est, fields in zip(todo, robustness_summaries(immunity, drift)):
+            est.summary.update(fields)
+
+    def judge(self, candidate, est):
+        self.add_robustness([est])
+        candidate.dphi = est
+        candidate.verdict, candidate.reason = self.verdict_for(float(est.h7))
+        if (candidate.verdict == "APPROVE" and self.robust_floor is not None
+                and est.summary.get("immunity_q05", 0.0) < self.robust_floor):
+            candidate.verdict, candidate.reason = "REFINE", "robustness below floor"
+        return candidate
@@ -1 +1,60 @@
-# v2.0: backend hooks are still stubs (symbolic telemetry is default).
\ No newline at end of file
+from __future__ import annotations
+import importlib.util, logging
+from typing import Dict, List, Type
+
+from .base import ComputeBackend
+from .numpy_backend import NumpyBackend
+
+log = logging.getLogger(__name__)
+
+# name -> backend class; ``numba`` is imported on first use so numba itself
+# never loads unless that backend is asked for.
+BACKENDS: Dict[str, Type[ComputeBackend]] = {"numpy": NumpyBackend}
+OPTIONAL_BACKENDS: Dict[str, str] = {"numba": "numba"}
+# Older configs name the reference kernels ``symbolic``.
+ALIASES: Dict[str, str] = {"symbolic": "numpy"}
+
+
+def register_backend(name: str, cls: Type[ComputeBackend]) -> None:
+    if not (isinstance(cls, type) and issubclass(cls, ComputeBackend)):
+        raise ValueError(f"backend {name!r} must be a ComputeBackend subclass")
+    BACKENDS[str(name)] = cls
+
+
+def backend_names() -> List[str]:
+    """Every name ``get_backend`` accepts, including aliases and optional backends."""
+    return sorted({*BACKENDS, *OPTIONAL_BACKENDS, *ALIASES})
+
+
+def available_backends() -> List[str]:
+    """Backends that run natively here (optional ones only if their dependency is installed)."""
+    return sorted({*BACKENDS, *(n for n, mod in OPTIONAL_BACKENDS.items()
+                                if importlib.util.find_spec(mod) is not None)})
+
+
+def get_backend(name: str = "numpy") -> ComputeBackend:
+    """Backend instance for ``name``; an optional backend whose dependency is missing falls back to NumPy."""
+    key = ALIASES.get(str(name), str(name))
+    if key in BACKENDS:
+        return BACKENDS[key]()
+    if key == "numba":
+        from .numba_backend import NUMBA_AVAILABLE, NumbaBackend
+
+        if NUMBA_AVAILABLE:
+            return NumbaBackend()
+        log.warning("backend 'numba' requested but numba is not installed; using 'numpy'")
+        return NumpyBackend()
+    raise ValueError(f"unknown backend {name!r}; expected one of {backend_names()}")
+
+
+__all__ = [
+    "ComputeBackend",
+    "NumpyBackend",
+    "BACKENDS",
+    "OPTIONAL_BACKENDS",
+    "ALIASES",
+    "register_backend",
+    "backend_names",
+    "available_backends",
+    "get_backend",
+]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import List, Sequence, Tuple
+import numpy as np
+
+from ..core.telemetry import TrajectoryStream
+from ..core.types import DeltaPhiEstimate, TelemetryBatch
+
+
+class ComputeBackend(ABC):
+    """Kernel set that the telemetry and verifier agents dispatch through.
+
+    ``fused`` backends implement ``capture_and_estimate`` as one pass
+    (trajectory, ΔΦ, C and summary together); the loop then evaluates a
+    whole generation with a single call.
+    """
+
+    name: str = "backend"
+    fused: bool = False
+
+    @abstractmethod
+    def capture_trajectory(self, genome: np.ndarray, steps: int = 24, noise: float = 0.02,
+                           seed: int = 0, precision: str = "float32") -> TelemetryBatch:
+        raise NotImplementedError
+
+    @abstractmethod
+    def capture_trajectory_batch(self, genomes: np.ndarray, seeds, steps: int = 24,
+                                 noise: float = 0.02, precision: str = "float32") -> TelemetryBatch:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delta_phi(self, traj: np.ndarray, mode: str = "l2") -> np.ndarray:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delta_phi_batch(self, traj: np.ndarray, mode: str = "l2") -> np.ndarray:
+        raise NotImplementedError
+
+    @abstractmethod
+    def coherence_from_dphi(self, dphi: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    @abstractmethod
+    def h7_horizon(self, C: np.ndarray, threshold: float = 0.70) -> float:
+        raise NotImplementedError
+
+    @abstractmethod
+    def weighted_coherence_mean(self, C: np.ndarray, power: float = 1.0) -> float:
+        raise NotImplementedError
+
+    @abstractmethod
+    def cusp_limited_h7(self, C: np.ndarray, threshold: float = 0.70, survival_floor: float = 0.0) -> float:
+        raise NotImplementedError
+
+    @abstractmethod
+    def estimate(self, traj: np.ndarray, threshold: float = 0.70, mode: str = "l2") -> DeltaPhiEstimate:
+        raise NotImplementedError
+
+    @abstractmethod
+    def estimate_batch(self, traj: np.ndarray, threshold: float = 0.70, mode: str = "l2") -> List[DeltaPhiEstimate]:
+        raise NotImplementedError
+
+    def trajectory_stream(self, genomes: np.ndarray, seeds, steps: int = 24, noise: float = 0.02,
+                          precision: str = "float32") -> TrajectoryStream:
+        return TrajectoryStream(genomes, seeds, steps=steps, noise=noise, precision=precision)
+
+    def capture_and_estimate(self, genomes: np.ndarray, seeds: Sequence[int], steps: int = 24, noise: float = 0.02,
+                             threshold: float = 0.70, mode: str = "l2",
+                             precision: str = "float32") -> Tuple[TelemetryBatch, List[DeltaPhiEstimate]]:
+        """Telemetry and estimates for a stacked genome matrix; the default runs the two stages back to back."""
+        batch = self.capture_trajectory_batch(genomes, seeds, steps=steps, noise=noise, precision=precision)
+        return batch, self.estimate_batch(batch.traj, threshold=threshold, mode=mode)
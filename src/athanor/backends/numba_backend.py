@@ -0,0 +1,229 @@
+from __future__ import annotations
+import math
+from typing import List, Sequence, Tuple
+import numpy as np
+
+from ..core.telemetry import draw_noise
+from ..core.types import DeltaPhiEstimate, TelemetryBatch
+from .numpy_backend import NumpyBackend
+
+try:
+    import numba
+except ImportError:  # optional dependency
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+# Kernels are written in the subset of Python that numba compiles. Without
+# numba they run interpreted (slowly but identically), which keeps their
+# logic testable everywhere; ``get_backend('numba')`` falls back to NumPy
+# instead of handing out the interpreted kernels.
+_jit = numba.njit(cache=True) if NUMBA_AVAILABLE else (lambda fn: fn)
+
+# Survival floor of the cusp-limited h7, as in ``estimate``.
+_CUSP_FLOOR = 0.50
+
+# Columns of the per-row summary block filled by ``_summary_rows``.
+_SUMMARY_FIELDS = ('dphi_mean', 'dphi_std', 'C_mean', 'C_std', 'h7', 'h7_weighted', 'h7_cusp')
+
+
+@_jit
+def _step_dphi(a, b, cosine):
+    if cosine:
+        dot = 0.0
+        na = 0.0
+        nb = 0.0
+        for j in range(a.shape[0]):
+            x = float(a[j])
+            y = float(b[j])
+            dot += x * y
+            na += x * x
+            nb += y * y
+        c = dot / ((math.sqrt(na) + 1e-9) * (math.sqrt(nb) + 1e-9))
+        return math.acos(min(max(c, -1.0), 1.0))
+    s = 0.0
+    for j in range(a.shape[0]):
+        diff = float(b[j]) - float(a[j])
+        s += diff * diff
+    return math.sqrt(s)
+
+
+@_jit
+def _advance_row(w, prev, eps, out):
+    acc = 0.0
+    for j in range(prev.shape[0]):
+        acc += float(w[j]) * float(prev[j])
+    a = np.float32(acc)
+    for j in range(prev.shape[0]):
+        out[j] = (prev[j] + a) + eps[j]
+
+
+@_jit
+def _store_step(dv, d, c, p, t):
+    d[p, t] = np.float32(dv)
+    c[p, t] = np.float32(1.0) / (np.float32(1.0) + abs(d[p, t]))
+
+
+@_jit
+def _trajectory_rows(w, s0, eps, traj):
+    P, T = traj.shape[0], traj.shape[1]
+    for p in range(P):
+        if T:
+            traj[p, 0, :] = s0[p]
+        for t in range(1, T):
+            _advance_row(w[p], traj[p, t - 1], eps[p, t - 1], traj[p, t])
+
+
+@_jit
+def _dphi_rows(traj, cosine, d, c):
+    P, T = traj.shape[0], traj.shape[1]
+    for p in range(P):
+        for t in range(1, T):
+            _store_step(_step_dphi(traj[p, t - 1], traj[p, t], cosine), d, c, p, t - 1)
+
+
+@_jit
+def _fused_rows(w, s0, eps, cosine, traj, d, c):
+    # Recurrence, ΔΦ and C in one sweep; each frame is read back while hot.
+    P, T = traj.shape[0], traj.shape[1]
+    for p in range(P):
+        if T:
+            traj[p, 0, :] = s0[p]
+        for t in range(1, T):
+            _advance_row(w[p], traj[p, t - 1], eps[p, t - 1], traj[p, t])
+            _store_step(_step_dphi(traj[p, t - 1], traj[p, t], cosine), d, c, p, t - 1)
+
+
+@_jit
+def _summary_rows(d, c, thr, floor, out):
+    P, n = d.shape[0], d.shape[1]
+    for p in range(P):
+        if n == 0:
+            out[p, :] = 0.0
+            continue
+        sd = sc = wsum = wcsum = 0.0
+        hits = kept = cusp = 0
+        for t in range(n):
+            x = float(d[p, t])
+            y = float(c[p, t])
+            sd += x
+            sc += y
+            wv = min(max(y, 0.0), 1.0)
+            wsum += wv
+            wcsum += wv * y
+            if y >= thr:
+                hits += 1
+            if y >= floor:
+                kept += 1
+                if y >= thr:
+                    cusp += 1
+        d_mean = sd / n
+        c_mean = sc / n
+        # Second pass over the centered values, like NumPy's std (E[x²] - mean² cancels).
+        vd = vc = 0.0
+        for t in range(n):
+            x = float(d[p, t]) - d_mean
+            y = float(c[p, t]) - c_mean
+            vd += x * x
+            vc += y * y
+        out[p, 0] = d_mean
+        out[p, 1] = math.sqrt(vd / n)
+        out[p, 2] = c_mean
+        out[p, 3] = math.sqrt(vc / n)
+        out[p, 4] = hits / n
+        out[p, 5] = c_mean if wsum <= 1e-12 else wcsum / wsum
+        out[p, 6] = cusp / kept if kept > 0 else 0.0
+
+
+class NumbaBackend(NumpyBackend):
+    """Compiled backend: loop kernels for the batched paths, one fused pass in ``capture_and_estimate``.
+
+    Noise is drawn with NumPy from the same per-seed streams, so trajectories
+    follow the reference recurrence; only summation order differs, which
+    moves results in the last float bits. Accumulators are float64, and
+    thresholds are compared at float32 precision like the NumPy kernels.
+    Single-trajectory calls, and every call at a precision other than
+    float32, are inherited from ``NumpyBackend``.
+    """
+
+    name = "numba"
+    fused = True
+
+    def capture_trajectory_batch(self, genomes: np.ndarray, seeds, steps: int = 24,
+                                 noise: float = 0.02, precision: str = "float32") -> TelemetryBatch:
+        if precision != "float32":
+            return super().capture_trajectory_batch(genomes, seeds, steps=steps, noise=noise, precision=precision)
+        w, s0, eps, seeds = self._inputs(genomes, seeds, steps, noise)
+        traj = np.empty((w.shape[0], int(steps), w.shape[1]), dtype=np.float32)
+        _trajectory_rows(w, s0, eps, traj)
+        return self._batch(traj, seeds, noise)
+
+    def delta_phi_batch(self, traj: np.ndarray, mode: str = "l2") -> np.ndarray:
+        if traj.dtype != np.float32:
+            return super().delta_phi_batch(traj, mode=mode)
+        return self._dphi(traj, mode)[0]
+
+    def estimate_batch(self, traj: np.ndarray, threshold: float = 0.70, mode: str = "l2") -> List[DeltaPhiEstimate]:
+        if traj.dtype != np.float32:
+            return super().estimate_batch(traj, threshold=threshold, mode=mode)
+        d, C = self._dphi(traj, mode)
+        return self._estimates(d, C, threshold, mode)
+
+    def capture_and_estimate(self, genomes: np.ndarray, seeds: Sequence[int], steps: int = 24, noise: float = 0.02,
+                             threshold: float = 0.70, mode: str = "l2",
+                             precision: str = "float32") -> Tuple[TelemetryBatch, List[DeltaPhiEstimate]]:
+        if precision != "float32":
+            return super().capture_and_estimate(genomes, seeds, steps=steps, noise=noise, threshold=threshold,
+                                                mode=mode, precision=precision)
+        w, s0, eps, seeds = self._inputs(genomes, seeds, steps, noise)
+        P, T, D = w.shape[0], int(steps), w.shape[1]
+        traj = np.empty((P, T, D), dtype=np.float32)
+        n = max(T - 1, 0)
+        d = np.empty((P, n), dtype=np.float32)
+        C = np.empty((P, n), dtype=np.float32)
+        _fused_rows(w, s0, eps, mode == "cosine", traj, d, C)
+        return self._batch(traj, seeds, noise), self._estimates(d, C, threshold, mode)
+
+    @staticmethod
+    def _inputs(genomes, seeds, steps, noise):
+        G = np.asarray(genomes, dtype=np.float32)
+        if G.ndim == 1:
+            G = G[None, :]
+        seeds = [int(s) for s in seeds]
+        if len(seeds) != G.shape[0]:
+            raise ValueError(f"expected {G.shape[0]} seeds, got {len(seeds)}")
+        w = (0.05 * np.tanh(G)).astype(np.float32, copy=False)
+        s0, eps = draw_noise(seeds, int(G.shape[1]), int(steps), noise)
+        return w, s0, eps, seeds
+
+    @staticmethod
+    def _batch(traj, seeds, noise) -> TelemetryBatch:
+        P, T, D = traj.shape
+        return TelemetryBatch(traj=traj, meta={"steps": T, "noise": float(noise), "D": D, "P": P, "seeds": seeds})
+
+    @staticmethod
+    def _dphi(traj, mode):
+        P = traj.shape[0] if traj.ndim else 0
+        n = max(traj.shape[1] - 1, 0) if traj.ndim == 3 else 0
+        d = np.empty((P, n), dtype=np.float32)
+        C = np.empty((P, n), dtype=np.float32)
+        if n:
+            _dphi_rows(traj, mode == "cosine", d, C)
+        return d, C
+
+    @staticmethod
+    def _estimates(d, C, threshold, mode) -> List[DeltaPhiEstimate]:
+        thr = float(threshold)
+        stats = np.empty((d.shape[0], len(_SUMMARY_FIELDS)), dtype=np.float64)
+        _summary_rows(d, C, float(np.float32(thr)), _CUSP_FLOOR, stats)
+        out = []
+        for k in range(d.shape[0]):
+            row = dict(zip(_SUMMARY_FIELDS, stats[k].tolist()))
+            summary = {
+                "threshold": thr,
+                "mode": str(mode),
+                **row,
+                "kappa_bound": float(min(max(row["C_mean"], 0.0), 1.0) ** 2),
+            }
+            out.append(DeltaPhiEstimate(dphi=d[k], coherence=C[k], h7=row["h7"], summary=summary))
+        return out
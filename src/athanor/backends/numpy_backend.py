@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from ..core import coherence, telemetry
+from .base import ComputeBackend
+
+
+class NumpyBackend(ComputeBackend):
+    """Reference backend: the vectorized NumPy kernels in ``athanor.core``."""
+
+    name = "numpy"
+
+    capture_trajectory = staticmethod(telemetry.capture_trajectory)
+    capture_trajectory_batch = staticmethod(telemetry.capture_trajectory_batch)
+    delta_phi = staticmethod(coherence.delta_phi)
+    delta_phi_batch = staticmethod(coherence.delta_phi_batch)
+    coherence_from_dphi = staticmethod(coherence.coherence_from_dphi)
+    h7_horizon = staticmethod(coherence.h7_horizon)
+    weighted_coherence_mean = staticmethod(coherence.weighted_coherence_mean)
+    cusp_limited_h7 = staticmethod(coherence.cusp_limited_h7)
+    estimate = staticmethod(coherence.estimate)
+    estimate_batch = staticmethod(coherence.estimate_batch)
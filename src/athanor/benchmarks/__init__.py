@@ -0,0 +1,7 @@
+from .suite import BenchCase, CASES, GRIDS, QUICK_GRIDS, run_suite, measure
+from .compare import compare_results, load_results, save_results, scaling_exponents
+
+__all__ = [
+    "BenchCase", "CASES", "GRIDS", "QUICK_GRIDS", "run_suite", "measure",
+    "compare_results", "load_results", "save_results", "scaling_exponents",
+]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+import json, math, os
+from collections import defaultdict
+from typing import Any, Dict, List
+
+
+def save_results(path: str, results: Dict[str, Any]) -> None:
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if 'results' not in data:
+        raise ValueError(f"{path} is not a benchmark result file")
+    return data
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.10,
+    memory_tolerance: float = 0.25,
+) -> List[Dict[str, Any]]:
+    """Match results by key and classify each as ok / regression / improvement / new.
+
+    Time is compared on the best round (``min_s``), which is the least noisy
+    estimate; a case regresses when it is slower than ``1 + tolerance`` times
+    the baseline, or its peak memory grew by more than ``memory_tolerance``.
+    """
+    base = {r['key']: r for r in baseline.get('results', [])}
+    out = []
+    for r in current.get('results', []):
+        b = base.get(r['key'])
+        row = {'key': r['key'], 'min_s': r['min_s'], 'peak_bytes': r['peak_bytes']}
+        if b is None:
+            row.update(status='new', time_ratio=None, memory_ratio=None)
+            out.append(row)
+            continue
+        t_ratio = r['min_s'] / b['min_s'] if b['min_s'] > 0 else math.inf
+        m_ratio = r['peak_bytes'] / b['peak_bytes'] if b['peak_bytes'] > 0 else (1.0 if r['peak_bytes'] == 0 else math.inf)
+        if t_ratio > 1.0 + tolerance or m_ratio > 1.0 + memory_tolerance:
+            status = 'regression'
+        elif t_ratio < 1.0 / (1.0 + tolerance):
+            status = 'improvement'
+        else:
+            status = 'ok'
+        row.update(status=status, time_ratio=float(t_ratio), memory_ratio=float(m_ratio),
+                   baseline_min_s=b['min_s'], baseline_peak_bytes=b['peak_bytes'])
+        out.append(row)
+    return out
+
+
+def scaling_exponents(results: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Log-log slope of time against each swept parameter, others held fixed.
+
+    An exponent near 1 means linear scaling, near 2 quadratic. Slopes are
+    averaged over every setting of the remaining parameters.
+    """
+    series: Dict[tuple, List[tuple]] = defaultdict(list)
+    for r in results.get('results', []):
+        params = r['params']
+        for p, v in params.items():
+            rest = tuple(sorted((k, x) for k, x in params.items() if k != p))
+            series[(r['name'], p, rest)].append((float(v), float(r['min_s'])))
+
+    slopes: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    for (name, p, _), pts in series.items():
+        pts = [(v, t) for v, t in pts if v > 0 and t > 0]
+        if len(pts) < 2:
+            continue
+        x = [math.log(v) for v, _ in pts]
+        y = [math.log(t) for _, t in pts]
+        mx, my = sum(x) / len(x), sum(y) / len(y)
+        sxx = sum((a - mx) ** 2 for a in x)
+        if sxx == 0:
+            continue
+        slopes[name][p].append(sum((a - mx) * (b - my) for a, b in zip(x, y)) / sxx)
+    return {n: {p: float(sum(v) / len(v)) for p, v in ps.items()} for n, ps in slopes.items()}
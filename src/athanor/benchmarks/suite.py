@@ -0,0 +1,254 @@
+from __future__ import annotations
+import gc, itertools, os, platform, statistics, tempfile, time, tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+import numpy as np
+
+from ..core.coherence import delta_phi, estimate
+from ..core.telemetry import capture_trajectory
+from ..core.types import Candidate, DeltaPhiEstimate
+from ..adapters import GaussianNoiseAdapter
+from ..backends import available_backends, get_backend
+from ..evolution.archive import MapElitesArchive
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """One timed operation; ``setup(**params)`` returns the zero-argument callable to time."""
+    name: str
+    setup: Callable[..., Callable[[], Any]]
+    params: Sequence[str]
+
+
+def _trajectory(genome_dim: int, steps_per_candidate: int) -> np.ndarray:
+    genome = np.random.default_rng(0).normal(0.0, 0.5, size=(genome_dim,)).astype(np.float32)
+    return capture_trajectory(genome, steps=steps_per_candidate, seed=1).traj
+
+
+def _setup_capture(genome_dim: int, steps_per_candidate: int):
+    genome = np.random.default_rng(0).normal(0.0, 0.5, size=(genome_dim,)).astype(np.float32)
+    return lambda: capture_trajectory(genome, steps=steps_per_candidate, seed=1)
+
+
+def _setup_delta_phi(mode: str):
+    def setup(genome_dim: int, steps_per_candidate: int):
+        traj = _trajectory(genome_dim, steps_per_candidate)
+        return lambda: delta_phi(traj, mode=mode)
+    return setup
+
+
+def _setup_estimate(genome_dim: int, steps_per_candidate: int):
+    traj = _trajectory(genome_dim, steps_per_candidate)
+    return lambda: estimate(traj, threshold=0.70)
+
+
+def _setup_generation(backend: str):
+    def setup(genome_dim: int, steps_per_candidate: int, population: int):
+        kernels = get_backend(backend)
+        genomes = np.random.default_rng(0).normal(0.0, 0.5, size=(population, genome_dim)).astype(np.float32)
+        seeds = list(range(population))
+        return lambda: kernels.capture_and_estimate(genomes, seeds, steps=steps_per_candidate, threshold=0.70)
+    return setup
+
+
+def _archive_candidates(population: int) -> List[Candidate]:
+    rng = np.random.default_rng(0)
+    out = []
+    for i in range(population):
+        c = Candidate(id=f'c{i:05d}', genome=np.zeros((1,), dtype=np.float32))
+        c.dphi = DeltaPhiEstimate(dphi=np.zeros(0), coherence=np.zeros(0), h7=float(rng.uniform()), summary={})
+        c.tags['delta_norm'] = float(rng.uniform(0.0, 0.5))
+        c.score_f = float(rng.normal())
+        c.verdict = 'APPROVE'
+        out.append(c)
+    return out
+
+
+def _setup_archive_add(population: int):
+    cands = _archive_candidates(population)
+
+    def work():
+        arch = MapElitesArchive(bins=(16, 16))
+        for c in cands:
+            arch.add(c)
+        return arch
+    return work
+
+
+def _setup_archive_stats(population: int):
+    arch = MapElitesArchive(bins=(16, 16))
+    for c in _archive_candidates(population):
+        arch.add(c)
+    return arch.stats
+
+
+def _setup_propose(genome_dim: int, population: int):
+    adapter = GaussianNoiseAdapter()
+    parent = Candidate(id='p', genome=np.zeros((genome_dim,), dtype=np.float32))
+
+    def work():
+        rng = np.random.default_rng(0)
+        return [adapter.propose(parent, rng, f'c{i}') for i in range(population)]
+    return work
+
+
+def _setup_propose_batch(genome_dim: int, population: int):
+    adapter = GaussianNoiseAdapter()
+    parent = Candidate(id='p', genome=np.zeros((genome_dim,), dtype=np.float32))
+
+    def work():
+        return adapter.propose_batch(parent, np.random.default_rng(0), population, 'c')
+    return work
+
+
+def _setup_loop(genome_dim: int, steps_per_candidate: int, population: int, generations: int = 4):
+    from ..evolution.dgm_loop import run
+    from ..experiments.registry import validate_config
+
+    cfg = validate_config({
+        'seed': 7,
+        'genome_dim': genome_dim,
+        'steps_per_candidate': steps_per_candidate,
+        'population': population,
+        'generations': generations,
+        # Time the loop itself, not plot rendering.
+        'artifacts': {'mode': 'off'},
+    })
+
+    def work():
+        with tempfile.TemporaryDirectory(prefix='athanor-bench-') as tmp:
+            return run({**cfg, 'run': {'out_dir': tmp}})
+    return work
+
+
+CASES: Dict[str, BenchCase] = {c.name: c for c in (
+    BenchCase('capture_trajectory', _setup_capture, ('genome_dim', 'steps_per_candidate')),
+    BenchCase('delta_phi_l2', _setup_delta_phi('l2'), ('genome_dim', 'steps_per_candidate')),
+    BenchCase('delta_phi_cosine', _setup_delta_phi('cosine'), ('genome_dim', 'steps_per_candidate')),
+    BenchCase('estimate', _setup_estimate, ('genome_dim', 'steps_per_candidate')),
+    BenchCase('archive_add', _setup_archive_add, ('population',)),
+    BenchCase('archive_stats', _setup_archive_stats, ('population',)),
+    BenchCase('propose', _setup_propose, ('genome_dim', 'population')),
+    BenchCase('propose_batch', _setup_propose_batch, ('genome_dim', 'population')),
+    *(BenchCase(f'generation_{b}', _setup_generation(b), ('genome_dim', 'steps_per_candidate', 'population'))
+      for b in available_backends()),
+    BenchCase('dgm_loop_run', _setup_loop, ('genome_dim', 'steps_per_candidate', 'population')),
+)}
+
+# Sweep values per parameter; each case runs over the product of the ones it uses.
+GRIDS: Dict[str, Sequence[int]] = {
+    'genome_dim': (16, 64, 256),
+    'steps_per_candidate': (24, 96, 384),
+    'population': (16, 64, 256),
+}
+QUICK_GRIDS: Dict[str, Sequence[int]] = {
+    'genome_dim': (8, 32),
+    'steps_per_candidate': (12, 48),
+    'population': (4, 16),
+}
+# The full loop is orders of magnitude slower than the kernels; keep its sweep small.
+LOOP_GRIDS: Dict[str, Sequence[int]] = {
+    'genome_dim': (16, 64),
+    'steps_per_candidate': (24, 96),
+    'population': (8, 32),
+}
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5, min_time: float = 0.05) -> Dict[str, Any]:
+    """Time ``fn`` (best/median per call over ``repeat`` rounds) and record its peak traced memory.
+
+    Each round calls ``fn`` enough times to last about ``min_time`` seconds.
+    Peak memory is measured with ``tracemalloc`` on a separate call so
+    tracing overhead never leaks into the timings.
+    """
+    fn()
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        dt = time.perf_counter() - t0
+        if dt >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if dt <= 0 else max(2, min(10, int(min_time / dt) + 1))
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        per_call = []
+        for _ in range(max(int(repeat), 1)):
+            t0 = time.perf_counter()
+            for _ in range(number):
+                fn()
+            per_call.append((time.perf_counter() - t0) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'min_s': float(min(per_call)),
+        'median_s': float(statistics.median(per_call)),
+        'number': int(number),
+        'repeat': len(per_call),
+        'peak_bytes': int(peak),
+    }
+
+
+def _param_grid(case: BenchCase, grids: Dict[str, Sequence[int]]) -> Iterable[Dict[str, int]]:
+    for values in itertools.product(*(grids[p] for p in case.params)):
+        yield dict(zip(case.params, (int(v) for v in values)))
+
+
+def result_key(name: str, params: Dict[str, Any]) -> str:
+    return name + ''.join(f'[{k}={params[k]}]' for k in sorted(params))
+
+
+def run_suite(
+    cases: Optional[Sequence[str]] = None,
+    quick: bool = False,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run the selected cases over their parameter sweeps and return a JSON-ready result set."""
+    names = list(cases) if cases else list(CASES)
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        raise ValueError(f"unknown benchmark case(s): {', '.join(unknown)}")
+
+    results = []
+    for name in names:
+        case = CASES[name]
+        grids = QUICK_GRIDS if quick else (LOOP_GRIDS if name == 'dgm_loop_run' else GRIDS)
+        # One round of the full loop is already a long measurement.
+        rounds = 1 if name == 'dgm_loop_run' else repeat
+        for params in _param_grid(case, grids):
+            fn = case.setup(**params)
+            rec = {'name': name, 'params': params, 'key': result_key(name, params)}
+            rec.update(measure(fn, repeat=rounds, min_time=0.0 if name == 'dgm_loop_run' else min_time))
+            results.append(rec)
+            if progress is not None:
+                progress(rec)
+
+    return {
+        'version': 1,
+        'meta': {
+            'timestamp_utc': datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'quick': bool(quick),
+            'git_commit': os.environ.get('ATHANOR_GIT_HASH', ''),
+        },
+        'results': results,
+    }
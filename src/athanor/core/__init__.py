@@ -1,6 +1,8 @@
 from .coherence import (
     estimate,
+    estimate_batch,
     delta_phi,
+    delta_phi_batch,
     coherence_from_dphi,
     h7_horizon,
     weighted_coherence_mean,
@@ -9,18 +11,27 @@ from .coherence import (
     immunity_index,
     basin_drift,
     inject_bounded_noise,
+    robustness_ensemble,
+    robustness_summary,
+    robustness_summaries,
     boundary_excess,
     commensurability_suppression_score,
+    commensurability_suppression_scores,
+    boundary_invariant_scores,
     select_boundary_invariant,
+    top_k_boundary_invariants,
 )
-from .telemetry import capture_trajectory
-from .types import Candidate, TelemetryBatch, DeltaPhiEstimate
+from .streaming import OnlineCoherenceEstimator
+from .telemetry import TrajectoryStream, capture_trajectory, capture_trajectory_batch
+from .types import Candidate, CandidateBatch, TelemetryBatch, DeltaPhiEstimate
 
 __all__ = [
-  "estimate", "delta_phi", "coherence_from_dphi", "h7_horizon",
+  "estimate", "estimate_batch", "delta_phi", "delta_phi_batch", "coherence_from_dphi", "h7_horizon",
   "weighted_coherence_mean", "cusp_limited_h7",
   "omega_lipschitz_kappa_bound", "immunity_index", "basin_drift", "inject_bounded_noise",
-  "boundary_excess", "commensurability_suppression_score", "select_boundary_invariant",
-  "capture_trajectory",
-  "Candidate", "TelemetryBatch", "DeltaPhiEstimate",
+  "robustness_ensemble", "robustness_summary", "robustness_summaries",
+  "boundary_excess", "commensurability_suppression_score", "commensurability_suppression_scores",
+  "boundary_invariant_scores", "select_boundary_invariant", "top_k_boundary_invariants",
+  "capture_trajectory", "capture_trajectory_batch", "TrajectoryStream", "OnlineCoherenceEstimator",
+  "Candidate", "CandidateBatch", "TelemetryBatch", "DeltaPhiEstimate",
 ]
\ No newline at end of file
@@ -1,25 +1,18 @@
 from __future__ import annotations
 import numpy as np
+from .precision import compute_dtype
 from .types import DeltaPhiEstimate
 
 def delta_phi(traj: np.ndarray, mode: str = "l2") -> np.ndarray:
+    """Per-transition drift of a (steps, D) trajectory, at its accumulation precision (see ``core.precision``)."""
     if traj.ndim != 2 or traj.shape[0] < 2:
-        return np.zeros((0,), dtype=np.float32)
-
-    a = traj[:-1].astype(np.float32)
-    b = traj[1:].astype(np.float32)
-
-    if mode == "cosine":
-        na = np.linalg.norm(a, axis=1) + 1e-9
-        nb = np.linalg.norm(b, axis=1) + 1e-9
-        cos = (a * b).sum(axis=1) / (na * nb)
-        cos = np.clip(cos, -1.0, 1.0)
-        return np.arccos(cos).astype(np.float32)
-
-    return np.linalg.norm(b - a, axis=1).astype(np.float32)
+        return np.zeros((0,), dtype=compute_dtype(traj.dtype))
+    return _delta_phi_modes(traj, (mode,))[mode]
 
 def coherence_from_dphi(dphi: np.ndarray) -> np.ndarray:
-    return (1.0 / (1.0 + np.abs(dphi))).astype(np.float32)
+    C = np.abs(dphi, dtype=compute_dtype(dphi.dtype))
+    C += 1.0
+    return np.divide(1.0, C, out=C)
 
 def h7_horizon(C: np.ndarray, threshold: float = 0.70) -> float:
     if C.size == 0:
@@ -30,11 +23,13 @@ def weighted_coherence_mean(C: np.ndarray, power: float = 1.0) -> float:
     if C.size == 0:
         return 0.0
     p = max(float(power), 0.0)
-    w = np.power(np.clip(C.astype(np.float32), 0.0, 1.0), p)
-    den = float(w.sum())
+    w = np.clip(C, 0.0, 1.0, dtype=compute_dtype(C.dtype))
+    np.power(w, p, out=w)
+    # Numerator and denominator stay in w's dtype, so the quotient does not depend on NumPy's promotion rules.
+    den = w.sum()
     if den <= 1e-12:
         return float(C.mean())
-    return float((w * C).sum() / den)
+    return float((w * C).sum(dtype=w.dtype) / den)
 
 def cusp_limited_h7(C: np.ndarray, threshold: float = 0.70, survival_floor: float = 0.0) -> float:
     if C.size == 0:
@@ -54,10 +49,9 @@ def immunity_index(C: np.ndarray, C_perturbed: np.ndarray) -> float:
     if C.size == 0 or C_perturbed.size == 0:
         return 0.0
     n = min(C.size, C_perturbed.size)
-    base = C[:n].astype(np.float32)
-    pert = C_perturbed[:n].astype(np.float32)
-    num = float(np.mean(np.abs(pert - base)))
-    den = float(np.mean(np.abs(base))) + 1e-9
+    acc = compute_dtype(np.result_type(C, C_perturbed))
+    num = float(np.mean(np.abs(np.subtract(C_perturbed[:n], C[:n], dtype=acc))))
+    den = float(np.mean(np.abs(C[:n], dtype=acc))) + 1e-9
     return float(np.clip(1.0 - (num / den), 0.0, 1.0))
 
 def basin_drift(C: np.ndarray, C_perturbed: np.ndarray) -> float:
@@ -72,13 +66,69 @@ def inject_bounded_noise(
     rng: np.random.Generator | None = None,
     seed: int | None = None,
 ) -> np.ndarray:
+    acc = compute_dtype(dphi.dtype)
     if dphi.size == 0:
-        return np.zeros((0,), dtype=np.float32)
+        return np.zeros((0,), dtype=acc)
     s = max(float(sigma), 0.0)
     if rng is None:
         rng = np.random.default_rng(seed)
-    eps = rng.uniform(-s, s, size=dphi.shape).astype(np.float32)
-    return (dphi.astype(np.float32) + eps).astype(np.float32)
+    out = rng.uniform(-s, s, size=dphi.shape).astype(acc, copy=False)
+    out += dphi
+    return out
+
+# Quantiles reported for the robustness ensemble, and the summary/ledger fields they produce.
+ROBUSTNESS_QUANTILES = (0.05, 0.50, 0.95)
+ROBUSTNESS_FIELDS = ("immunity_mean", "immunity_q05", "immunity_q50", "drift_q05", "drift_q50", "drift_q95")
+
+def robustness_ensemble(
+    dphi: np.ndarray,
+    sigma: float,
+    samples: int = 128,
+    rng: np.random.Generator | None = None,
+    seed: int | None = None,
+    C: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Immunity index and basin drift of ``samples`` bounded-noise perturbations of ``dphi``.
+
+    The perturbations are drawn as one (samples, n) block and scored
+    together. Row k equals ``immunity_index`` / ``basin_drift`` of
+    ``coherence_from_dphi(inject_bounded_noise(dphi, sigma, rng))`` for the
+    k-th of ``samples`` successive draws from ``rng``. ``C`` may pass the
+    already computed unperturbed coherence.
+    """
+    d = np.asarray(dphi).ravel()
+    K = max(int(samples), 0)
+    if d.size == 0 or K == 0:
+        return np.zeros((K,), dtype=np.float64), np.zeros((K,), dtype=np.float64)
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    s = max(float(sigma), 0.0)
+    base = coherence_from_dphi(d) if C is None else np.asarray(C).ravel()
+
+    diff = rng.uniform(-s, s, size=(K, d.size)).astype(compute_dtype(d.dtype), copy=False)
+    diff += d
+    diff = coherence_from_dphi(diff)
+    diff -= base
+    drift = diff.mean(axis=1)
+    np.abs(diff, out=diff)
+    den = float(np.mean(np.abs(base, dtype=diff.dtype))) + 1e-9
+    immunity = np.clip(1.0 - diff.mean(axis=1).astype(np.float64) / den, 0.0, 1.0)
+    return immunity, drift.astype(np.float64)
+
+def robustness_summaries(immunity: np.ndarray, drift: np.ndarray) -> list[dict]:
+    """Ledger fields (``ROBUSTNESS_FIELDS``) for stacked (P, samples) ensembles, one dict per row."""
+    immunity = np.atleast_2d(immunity)
+    drift = np.atleast_2d(drift)
+    if immunity.shape[1] == 0:
+        return [{k: 0.0 for k in ROBUSTNESS_FIELDS} for _ in range(immunity.shape[0])]
+    iq = np.quantile(immunity, ROBUSTNESS_QUANTILES, axis=1)
+    dq = np.quantile(drift, ROBUSTNESS_QUANTILES, axis=1)
+    cols = np.stack([immunity.mean(axis=1), iq[0], iq[1], dq[0], dq[1], dq[2]], axis=1)
+    return [dict(zip(ROBUSTNESS_FIELDS, row)) for row in cols.tolist()]
+
+def robustness_summary(immunity: np.ndarray, drift: np.ndarray) -> dict:
+    """Ledger fields (``ROBUSTNESS_FIELDS``) for one candidate's robustness ensemble."""
+    return robustness_summaries(immunity, drift)[0]
 
 
 def boundary_excess(value: float, boundary: float) -> float:
@@ -96,50 +146,261 @@ def commensurability_suppression_score(value: float, max_denominator: int = 64)
             best = err
     return float(best)
 
+def commensurability_suppression_scores(values, max_denominator: int = 64, chunk: int = 1 << 20) -> np.ndarray:
+    """Vectorized ``commensurability_suppression_score`` over an array of values.
+
+    Instead of scanning every denominator, only the continued-fraction
+    convergents of each value with denominator <= max_denominator and the
+    final semiconvergent are scored; the best rational approximation with
+    bounded denominator is always one of them. Remainders use ``fmod`` so the
+    expansion is exact in floating point. The error for each candidate
+    denominator is computed exactly as the scalar function does, so results
+    match it; non-finite inputs score NaN.
+    """
+    v = np.asarray(values, dtype=np.float64)
+    out = np.empty(v.shape, dtype=np.float64)
+    flat_v, flat_o = v.ravel(), out.ravel()
+    m = float(max(int(max_denominator), 2))
+    for a in range(0, flat_v.size, max(int(chunk), 1)):
+        flat_o[a:a + chunk] = _suppression_chunk(flat_v[a:a + chunk], m)
+    return out
+
+def _rational_error(x: np.ndarray, q) -> np.ndarray:
+    # Same arithmetic as the scalar loop body: |v - round(v*q)/q|.
+    return np.abs(x - np.rint(x * q) / q)
+
+def _suppression_chunk(v: np.ndarray, m: float) -> np.ndarray:
+    finite = np.isfinite(v)
+    x = np.where(finite, v, 0.0)
+
+    best = _rational_error(x, 1.0)
+    frac = x - np.floor(x)
+    q_prev = np.zeros_like(x)
+    q = np.ones_like(x)
+    num = np.ones_like(x)
+    den = frac
+    active = frac != 0.0
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        _expand_convergents(x, m, best, q_prev, q, num, den, active)
+    best[~finite] = np.nan
+    return best
+
+def _expand_convergents(x, m, best, q_prev, q, num, den, active) -> None:
+    while active.any():
+        idx = np.flatnonzero(active)
+        n_i, d_i = num[idx], den[idx]
+        rem = np.fmod(n_i, d_i)
+        a = np.rint((n_i - rem) / d_i)
+        q_new = a * q[idx] + q_prev[idx]
+        over = q_new > m
+
+        # Convergent still within the bound: score it and keep expanding.
+        ok = idx[~over]
+        q_prev[ok], q[ok] = q[ok], q_new[~over]
+        best[ok] = np.minimum(best[ok], _rational_error(x[ok], q[ok]))
+        num[ok], den[ok] = d_i[~over], rem[~over]
+        active[ok] = rem[~over] != 0.0
+
+        # Bound exceeded: the last candidate is the semiconvergent q_prev + k*q.
+        hit = idx[over]
+        if hit.size:
+            k = np.floor((m - q_prev[hit]) / q[hit])
+            semi = q_prev[hit] + k * q[hit]
+            e = np.where(k >= 1, _rational_error(x[hit], np.maximum(semi, 1.0)), np.inf)
+            best[hit] = np.minimum(best[hit], e)
+            active[hit] = False
+
+def _degree_target(deg: int) -> float:
+    # degree priors: canonical representatives for minimal collapse classes
+    phi = (1.0 + np.sqrt(5.0)) / 2.0
+    plastic = 1.3247179572447458
+    return {1: 1.0, 2: phi, 3: plastic}.get(deg, phi)
+
+def boundary_invariant_scores(candidates, degree: int = 2, suppression_weight: float = 1.0) -> np.ndarray:
+    """Selector score (degree-prior proximity + weighted suppression) for every candidate."""
+    x = np.asarray(candidates, dtype=np.float64).ravel()
+    target = _degree_target(max(int(degree), 1))
+    sw = max(float(suppression_weight), 0.0)
+    return -np.abs(x - target) + (sw * commensurability_suppression_scores(x))
+
 def select_boundary_invariant(
     candidates: list[float],
     degree: int = 2,
     suppression_weight: float = 1.0,
 ) -> dict:
     """H44-style selector: choose extremal candidate by degree prior + suppression."""
-    if not candidates:
+    x = np.asarray(candidates, dtype=np.float64).ravel()
+    if x.size == 0:
         return {"selected": None, "score": 0.0, "degree": int(degree)}
 
     deg = max(int(degree), 1)
-    sw = max(float(suppression_weight), 0.0)
+    target = _degree_target(deg)
 
-    # degree priors: canonical representatives for minimal collapse classes
-    phi = (1.0 + np.sqrt(5.0)) / 2.0
-    plastic = 1.3247179572447458
-    target = {1: 1.0, 2: phi, 3: plastic}.get(deg, phi)
-
-    best_val = None
-    best_score = -1e18
-    for x in candidates:
-        xv = float(x)
-        prox = -abs(xv - target)
-        sup = commensurability_suppression_score(xv)
-        score = prox + (sw * sup)
-        if score > best_score:
-            best_score = score
-            best_val = xv
-
-    return {"selected": best_val, "score": float(best_score), "degree": deg, "target": float(target)}
-
-def estimate(traj: np.ndarray, threshold: float = 0.70, mode: str = "l2") -> DeltaPhiEstimate:
-    d = delta_phi(traj, mode=mode)
-    C = coherence_from_dphi(d)
-    h7 = h7_horizon(C, threshold=threshold)
-    summary = {
-        "threshold": float(threshold),
-        "mode": str(mode),
-        "dphi_mean": float(d.mean()) if d.size else 0.0,
-        "dphi_std": float(d.std()) if d.size else 0.0,
-        "C_mean": float(C.mean()) if C.size else 0.0,
-        "C_std": float(C.std()) if C.size else 0.0,
-        "h7": float(h7),
-        "h7_weighted": float(weighted_coherence_mean(C, power=1.0)),
-        "h7_cusp": float(cusp_limited_h7(C, threshold=threshold, survival_floor=0.50)),
-        "kappa_bound": float(omega_lipschitz_kappa_bound(C.mean() if C.size else 0.0)),
+    scores = boundary_invariant_scores(x, degree=deg, suppression_weight=suppression_weight)
+    scores = np.where(np.isnan(scores), -np.inf, scores)
+    k = int(np.argmax(scores))
+    if not scores[k] > -1e18:
+        return {"selected": None, "score": -1e18, "degree": deg, "target": float(target)}
+
+    return {"selected": float(x[k]), "score": float(scores[k]), "degree": deg, "target": float(target)}
+
+def top_k_boundary_invariants(
+    candidates,
+    k: int = 10,
+    degree: int = 2,
+    suppression_weight: float = 1.0,
+    chunk: int = 1 << 20,
+) -> dict:
+    """Best ``k`` candidates by the H44 selector score, highest first (ties keep input order).
+
+    Candidates are scored chunk by chunk and only a running top-k is kept, so
+    memory stays bounded for very large candidate sets.
+    """
+    x = np.asarray(candidates, dtype=np.float64).ravel()
+    deg = max(int(degree), 1)
+    k = max(int(k), 0)
+    step = max(int(chunk), 1)
+    keep_s = np.zeros((0,), dtype=np.float64)
+    keep_i = np.zeros((0,), dtype=np.int64)
+    for a in range(0, x.size, step):
+        s = boundary_invariant_scores(x[a:a + step], degree=deg, suppression_weight=suppression_weight)
+        s = np.where(np.isnan(s), -np.inf, s)
+        keep_s = np.concatenate([keep_s, s])
+        keep_i = np.concatenate([keep_i, np.arange(a, a + s.size, dtype=np.int64)])
+        if keep_s.size > k:
+            part = np.argpartition(-keep_s, k - 1)[:k] if k else np.zeros((0,), dtype=np.int64)
+            # argpartition is not stable; admit every score tied with the k-th so order can be fixed below.
+            if k:
+                kth = keep_s[part].min()
+                part = np.flatnonzero(keep_s >= kth)
+            keep_s, keep_i = keep_s[part], keep_i[part]
+    order = np.lexsort((keep_i, -keep_s))[:k]
+    keep_s, keep_i = keep_s[order], keep_i[order]
+    return {
+        "selected": x[keep_i].tolist(),
+        "scores": keep_s.tolist(),
+        "indices": keep_i.tolist(),
+        "degree": deg,
+        "target": float(_degree_target(deg)),
     }
-    return DeltaPhiEstimate(dphi=d, coherence=C, h7=h7, summary=summary)
+
+def _estimate_modes(modes, mode: str) -> tuple:
+    return (str(mode),) if modes is None else tuple(dict.fromkeys(str(m) for m in modes))
+
+def estimate(traj: np.ndarray, threshold: float = 0.70, mode: str = "l2", modes=None):
+    """ΔΦ/C summary of one (steps, D) trajectory.
+
+    With ``modes`` (e.g. ``('l2', 'cosine')``) every listed mode is estimated
+    from one pass over the frames and a ``{mode: DeltaPhiEstimate}`` dict is
+    returned; otherwise the single ``mode`` estimate.
+    """
+    want = _estimate_modes(modes, mode)
+    if traj.ndim == 2 and traj.shape[0] >= 2:
+        ds = _delta_phi_modes(traj, want)
+    else:
+        ds = {m: np.zeros((0,), dtype=compute_dtype(traj.dtype)) for m in want}
+    out = {m: _summarize(d[None], coherence_from_dphi(d)[None], threshold, m)[0] for m, d in ds.items()}
+    return out if modes is not None else out[want[0]]
+
+def delta_phi_batch(traj: np.ndarray, mode: str = "l2") -> np.ndarray:
+    """Row-wise ``delta_phi`` over a (P, steps, D) tensor; returns (P, steps-1)."""
+    acc = compute_dtype(traj.dtype)
+    if traj.ndim != 3 or traj.shape[1] < 2:
+        return np.zeros((traj.shape[0] if traj.ndim else 0, 0), dtype=acc)
+    return _delta_phi_modes(traj, (mode,))[mode]
+
+def _delta_phi_modes(traj: np.ndarray, modes) -> dict:
+    """ΔΦ along the step axis (-2) for each of ``modes``; any mode other than ``cosine`` is l2.
+
+    Single and batched trajectories share this code and its per-row
+    reductions, so a batch row equals the single-trajectory ΔΦ bit for bit.
+
+    Frame norms are computed once and shared by the two transitions each
+    frame bounds. l2 keeps the direct difference: rebuilding it from the
+    norms (|a|² + |b|² - 2a·b) cancels badly for the small steps typical here.
+    """
+    acc = compute_dtype(traj.dtype)
+    out = {}
+    if "cosine" in modes:
+        x = traj.astype(acc, copy=False)
+        n = np.linalg.norm(x, axis=-1) + acc.type(1e-9)
+        cos = (x[..., :-1, :] * x[..., 1:, :]).sum(axis=-1) / (n[..., :-1] * n[..., 1:])
+        np.clip(cos, -1.0, 1.0, out=cos)
+        out["cosine"] = np.arccos(cos, out=cos)
+    if any(m != "cosine" for m in modes):
+        l2 = np.linalg.norm(np.subtract(traj[..., 1:, :], traj[..., :-1, :], dtype=acc), axis=-1)
+        out.update({m: l2 for m in modes if m != "cosine"})
+    return {m: out[m] for m in modes}
+
+def estimate_batch(traj: np.ndarray, threshold: float = 0.70, mode: str = "l2", modes=None):
+    """Vectorized ``estimate`` over a (P, steps, D) tensor, one result per row.
+
+    With ``modes``, returns ``{mode: [DeltaPhiEstimate, ...]}`` from one pass over the frames.
+    """
+    want = _estimate_modes(modes, mode)
+    if traj.ndim == 3 and traj.shape[1] >= 2:
+        ds = _delta_phi_modes(traj, want)
+    else:
+        ds = {m: delta_phi_batch(traj, mode=m) for m in want}
+    out = {m: _summarize(d, coherence_from_dphi(d), threshold, m) for m, d in ds.items()}
+    return out if modes is not None else out[want[0]]
+
+def _summarize(d: np.ndarray, C: np.ndarray, threshold: float, mode: str) -> list[DeltaPhiEstimate]:
+    """Every summary field for (P, n) ΔΦ/C rows, with each reduction done once.
+
+    Sums give the means, which are reused for the deviations and κ; one
+    scratch buffer holds the centered squares and then C². Since C lies in
+    (0, 1] the weighting clip is the identity, so the weighted mean is
+    Σ C² / Σ C. The cusp count equals the hit count (threshold >= floor) or
+    the kept count (threshold < floor), so no filtered copy is built. Results
+    equal ``h7_horizon``, ``weighted_coherence_mean``, ``cusp_limited_h7``
+    and NumPy's mean/std exactly.
+    """
+    P, n = d.shape
+    thr = float(threshold)
+
+    if n:
+        count = C.dtype.type(n)
+        scratch = np.empty_like(C)
+
+        def moments(x):
+            total = x.sum(axis=1)
+            mean = total / count
+            np.subtract(x, mean[:, None], out=scratch)
+            np.multiply(scratch, scratch, out=scratch)
+            var = scratch.sum(axis=1)
+            var /= count
+            return total, mean, np.sqrt(var, out=var)
+
+        _, d_mean, d_std = moments(d)
+        C_sum, C_mean, C_std = moments(C)
+        num = np.multiply(C, C, out=scratch).sum(axis=1)
+        h7_w = np.where(C_sum <= 1e-12, C_mean, num / np.maximum(C_sum, C.dtype.type(1e-12)))
+
+        mask = np.greater_equal(C, thr, out=np.empty(C.shape, dtype=bool))
+        hits = np.count_nonzero(mask, axis=1)
+        n_kept = np.count_nonzero(np.greater_equal(C, 0.50, out=mask), axis=1)
+        n_cusp = hits if C.dtype.type(thr) >= C.dtype.type(0.50) else n_kept
+        h7 = hits / n
+        h7_c = np.where(n_kept > 0, n_cusp / np.maximum(n_kept, 1), 0.0)
+    else:
+        h7 = d_mean = d_std = C_mean = C_std = h7_w = h7_c = np.zeros((P,), dtype=d.dtype)
+
+    kappa = np.clip(C_mean, 0.0, 1.0).astype(np.float64) ** 2
+
+    out = []
+    for k in range(P):
+        summary = {
+            "threshold": thr,
+            "mode": str(mode),
+            "dphi_mean": float(d_mean[k]),
+            "dphi_std": float(d_std[k]),
+            "C_mean": float(C_mean[k]),
+            "C_std": float(C_std[k]),
+            "h7": float(h7[k]),
+            "h7_weighted": float(h7_w[k]),
+            "h7_cusp": float(h7_c[k]),
+            "kappa_bound": float(kappa[k]),
+        }
+        out.append(DeltaPhiEstimate(dphi=d[k], coherence=C[k], h7=float(h7[k]), summary=summary))
+    return out
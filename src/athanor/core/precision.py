@@ -0,0 +1,23 @@
+from __future__ import annotations
+from typing import Dict, Tuple
+import numpy as np
+
+# precision -> (storage dtype, accumulation dtype). Trajectories are stored in
+# the first; recurrences, ΔΦ, C and their summaries are computed in the second.
+PRECISIONS: Dict[str, Tuple[np.dtype, np.dtype]] = {
+    "float16": (np.dtype(np.float16), np.dtype(np.float32)),
+    "float32": (np.dtype(np.float32), np.dtype(np.float32)),
+    "float64": (np.dtype(np.float64), np.dtype(np.float64)),
+}
+
+
+def precision_dtypes(precision: str = "float32") -> Tuple[np.dtype, np.dtype]:
+    try:
+        return PRECISIONS[str(precision)]
+    except KeyError:
+        raise ValueError(f"precision must be one of {sorted(PRECISIONS)}, got {precision!r}") from None
+
+
+def compute_dtype(dtype) -> np.dtype:
+    """Accumulation dtype for data stored as ``dtype``: float64 stays float64, everything else is float32."""
+    return np.dtype(np.float64) if np.dtype(dtype) == np.float64 else np.dtype(np.float32)
@@ -0,0 +1,228 @@
+from __future__ import annotations
+from collections import deque
+from typing import Any, Dict, Optional
+import numpy as np
+
+from .coherence import delta_phi, coherence_from_dphi, omega_lipschitz_kappa_bound
+from .precision import precision_dtypes
+from .types import DeltaPhiEstimate
+
+
+class _Moments:
+    """Welford running mean / second moment with support for removals."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        d = x - self.mean
+        self.mean += d / self.n
+        self.m2 += d * (x - self.mean)
+
+    def merge(self, xs: np.ndarray) -> None:
+        """Fold a whole block in at once (Chan et al. parallel combination)."""
+        nb = int(xs.size)
+        if nb == 0:
+            return
+        xs = xs.astype(np.float64)
+        mb = float(xs.mean())
+        m2b = float(((xs - mb) ** 2).sum())
+        n = self.n + nb
+        d = mb - self.mean
+        self.mean += d * nb / n
+        self.m2 += m2b + d * d * self.n * nb / n
+        self.n = n
+
+    def remove(self, x: float) -> None:
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        mean_old = self.mean
+        self.n -= 1
+        self.mean = (mean_old * (self.n + 1) - x) / self.n
+        self.m2 = max(self.m2 - (x - mean_old) * (x - self.mean), 0.0)
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / self.n)) if self.n else 0.0
+
+
+class OnlineCoherenceEstimator:
+    """Incremental counterpart of ``estimate`` for telemetry that arrives as a stream.
+
+    Frames are fed one at a time or in (k, D) chunks; only the previous frame
+    is kept (O(D) state) and every summary statistic is maintained with
+    running updates. Per-transition ΔΦ and C are computed with the same
+    ``delta_phi``/``coherence_from_dphi`` kernels as the batch path, so counts
+    (h7, h7_cusp) agree exactly and moments agree to float rounding.
+
+    With ``window`` set, only the most recent ``window`` transitions
+    contribute; their values are retained so expired ones can be removed.
+    ``precision`` names the run precision (see ``core.precision``); ΔΦ and
+    C are kept in its accumulation dtype, as ``estimate`` does for
+    trajectories stored at that precision.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.70,
+        mode: str = "l2",
+        window: Optional[int] = None,
+        survival_floor: float = 0.50,
+        keep_series: bool = False,
+        precision: str = "float32",
+    ):
+        if window is not None and int(window) < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.threshold = float(threshold)
+        self.dtype = precision_dtypes(precision)[1]
+        # Compare C against thresholds rounded to its dtype, exactly like the batch path does.
+        self._thr = float(self.dtype.type(self.threshold))
+        self.mode = str(mode)
+        self.window = int(window) if window is not None else None
+        self.survival_floor = float(np.clip(survival_floor, 0.0, 1.0))
+        self._floor = float(self.dtype.type(self.survival_floor))
+        self.keep_series = bool(keep_series)
+        self.reset()
+
+    def reset(self) -> None:
+        self._prev: Optional[np.ndarray] = None
+        self._d = _Moments()
+        self._c = _Moments()
+        self.hits = 0
+        self._kept = 0
+        self._kept_hits = 0
+        self._w_sum = 0.0
+        self._wc_sum = 0.0
+        self._since_refresh = 0
+        self._series: Optional[deque] = None
+        if self.window is not None:
+            self._series = deque(maxlen=self.window)
+        elif self.keep_series:
+            self._series = deque()
+
+    @property
+    def n(self) -> int:
+        """Number of transitions currently contributing to the summary."""
+        return self._c.n
+
+    @property
+    def h7(self) -> float:
+        return float(self.hits / self.n) if self.n else 0.0
+
+    def update(self, frames: np.ndarray) -> "OnlineCoherenceEstimator":
+        frames = np.asarray(frames)
+        if frames.ndim == 1:
+            frames = frames[None, :]
+        if frames.shape[0] == 0:
+            return self
+        if self._prev is None:
+            block = frames
+        else:
+            block = np.concatenate([self._prev[None, :], frames], axis=0)
+        self._prev = np.array(frames[-1], copy=True)
+        if block.shape[0] < 2:
+            return self
+        d = delta_phi(block, mode=self.mode)
+        self.update_dphi(d)
+        return self
+
+    def update_dphi(self, dphi: np.ndarray) -> "OnlineCoherenceEstimator":
+        """Feed per-transition ΔΦ values directly (no frames needed)."""
+        d = np.asarray(dphi, dtype=self.dtype).ravel()
+        C = coherence_from_dphi(d)
+        if self.window is None:
+            self._add_block(d, C)
+            if self._series is not None:
+                self._series.extend(zip(d.tolist(), C.tolist()))
+            return self
+        for dv, cv in zip(d.tolist(), C.tolist()):
+            if len(self._series) == self.window:
+                self._remove(*self._series[0])
+            self._add(dv, cv)
+            self._series.append((dv, cv))
+        return self
+
+    def _add_block(self, d: np.ndarray, C: np.ndarray) -> None:
+        self._d.merge(d)
+        self._c.merge(C)
+        hit = C >= self._thr
+        kept = C >= self._floor
+        self.hits += int(hit.sum())
+        self._kept += int(kept.sum())
+        self._kept_hits += int((hit & kept).sum())
+        w = np.clip(C, 0.0, 1.0).astype(np.float64)
+        self._w_sum += float(w.sum())
+        self._wc_sum += float(w @ C.astype(np.float64))
+
+    def _add(self, dv: float, cv: float) -> None:
+        self._d.add(dv)
+        self._c.add(cv)
+        hit = cv >= self._thr
+        self.hits += hit
+        if cv >= self._floor:
+            self._kept += 1
+            self._kept_hits += hit
+        w = min(max(cv, 0.0), 1.0)
+        self._w_sum += w
+        self._wc_sum += w * cv
+
+    def _remove(self, dv: float, cv: float) -> None:
+        self._d.remove(dv)
+        self._c.remove(cv)
+        hit = cv >= self._thr
+        self.hits -= hit
+        if cv >= self._floor:
+            self._kept -= 1
+            self._kept_hits -= hit
+        w = min(max(cv, 0.0), 1.0)
+        self._w_sum -= w
+        self._wc_sum -= w * cv
+        # Subtractive updates drift slowly; rebuild from the window once per cycle
+        # (the entry being removed is still the oldest one in the window).
+        self._since_refresh += 1
+        if self._since_refresh >= self.window:
+            self._refresh()
+
+    def _refresh(self) -> None:
+        series = list(self._series)[1:]
+        self._d, self._c = _Moments(), _Moments()
+        self.hits = self._kept = self._kept_hits = 0
+        self._w_sum = self._wc_sum = 0.0
+        self._since_refresh = 0
+        for dv, cv in series:
+            self._add(dv, cv)
+
+    def summary(self) -> Dict[str, Any]:
+        n = self.n
+        C_mean = self._c.mean if n else 0.0
+        if n and self._w_sum > 1e-12:
+            h7_w = self._wc_sum / self._w_sum
+        else:
+            h7_w = C_mean
+        return {
+            "threshold": float(self.threshold),
+            "mode": str(self.mode),
+            "dphi_mean": float(self._d.mean) if n else 0.0,
+            "dphi_std": self._d.std,
+            "C_mean": float(C_mean),
+            "C_std": self._c.std,
+            "h7": self.h7,
+            "h7_weighted": float(h7_w),
+            "h7_cusp": float(self._kept_hits / self._kept) if self._kept else 0.0,
+            "kappa_bound": float(omega_lipschitz_kappa_bound(C_mean)),
+        }
+
+    def result(self) -> DeltaPhiEstimate:
+        """Current summary as a ``DeltaPhiEstimate``; series cover the window (or all, with keep_series)."""
+        if self._series:
+            arr = np.asarray(self._series, dtype=self.dtype)
+            d, C = arr[:, 0], arr[:, 1]
+        else:
+            d = C = np.zeros((0,), dtype=self.dtype)
+        return DeltaPhiEstimate(dphi=d, coherence=C, h7=self.h7, summary=self.summary())
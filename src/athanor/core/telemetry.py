@@ -1,17 +1,152 @@
 from __future__ import annotations
 import numpy as np
+from .precision import precision_dtypes
 from .types import TelemetryBatch
 
-def capture_trajectory(genome: np.ndarray, steps: int = 24, noise: float = 0.02, seed: int = 0) -> TelemetryBatch:
+# The symbolic transition matrix is A = I + 0.05 * tanh(genome) broadcast over
+# rows, i.e. A = I + 1 w^T with w = 0.05 * tanh(genome). A @ s therefore equals
+# s + (w . s) on every coordinate, so each step is O(D) and A is never built.
+
+def transition_weights(genome: np.ndarray, dtype=np.float32) -> np.ndarray:
+    return (0.05 * np.tanh(np.asarray(genome, dtype=dtype).ravel())).astype(dtype, copy=False)
+
+def capture_trajectory(genome: np.ndarray, steps: int = 24, noise: float = 0.02, seed: int = 0,
+                       precision: str = "float32") -> TelemetryBatch:
+    store, acc = precision_dtypes(precision)
     rng = np.random.default_rng(int(seed))
+    T = int(steps)
     D = int(genome.size)
-    A = np.eye(D, dtype=np.float32) + 0.05 * np.tanh(genome.astype(np.float32))
-    x = np.zeros((int(steps), D), dtype=np.float32)
-    s = rng.normal(0.0, 0.1, size=(D,)).astype(np.float32)
+    w = transition_weights(genome, dtype=acc)
+    x = np.zeros((T, D), dtype=store)
+    s = rng.normal(0.0, 0.1, size=(D,)).astype(acc, copy=False)
+    # One draw for the whole noise block consumes the stream exactly like the
+    # per-step draws did, so trajectories stay tied to the seed.
+    eps = rng.normal(0.0, float(noise), size=(max(T - 1, 0), D)).astype(acc, copy=False)
+
+    if T:
+        x[0] = s
+    same = store == acc
+    for t in range(1, T):
+        # The state is carried at accumulation precision; frames are rounded to storage precision.
+        out = x[t] if same else np.empty_like(s)
+        np.add(s, acc.type(w @ s), out=out)
+        out += eps[t - 1]
+        if not same:
+            x[t] = out
+        s = out
+
+    meta = {"steps": T, "noise": float(noise), "D": int(D)}
+    return TelemetryBatch(traj=x, meta=meta)
+
+def draw_noise(seeds, D: int, steps: int, noise: float, dtype=np.float32):
+    """Initial states (P, D) and step noise (P, steps-1, D), row k drawn from ``default_rng(seeds[k])``."""
+    T = int(steps)
+    s0 = np.empty((len(seeds), D), dtype=dtype)
+    eps = np.empty((len(seeds), max(T - 1, 0), D), dtype=dtype)
+    for k, sd in enumerate(seeds):
+        rng = np.random.default_rng(int(sd))
+        s0[k] = rng.normal(0.0, 0.1, size=(D,))
+        eps[k] = rng.normal(0.0, float(noise), size=(max(T - 1, 0), D))
+    return s0, eps
+
+def capture_trajectory_batch(
+    genomes: np.ndarray,
+    seeds,
+    steps: int = 24,
+    noise: float = 0.02,
+    precision: str = "float32",
+) -> TelemetryBatch:
+    """Capture one trajectory per genome row; traj has shape (P, steps, D).
+
+    Row k uses the same RNG stream as ``capture_trajectory(genomes[k], seed=seeds[k])``.
+    ``precision`` picks the storage and accumulation dtypes (see ``core.precision``).
+    """
+    store, acc = precision_dtypes(precision)
+    G = np.asarray(genomes, dtype=acc)
+    if G.ndim == 1:
+        G = G[None, :]
+    P, D = int(G.shape[0]), int(G.shape[1])
+    seeds = [int(s) for s in seeds]
+    if len(seeds) != P:
+        raise ValueError(f"expected {P} seeds, got {len(seeds)}")
+    T = int(steps)
+
+    w = (0.05 * np.tanh(G)).astype(acc, copy=False)
+    x = np.zeros((P, T, D), dtype=store)
+    s, eps = draw_noise(seeds, D, T, noise, dtype=acc)
+
+    if T:
+        x[:, 0] = s
+    same = store == acc
+    for t in range(1, T):
+        out = x[:, t] if same else np.empty_like(s)
+        np.add(s, np.einsum('pd,pd->p', w, s)[:, None], out=out)
+        out += eps[:, t - 1]
+        if not same:
+            x[:, t] = out
+        s = out
+
+    meta = {"steps": T, "noise": float(noise), "D": D, "P": P, "seeds": seeds}
+    return TelemetryBatch(traj=x, meta=meta)
+
+class TrajectoryStream:
+    """Chunked, resumable counterpart of ``capture_trajectory_batch``.
+
+    Frames are produced on demand with ``advance``, only for the rows still
+    of interest; noise is drawn per chunk from each row's own generator, which
+    consumes the stream exactly like the single block draw, so every frame
+    equals the one ``capture_trajectory_batch`` would produce. Rows left out
+    of an ``advance`` call are abandoned (they are never advanced again).
+    """
+
+    def __init__(self, genomes: np.ndarray, seeds, steps: int = 24, noise: float = 0.02,
+                 precision: str = "float32"):
+        self.dtype, self.acc = precision_dtypes(precision)
+        G = np.asarray(genomes, dtype=self.acc)
+        if G.ndim == 1:
+            G = G[None, :]
+        self.P, self.D = int(G.shape[0]), int(G.shape[1])
+        self.seeds = [int(s) for s in seeds]
+        if len(self.seeds) != self.P:
+            raise ValueError(f"expected {self.P} seeds, got {len(self.seeds)}")
+        self.steps = int(steps)
+        self.noise = float(noise)
+        self.w = (0.05 * np.tanh(G)).astype(self.acc, copy=False)
+        self.rngs = [np.random.default_rng(sd) for sd in self.seeds]
+        self.state = np.empty((self.P, self.D), dtype=self.acc)
+        for k, rng in enumerate(self.rngs):
+            self.state[k] = rng.normal(0.0, 0.1, size=(self.D,))
+        self.t = 1 if self.steps else 0
+
+    @property
+    def remaining(self) -> int:
+        return self.steps - self.t
+
+    def initial(self) -> np.ndarray:
+        """Frame 0 for every row, shape (P, D)."""
+        return self.state.astype(self.dtype)
 
-    for t in range(int(steps)):
-        x[t] = s
-        s = (A @ s) + rng.normal(0.0, float(noise), size=(D,)).astype(np.float32)
+    def advance(self, k: int, rows=None) -> np.ndarray:
+        """Next ``min(k, remaining)`` frames for ``rows`` (default all); shape (len(rows), k, D)."""
+        rows = np.arange(self.P) if rows is None else np.asarray(rows, dtype=np.intp)
+        k = max(min(int(k), self.remaining), 0)
+        out = np.empty((rows.size, k, self.D), dtype=self.dtype)
+        if k == 0:
+            return out
+        eps = np.empty((rows.size, k, self.D), dtype=self.acc)
+        for j, r in enumerate(rows.tolist()):
+            eps[j] = self.rngs[r].normal(0.0, self.noise, size=(k, self.D))
 
-    meta = {"steps": int(steps), "noise": float(noise), "D": int(D)}
-    return TelemetryBatch(traj=x, meta=meta)
\ No newline at end of file
+        w = self.w[rows]
+        s = self.state[rows]
+        same = self.dtype == self.acc
+        for t in range(k):
+            nxt = out[:, t] if same else np.empty_like(s)
+            np.add(s, np.einsum('pd,pd->p', w, s)[:, None], out=nxt)
+            nxt += eps[:, t]
+            if not same:
+                out[:, t] = nxt
+            s = nxt
+        self.state[rows] = s
+        self.t += k
+        return out
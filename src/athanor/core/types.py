@@ -3,19 +3,28 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 import numpy as np
 
-@dataclass
+# What a Candidate keeps once its verdict is known:
+#   full    - everything (trajectory, per-step ΔΦ/C arrays, summary)
+#   summary - h7 + summary only; trajectory and per-step arrays are dropped
+#   none    - no estimate at all (applied once the ledger row is written)
+RETENTION_POLICIES = ("none", "summary", "full")
+
+_EMPTY = np.zeros((0,), dtype=np.float32)
+_EMPTY.setflags(write=False)
+
+@dataclass(slots=True)
 class DeltaPhiEstimate:
     dphi: np.ndarray
     coherence: np.ndarray
     h7: float
     summary: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryBatch:
     traj: np.ndarray
     meta: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     id: str
     genome: np.ndarray
@@ -25,4 +34,35 @@ class Candidate:
     score_f: float = 0.0
     verdict: str = "PENDING"
     reason: str = ""
-    tags: Dict[str, Any] = field(default_factory=dict)
\ No newline at end of file
+    tags: Dict[str, Any] = field(default_factory=dict)
+
+    def release(self, retention: str = "summary") -> "Candidate":
+        """Drop per-step payloads according to a ``RETENTION_POLICIES`` entry."""
+        if retention == "full":
+            return self
+        if retention not in RETENTION_POLICIES:
+            raise ValueError(f"retention must be one of {RETENTION_POLICIES}, got {retention!r}")
+        self.telemetry = None
+        if retention == "none":
+            self.dphi = None
+        elif self.dphi is not None and (self.dphi.dphi.size or self.dphi.coherence.size):
+            self.dphi = DeltaPhiEstimate(dphi=_EMPTY, coherence=_EMPTY, h7=self.dphi.h7, summary=self.dphi.summary)
+        return self
+
+class CandidateBatch(list):
+    """A list of candidates whose genomes are, in order, the rows of ``genomes``.
+
+    Vectorized proposers return one so batched kernels can use the genome
+    block directly; slicing or copying gives a plain list.
+    """
+
+    def __init__(self, candidates=(), genomes: Optional[np.ndarray] = None):
+        super().__init__(candidates)
+        self.genomes = genomes
+
+def stack_genomes(candidates) -> np.ndarray:
+    """(n, D) float32 genome matrix of ``candidates``; a ``CandidateBatch`` hands back its block uncopied."""
+    block = getattr(candidates, "genomes", None)
+    if block is not None and len(block) == len(candidates):
+        return block
+    return np.stack([c.genome for c in candidates]).astype(np.float32, copy=False)
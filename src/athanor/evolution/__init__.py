@@ -1,3 +1,5 @@
-from .archive import MapElitesArchive
+from .archive import (MapElitesArchive, DenseMapElitesArchive, load_archive, save_archive, tree_merge,
+                      union_archives)
 
-__all__ = ["MapElitesArchive"]
+__all__ = ["MapElitesArchive", "DenseMapElitesArchive", "load_archive", "save_archive", "tree_merge",
+           "union_archives"]
@@ -1,7 +1,9 @@
 from __future__ import annotations
+import os
+from functools import partial
 import numpy as np
 from dataclasses import dataclass
-from typing import Dict, Tuple, Any
+from typing import Dict, Iterable, List, Tuple, Any
 
 @dataclass
 class ArchiveCell:
@@ -37,6 +39,61 @@ class MapElitesArchive:
             return True
         return False
 
+    def add_candidates(self, cands) -> np.ndarray:
+        """``add`` for each candidate in order; returns the admitted mask."""
+        return np.asarray([self.add(c) for c in cands], dtype=bool)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Plain-array snapshot (no pickle) that ``from_arrays`` restores exactly."""
+        cells = list(self.cells.items())
+        return {
+            "kind": np.array("map"),
+            "bins": np.asarray(self.bins, dtype=np.int64),
+            "keys": np.asarray([k for k, _ in cells], dtype=np.int64).reshape(-1, 2),
+            "best_id": np.asarray([c.best_id for _, c in cells], dtype=str),
+            "best_f": np.asarray([c.best_f for _, c in cells], dtype=np.float64),
+            "h7": np.asarray([c.meta.get("h7", 0.0) for _, c in cells], dtype=np.float64),
+            "delta_norm": np.asarray([c.meta.get("delta_norm", 0.0) for _, c in cells], dtype=np.float64),
+            "verdict": np.asarray([c.meta.get("verdict", "") for _, c in cells], dtype=str),
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "MapElitesArchive":
+        arch = cls(bins=tuple(int(b) for b in arrays["bins"]))
+        for k, cid, f, h7, dn, v in zip(arrays["keys"].tolist(), arrays["best_id"].tolist(),
+                                         arrays["best_f"].tolist(), arrays["h7"].tolist(),
+                                         arrays["delta_norm"].tolist(), arrays["verdict"].tolist()):
+            arch.cells[(int(k[0]), int(k[1]))] = ArchiveCell(
+                best_id=str(cid), best_f=float(f),
+                meta={"h7": float(h7), "delta_norm": float(dn), "verdict": str(v)},
+            )
+        return arch
+
+    def merge(self, other: "MapElitesArchive") -> "MapElitesArchive":
+        """Fold ``other`` into this archive in place, keeping the better elite per cell.
+
+        Higher ``best_f`` wins; equal fitness goes to the smaller ``best_id``,
+        so merging is commutative and associative and any reduction order
+        gives the same archive. Returns ``self``.
+        """
+        if tuple(other.bins) != self.bins:
+            raise ValueError(f"cannot merge archives with bins {self.bins} and {tuple(other.bins)}")
+        for key, cell in other.cells.items():
+            cur = self.cells.get(key)
+            if cur is None or _beats(cell.best_f, cell.best_id, cur.best_f, cur.best_id):
+                self.cells[key] = ArchiveCell(best_id=cell.best_id, best_f=cell.best_f, meta=dict(cell.meta))
+        return self
+
+    def shard(self, n: int, axis: int = 0) -> List["MapElitesArchive"]:
+        """Split into ``n`` archives covering contiguous bin ranges of descriptor ``axis``."""
+        bounds = shard_bounds(self.bins[axis], n)
+        shards = [type(self)(bins=self.bins) for _ in bounds]
+        starts = [lo for lo, _ in bounds]
+        for key, cell in self.cells.items():
+            k = int(np.searchsorted(starts, key[axis], side="right")) - 1
+            shards[k].cells[key] = ArchiveCell(best_id=cell.best_id, best_f=cell.best_f, meta=dict(cell.meta))
+        return shards
+
     def stats(self) -> Dict[str, Any]:
         if not self.cells:
             return {"filled": 0, "mean_best_f": 0.0, "max_best_f": 0.0}
@@ -45,4 +102,345 @@ class MapElitesArchive:
             "filled": int(len(self.cells)),
             "mean_best_f": float(fs.mean()),
             "max_best_f": float(fs.max()),
-        }
\ No newline at end of file
+        }
+
+VERDICT_CODES = ("PENDING", "APPROVE", "REFINE", "REJECT")
+
+def _beats(f: float, cid: str, cur_f: float, cur_id: str) -> bool:
+    return f > cur_f or (f == cur_f and cid < cur_id)
+
+def shard_bounds(nbins: int, n: int) -> List[Tuple[int, int]]:
+    """``n`` contiguous, near-equal ``[lo, hi)`` bin ranges covering ``range(nbins)``."""
+    n = int(n)
+    if not 1 <= n <= int(nbins):
+        raise ValueError(f"shard count must be in [1, {nbins}], got {n}")
+    edges = np.linspace(0, int(nbins), n + 1).round().astype(int).tolist()
+    return list(zip(edges[:-1], edges[1:]))
+
+def default_descriptor(cand) -> Tuple[float, float]:
+    h7 = float(cand.dphi.h7) if cand.dphi else 0.0
+    dn = float(cand.tags.get("delta_norm", 0.0))
+    return (h7, dn)
+
+# Candidate features usable as descriptor axes, in axis order; all lie in [0, 1]
+# (delta_norm is clipped by the binning like in ``MapElitesArchive``).
+DESCRIPTOR_FEATURES = ("h7", "delta_norm", "h7_cusp", "h7_weighted", "C_mean")
+
+def feature_descriptor(cand, ndim: int = 2) -> Tuple[float, ...]:
+    """The first ``ndim`` ``DESCRIPTOR_FEATURES`` of ``cand``; ``ndim=2`` is ``default_descriptor``."""
+    summary = cand.dphi.summary if cand.dphi else {}
+    extra = tuple(float(summary.get(name, 0.0)) for name in DESCRIPTOR_FEATURES[2:ndim])
+    return default_descriptor(cand)[:ndim] + extra
+
+class DenseMapElitesArchive:
+    """MAP-Elites archive stored as flat NumPy grids instead of per-cell objects.
+
+    Supports any number of descriptor dimensions; each dimension is binned
+    uniformly over ``ranges[k]`` (default [0, 1], which reproduces
+    ``MapElitesArchive.descriptor``). Without ``descriptor_fn``, candidates
+    are placed by the first ``len(bins)`` ``DESCRIPTOR_FEATURES``. Per cell it keeps ``best_f``, a filled
+    mask, an integer id, the verdict code and one float32 grid per metadata
+    column. filled / mean / max / QD-score are maintained incrementally, so
+    ``stats()`` is O(1). About 26 bytes per cell with the default columns.
+    """
+
+    def __init__(
+        self,
+        bins=(16, 16),
+        ranges=None,
+        meta_columns=("h7", "delta_norm"),
+        descriptor_fn=None,
+    ):
+        self.bins = tuple(int(x) for x in bins)
+        if not self.bins or any(b < 1 for b in self.bins):
+            raise ValueError("bins entries must be >= 1")
+        if ranges is None:
+            ranges = [(0.0, 1.0)] * len(self.bins)
+        self.ranges = np.asarray(ranges, dtype=np.float64).reshape(len(self.bins), 2)
+        if descriptor_fn is None:
+            descriptor_fn = default_descriptor if len(self.bins) == 2 else partial(feature_descriptor, ndim=len(self.bins))
+        self.descriptor_fn = descriptor_fn
+
+        size = int(np.prod(self.bins))
+        self.best_f = np.full(size, -np.inf, dtype=np.float64)
+        self.filled = np.zeros(size, dtype=bool)
+        self.best_id = np.full(size, -1, dtype=np.int64)
+        self.verdict = np.zeros(size, dtype=np.uint8)
+        self.meta = {str(name): np.zeros(size, dtype=np.float32) for name in meta_columns}
+
+        self._filled = 0
+        self._sum_f = 0.0
+        self._max_f = -np.inf
+        self._next_id = 0
+        self._labels: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self._filled
+
+    def grid(self, name: str = "best_f") -> np.ndarray:
+        """A column reshaped to the bin grid (a view, no copy)."""
+        col = self.meta[name] if name in self.meta else getattr(self, name)
+        return col.reshape(self.bins)
+
+    def cells(self, descriptors) -> np.ndarray:
+        """Flat cell index for each row of an (n, ndim) descriptor array."""
+        d = np.asarray(descriptors, dtype=np.float64).reshape(-1, len(self.bins))
+        lo, hi = self.ranges[:, 0], self.ranges[:, 1]
+        span = np.where(hi > lo, hi - lo, 1.0)
+        b = np.asarray(self.bins, dtype=np.float64)
+        scaled = np.nan_to_num((d - lo) / span * b, nan=0.0)
+        idx = np.clip(scaled, 0, b - 1).astype(np.int64)
+        return np.ravel_multi_index(tuple(idx.T), self.bins)
+
+    def add_batch(self, descriptors, fitness, ids=None, verdicts=None, meta=None) -> np.ndarray:
+        """Insert n candidates at once; returns a boolean admitted mask.
+
+        Candidates landing in the same cell are resolved by argmax of fitness
+        (earliest wins ties) before comparing against the incumbent, so only
+        the in-batch winner of a cell can be admitted. Non-finite fitness is
+        never admitted.
+        """
+        f = np.asarray(fitness, dtype=np.float64).ravel()
+        n = f.size
+        admitted = np.zeros(n, dtype=bool)
+        if n == 0:
+            return admitted
+        flat = self.cells(descriptors)
+        if ids is None:
+            ids = np.arange(self._next_id, self._next_id + n, dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        self._next_id = max(self._next_id, int(ids.max()) + 1)
+
+        fkey = np.where(np.isnan(f), -np.inf, f)
+        order = np.lexsort((np.arange(n), -fkey, flat))
+        head = np.ones(n, dtype=bool)
+        head[1:] = flat[order][1:] != flat[order][:-1]
+        win = order[head]
+        cell = flat[win]
+        fw = fkey[win]
+
+        was = self.filled[cell]
+        better = np.isfinite(fw) & (~was | (fw > self.best_f[cell]))
+        win, cell, fw, was = win[better], cell[better], fw[better], was[better]
+        if win.size == 0:
+            return admitted
+
+        old = np.where(was, self.best_f[cell], 0.0)
+        self._filled += int((~was).sum())
+        self._sum_f += float((fw - old).sum())
+        self._max_f = max(self._max_f, float(fw.max()))
+
+        if self._labels:
+            for prev in self.best_id[cell[was]].tolist():
+                self._labels.pop(prev, None)
+        self.best_f[cell] = fw
+        self.filled[cell] = True
+        self.best_id[cell] = ids[win]
+        if verdicts is not None:
+            codes = np.asarray([VERDICT_CODES.index(str(v)) if str(v) in VERDICT_CODES else 0
+                                for v in np.asarray(verdicts, dtype=object).ravel()], dtype=np.uint8)
+            self.verdict[cell] = codes[win]
+        for name, col in (meta or {}).items():
+            if name in self.meta:
+                self.meta[name][cell] = np.asarray(col, dtype=np.float32).ravel()[win]
+
+        admitted[win] = True
+        return admitted
+
+    def add(self, cand) -> bool:
+        return bool(self.add_candidates([cand])[0])
+
+    def add_candidates(self, cands) -> np.ndarray:
+        """Insert candidates with one ``add_batch`` call; returns the admitted mask.
+
+        Within the batch only each cell's winner can be admitted (see
+        ``add_batch``); the resulting grid equals adding them one at a time.
+        """
+        cands = list(cands)
+        if not cands:
+            return np.zeros(0, dtype=bool)
+        desc = np.asarray([self.descriptor_fn(c) for c in cands], dtype=np.float64)
+        ids = np.arange(self._next_id, self._next_id + len(cands), dtype=np.int64)
+        meta = {"h7": [float(c.dphi.h7) if c.dphi else 0.0 for c in cands],
+                "delta_norm": [float(c.tags.get("delta_norm", 0.0)) for c in cands]}
+        ok = self.add_batch(desc, [float(c.score_f) for c in cands], ids=ids,
+                            verdicts=[str(c.verdict) for c in cands], meta=meta)
+        for k in np.flatnonzero(ok).tolist():
+            self._labels[int(ids[k])] = str(cands[k].id)
+        return ok
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Plain-array snapshot (no pickle) that ``from_arrays`` restores exactly."""
+        out = {
+            "kind": np.array("dense"),
+            "bins": np.asarray(self.bins, dtype=np.int64),
+            "ranges": self.ranges.copy(),
+            "best_f": self.best_f.copy(),
+            "filled": self.filled.copy(),
+            "best_id": self.best_id.copy(),
+            "verdict": self.verdict.copy(),
+            "meta_names": np.asarray(list(self.meta), dtype=str),
+            "counters": np.asarray([self._filled, self._next_id], dtype=np.int64),
+            "sums": np.asarray([self._sum_f, self._max_f], dtype=np.float64),
+            "label_ids": np.asarray(list(self._labels), dtype=np.int64),
+            "label_strs": np.asarray(list(self._labels.values()), dtype=str),
+        }
+        for name, col in self.meta.items():
+            out[f"meta_{name}"] = col.copy()
+        return out
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "DenseMapElitesArchive":
+        names = [str(n) for n in arrays["meta_names"].tolist()]
+        arch = cls(bins=tuple(int(b) for b in arrays["bins"]), ranges=arrays["ranges"], meta_columns=names)
+        arch.best_f[:] = arrays["best_f"]
+        arch.filled[:] = arrays["filled"]
+        arch.best_id[:] = arrays["best_id"]
+        arch.verdict[:] = arrays["verdict"]
+        for name in names:
+            arch.meta[name][:] = arrays[f"meta_{name}"]
+        arch._filled, arch._next_id = (int(x) for x in arrays["counters"])
+        arch._sum_f, arch._max_f = (float(x) for x in arrays["sums"])
+        arch._labels = dict(zip((int(i) for i in arrays["label_ids"]), (str(x) for x in arrays["label_strs"])))
+        return arch
+
+    def _check_compatible(self, other: "DenseMapElitesArchive") -> None:
+        if tuple(other.bins) != self.bins or not np.array_equal(other.ranges, self.ranges):
+            raise ValueError("cannot merge dense archives with different bins or ranges")
+        if list(other.meta) != list(self.meta):
+            raise ValueError("cannot merge dense archives with different meta columns")
+
+    def _cell_labels(self, cells: np.ndarray) -> np.ndarray:
+        return np.asarray([self._labels.get(int(i), "") for i in self.best_id[cells].tolist()], dtype=object)
+
+    def merge(self, other: "DenseMapElitesArchive") -> "DenseMapElitesArchive":
+        """Fold ``other`` into this archive in place, keeping the better elite per cell.
+
+        Same rule as ``MapElitesArchive.merge`` (higher fitness, then smaller
+        string id), applied to whole grids at once. Incoming elites get fresh
+        integer ids in this archive; their string labels carry over.
+        """
+        self._check_compatible(other)
+        both = other.filled & self.filled
+        take = other.filled & (~self.filled | (other.best_f > self.best_f))
+        tie = np.flatnonzero(both & (other.best_f == self.best_f))
+        if tie.size:
+            take[tie] = other._cell_labels(tie) < self._cell_labels(tie)
+        cells = np.flatnonzero(take)
+        if cells.size == 0:
+            return self
+
+        was = self.filled[cells]
+        fw = other.best_f[cells]
+        old = np.where(was, self.best_f[cells], 0.0)
+        self._filled += int((~was).sum())
+        self._sum_f += float((fw - old).sum())
+        self._max_f = max(self._max_f, float(fw.max()))
+
+        labels = other._cell_labels(cells)
+        for prev in self.best_id[cells[was]].tolist():
+            self._labels.pop(prev, None)
+        new_ids = np.arange(self._next_id, self._next_id + cells.size, dtype=np.int64)
+        self._next_id += int(cells.size)
+        for i, label in zip(new_ids.tolist(), labels.tolist()):
+            if label:
+                self._labels[i] = label
+        self.best_f[cells] = fw
+        self.filled[cells] = True
+        self.best_id[cells] = new_ids
+        self.verdict[cells] = other.verdict[cells]
+        for name, col in self.meta.items():
+            col[cells] = other.meta[name][cells]
+        return self
+
+    def shard(self, n: int, axis: int = 0) -> List["DenseMapElitesArchive"]:
+        """Split into ``n`` archives covering contiguous bin ranges of descriptor ``axis``."""
+        axis_bin = np.unravel_index(np.arange(self.best_f.size), self.bins)[axis]
+        shards = []
+        for lo, hi in shard_bounds(self.bins[axis], n):
+            keep = self.filled & (axis_bin >= lo) & (axis_bin < hi)
+            part = type(self)(bins=self.bins, ranges=self.ranges, meta_columns=tuple(self.meta),
+                              descriptor_fn=self.descriptor_fn)
+            part.filled[:] = keep
+            part.best_f[keep] = self.best_f[keep]
+            part.best_id[keep] = self.best_id[keep]
+            part.verdict[keep] = self.verdict[keep]
+            for name, col in self.meta.items():
+                part.meta[name][keep] = col[keep]
+            f = part.best_f[keep]
+            part._filled = int(keep.sum())
+            part._sum_f = float(f.sum())
+            part._max_f = float(f.max()) if f.size else -np.inf
+            part._next_id = self._next_id
+            part._labels = {i: self._labels[i] for i in self.best_id[keep].tolist() if i in self._labels}
+            shards.append(part)
+        return shards
+
+    def label(self, cell_id: int) -> str:
+        """String id recorded by ``add`` for an integer id (empty if unknown)."""
+        return self._labels.get(int(cell_id), "")
+
+    def stats(self) -> Dict[str, Any]:
+        if not self._filled:
+            return {"filled": 0, "mean_best_f": 0.0, "max_best_f": 0.0, "qd_score": 0.0}
+        return {
+            "filled": int(self._filled),
+            "mean_best_f": float(self._sum_f / self._filled),
+            "max_best_f": float(self._max_f),
+            "qd_score": float(self._sum_f),
+        }
+
+
+def archive_from_arrays(arrays: Dict[str, np.ndarray]):
+    """Rebuild whichever archive class produced ``arrays`` via ``to_arrays``."""
+    kind = str(arrays["kind"])
+    if kind == "dense":
+        return DenseMapElitesArchive.from_arrays(arrays)
+    return MapElitesArchive.from_arrays(arrays)
+
+
+def copy_archive(archive):
+    return archive_from_arrays(archive.to_arrays())
+
+def tree_merge(archives: Iterable, executor=None):
+    """Merge archives by pairwise rounds (a balanced tree); inputs are not modified.
+
+    Because ``merge`` is associative and commutative the result equals any
+    sequential fold. With a ``concurrent.futures`` ``executor`` the pairs of
+    each round are merged in parallel (archives travel as ``to_arrays`` dicts).
+    """
+    level = [a.to_arrays() for a in archives]
+    if not level:
+        raise ValueError("tree_merge needs at least one archive")
+    while len(level) > 1:
+        pairs = [(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if executor is None:
+            merged = [_merge_arrays(a, b) for a, b in pairs]
+        else:
+            merged = list(executor.map(_merge_arrays, *zip(*pairs)))
+        level = merged + ([level[-1]] if len(level) % 2 else [])
+    return archive_from_arrays(level[0])
+
+def _merge_arrays(a: Dict[str, np.ndarray], b: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    return archive_from_arrays(a).merge(archive_from_arrays(b)).to_arrays()
+
+def save_archive(path: str, archive) -> None:
+    """Write ``archive.to_arrays()`` as a compressed, pickle-free ``.npz`` (atomically)."""
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        np.savez_compressed(f, **archive.to_arrays())
+    os.replace(tmp, path)
+
+def load_archive(path: str):
+    with np.load(path, allow_pickle=False) as z:
+        return archive_from_arrays({k: z[k] for k in z.files})
+
+def union_archives(paths: Iterable[str]):
+    """Best-per-cell union of saved archives, holding one input in memory at a time."""
+    out = None
+    for path in paths:
+        arch = load_archive(path)
+        out = arch if out is None else out.merge(arch)
+    if out is None:
+        raise ValueError("union_archives needs at least one archive path")
+    return out
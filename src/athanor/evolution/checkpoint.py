@@ -0,0 +1,84 @@
+from __future__ import annotations
+import json, os, threading, time
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+
+CHECKPOINT_FILE = 'checkpoint.npz'
+
+def save_checkpoint(path: str, state: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> None:
+    """Write ``state`` (JSON-serializable) and named arrays to one .npz, atomically.
+
+    The file is written next to ``path`` and moved into place with
+    ``os.replace`` after an fsync, so a crash leaves either the previous
+    checkpoint or the new one, never a torn file. No pickle is involved.
+    """
+    tmp = path + '.tmp'
+    payload = {f'a_{k}': np.asarray(v) for k, v in arrays.items()}
+    payload['state_json'] = np.array(json.dumps(state))
+    with open(tmp, 'wb') as f:
+        np.savez(f, **payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def load_checkpoint(path: str) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    with np.load(path, allow_pickle=False) as z:
+        state = json.loads(str(z['state_json']))
+        arrays = {k[2:]: z[k] for k in z.files if k.startswith('a_')}
+    return state, arrays
+
+
+class Checkpointer:
+    """Decides when a checkpoint is due and writes it off the critical path.
+
+    A checkpoint is due every ``every`` generations and/or once ``seconds``
+    have elapsed since the last one (either trigger disabled at 0). The loop
+    hands over an already-copied snapshot; with ``background`` the write runs
+    on a worker thread and at most one write is in flight, so a slow disk
+    delays the next checkpoint rather than every generation.
+    """
+
+    def __init__(self, run_path: str, every: int = 0, seconds: float = 0.0, background: bool = True):
+        self.path = os.path.join(run_path, CHECKPOINT_FILE)
+        self.every = max(int(every), 0)
+        self.seconds = max(float(seconds), 0.0)
+        self.background = bool(background)
+        self.written = 0
+        self._last = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.every or self.seconds)
+
+    def due(self, generations_done: int) -> bool:
+        if self.every and generations_done % self.every == 0:
+            return True
+        return bool(self.seconds) and (time.monotonic() - self._last) >= self.seconds
+
+    def save(self, state: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> None:
+        self.wait()
+        self._last = time.monotonic()
+        if not self.background:
+            save_checkpoint(self.path, state, arrays)
+            self.written += 1
+            return
+
+        def work():
+            try:
+                save_checkpoint(self.path, state, arrays)
+                self.written += 1
+            except BaseException as exc:
+                self._error = exc
+
+        self._thread = threading.Thread(target=work, name='athanor-checkpoint', daemon=True)
+        self._thread.start()
+
+    def wait(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            exc, self._error = self._error, None
+            raise exc
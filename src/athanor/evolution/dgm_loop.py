@@ -1,12 +1,21 @@
 from __future__ import annotations
 import os, json, pickle, hashlib, logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 
 from ..core.types import Candidate
-from ..agents import TelemetryAgent, ProposerAgent, VerifierAgent, SelectorAgent, ArchivistAgent
-from ..utils.visualization import plot_h7, plot_fitness, render_dashboard
+from ..agents import (TelemetryAgent, ProposerAgent, VerifierAgent, SelectorAgent, ArchivistAgent,
+                      EvaluationCache, evaluation_key)
+from .archive import archive_from_arrays, save_archive
+from .checkpoint import CHECKPOINT_FILE, Checkpointer, load_checkpoint
+from ..backends import get_backend
+from ..core.coherence import ROBUSTNESS_FIELDS
+from ..utils.logging import LedgerWriter
+from ..utils.columnar import COLUMNAR_DIR, ColumnarLedgerWriter, ledger_columns
+from ..utils.profiling import NULL_PROFILER, make_profiler
+from ..utils.artifacts import launch_artifacts
 
 log = logging.getLogger(__name__)
 
@@ -17,122 +26,440 @@ def sha256_json(obj: Any) -> str:
     s = json.dumps(obj, sort_keys=True, separators=(',',':')).encode('utf-8')
     return hashlib.sha256(s).hexdigest()
 
-def run(config: Dict[str, Any]) -> Dict[str, Any]:
+def new_run_path(out_dir: str, cfg_hash: str) -> str:
+    """Create and return a fresh ``run_<timestamp>_<hash8>`` folder.
+
+    The config-hash suffix keeps concurrent runs of different configs apart;
+    a numeric suffix separates identical configs started in the same second.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.join(out_dir, f'run_{now_tag()}_{cfg_hash[:8]}')
+    run_path, n = base, 0
+    while True:
+        try:
+            os.mkdir(run_path)
+            return run_path
+        except FileExistsError:
+            n += 1
+            run_path = f'{base}-{n}'
+
+def build_agents(config: Dict[str, Any]) -> Dict[str, Any]:
+    seed = int(config.get('seed', 1337))
+    verify = dict(config.get('verify', {}) or {})
+    robust = dict(verify.get('robustness', {}) or {})
+    cache = dict(config.get('cache', {}) or {})
+    backend = get_backend(str(config.get('backend', 'numpy')))
+    return {
+        'telemetry': TelemetryAgent(steps=int(config.get('steps_per_candidate', 24)), noise=0.02, seed=seed,
+                                    backend=backend, precision=str(config.get('precision', 'float32'))),
+        'proposer':  ProposerAgent(sigma=0.12, step_cap=0.50),
+        'verifier':  VerifierAgent(threshold_h7=float(config.get('threshold_h7', 0.70)),
+                                   dphi_mode=str(config.get('dphi_mode', 'l2')), refine_floor=0.50,
+                                   early_exit=bool(verify.get('early_exit', False)),
+                                   chunk=int(verify.get('chunk', 8)), backend=backend,
+                                   robust_samples=int(robust.get('samples', 0)),
+                                   robust_sigma=float(robust.get('sigma', 0.05)),
+                                   robust_floor=robust.get('floor'), robust_seed=seed),
+        'selector':  SelectorAgent(alpha=float(config.get('alpha', 0.70))),
+        'cache':     EvaluationCache(max_bytes=int(cache.get('max_bytes', 64 << 20)), directory=cache.get('dir'))
+                     if cache.get('enabled', False) else None,
+    }
+
+def retry_rng(seed: int, g: int, i: int, attempt: int) -> np.random.Generator:
+    """Independent proposal stream for one REFINE retry, so retries do not depend on evaluation order."""
+    return np.random.default_rng([int(seed), int(g), int(i), int(attempt)])
+
+def evaluation_path(telemetry, verifier, batched: bool = True) -> str:
+    if getattr(verifier, 'early_exit', False) and hasattr(telemetry, 'stream'):
+        return 'stream'
+    if batched and hasattr(telemetry, 'step_batch') and hasattr(verifier, 'step_batch'):
+        backend = getattr(verifier, 'backend', None)
+        if getattr(backend, 'fused', False) and getattr(telemetry, 'backend', None) is backend:
+            return 'fused'
+        return 'batch'
+    return 'serial'
+
+def evaluate(telemetry, verifier, children, seeds, profiler=NULL_PROFILER, cache=None, batched: bool = True):
+    """Capture telemetry and verify a whole generation, batched when the agents allow it."""
+    path = evaluation_path(telemetry, verifier, batched)
+    if cache is not None:
+        return _evaluate_cached(telemetry, verifier, children, seeds, profiler, cache, path)
+
+    if path == 'stream':
+        # Telemetry and verification are interleaved; both are timed as 'verify'.
+        with profiler.span('verify'):
+            return verifier.step_stream(children, telemetry.stream(children, seeds))
+
+    if path == 'fused':
+        # One kernel captures and verifies; timed as 'verify'.
+        with profiler.span('verify'):
+            return verifier.step_fused(children, telemetry, seeds)
+
+    if path == 'batch':
+        with profiler.span('telemetry'):
+            batch = telemetry.step_batch(children, seeds)
+        with profiler.span('verify'):
+            return verifier.step_batch(children, batch=batch)
+
+    out = []
+    for child, sd in zip(children, seeds):
+        telemetry.seed = int(sd)
+        with profiler.span('telemetry'):
+            child = telemetry.step(child)
+        with profiler.span('verify'):
+            out.append(verifier.step(child))
+    return out
+
+def _evaluate_cached(telemetry, verifier, children, seeds, profiler, cache, path: str):
+    keys = [evaluation_key(c.genome, sd, telemetry, verifier, path) for c, sd in zip(children, seeds)]
+    miss = []
+    with profiler.span('cache'):
+        for k, (child, key) in enumerate(zip(children, keys)):
+            est = cache.get(key)
+            if est is None:
+                miss.append(k)
+            else:
+                verifier.judge(child, est)
+    if miss:
+        done = evaluate(telemetry, verifier, [children[k] for k in miss], [seeds[k] for k in miss],
+                        profiler, batched=(path != 'serial'))
+        children = list(children)
+        for k, child in zip(miss, done):
+            children[k] = child
+            if child.dphi is not None:
+                cache.put(keys[k], child.dphi)
+    return children
+
+def refine_sigma(sigma0: float, attempt: int) -> float:
+    return float(sigma0) * (0.75 ** int(attempt))
+
+def refine(agents, parent, children, indices, g: int, seed: int, refine_attempts: int,
+           profiler=NULL_PROFILER, keep: str = 'full'):
+    """REFINE retries for a whole generation, one batched propose/evaluate round per attempt.
+
+    Every child still in REFINE is re-proposed from ``parent`` with its own
+    retry stream and ``sigma0 * 0.75**attempt`` passed per call, then all of
+    them are evaluated together. The proposer is never mutated, so the
+    result does not depend on how children are grouped across workers.
+    """
+    proposer, telemetry, verifier = agents['proposer'], agents['telemetry'], agents['verifier']
+    children = list(children)
+    pending = [k for k, c in enumerate(children) if c.verdict == 'REFINE']
+    for attempt in range(1, refine_attempts + 1):
+        if not pending:
+            break
+        sigma = refine_sigma(proposer.sigma, attempt)
+        retries = [proposer.step(parent, rng=retry_rng(seed, g, indices[k], attempt),
+                                 child_id=f'g{g:03d}_c{indices[k]:03d}_r{attempt}', sigma=sigma)
+                   for k in pending]
+        seeds = [seed + (g * 10000) + indices[k] + attempt for k in pending]
+        retries = evaluate(telemetry, verifier, retries, seeds, profiler, agents.get('cache'))
+        for k, child in zip(pending, retries):
+            child.release(keep)
+            child.tags['refine_attempts'] = attempt
+            children[k] = child
+        pending = [k for k in pending if children[k].verdict == 'REFINE']
+    return children
+
+def evaluate_children(agents, parent, children, indices, g: int, seed: int, refine_attempts: int,
+                      profiler=NULL_PROFILER, retention: str = 'full'):
+    """Telemetry, verification and REFINE retries for the children at the given population indices.
+
+    Unless ``retention`` is 'full', trajectories and per-step arrays are
+    released as soon as each verdict is known (the summary is still needed
+    for selection and the ledger).
+    """
+    keep = 'full' if retention == 'full' else 'summary'
+    seeds = [seed + (g * 10000) + i for i in indices]
+    children = evaluate(agents['telemetry'], agents['verifier'], children, seeds, profiler, agents.get('cache'))
+    for c in children:
+        c.release(keep)
+    with profiler.span('refine'):
+        return refine(agents, parent, children, indices, g, seed, refine_attempts, profiler, keep)
+
+def ledger_row(g: int, i: int, child, admitted: bool) -> Dict[str, Any]:
+    est = child.dphi
+    row = {
+        'gen': g,
+        'idx': i,
+        'id': child.id,
+        'verdict': child.verdict,
+        'reason': child.reason,
+        'h7': float(est.h7) if est else 0.0,
+        'h7_weighted': float(est.summary.get('h7_weighted', 0.0)) if est else 0.0,
+        'h7_cusp': float(est.summary.get('h7_cusp', 0.0)) if est else 0.0,
+        'kappa_bound': float(est.summary.get('kappa_bound', 0.0)) if est else 0.0,
+        'q': float(child.score_q),
+        'f': float(child.score_f),
+        'admitted': bool(admitted),
+        'dphi_mean': float(est.summary.get('dphi_mean', 0.0)) if est else 0.0,
+        'C_mean': float(est.summary.get('C_mean', 0.0)) if est else 0.0,
+        'delta_norm': float(child.tags.get('delta_norm', 0.0)),
+    }
+    # Optional stages add their fields only when they ran (see ``ledger_columns``).
+    if est and 'steps_simulated' in est.summary:
+        row['steps_simulated'] = int(est.summary['steps_simulated'])
+    if est and 'immunity_q05' in est.summary:
+        row.update({k: float(est.summary[k]) for k in ROBUSTNESS_FIELDS})
+    return row
+
+def advance(selector, archivist, parent, children, g: int,
+            profiler=NULL_PROFILER, retention: str = 'full'):
+    """Select, archive and tabulate one evaluated generation.
+
+    Returns the next parent (the best child, if it was approved) and the
+    generation's ledger rows in population order.
+    """
+    with profiler.span('select'):
+        if hasattr(selector, 'step_batch'):
+            children = selector.step_batch(children)
+        else:
+            children = [selector.step(c) for c in children]
+
+    with profiler.span('archive'):
+        if hasattr(archivist, 'step_batch'):
+            admitted = archivist.step_batch(children)
+        else:
+            admitted = [archivist.step(c) for c in children]
+
+    best = None
+    rows = []
+    for i, (child, ok) in enumerate(zip(children, admitted)):
+        rows.append(ledger_row(g, i, child, ok))
+        if retention == 'none':
+            child.release('none')
+        if (best is None) or (child.score_f > best.score_f):
+            best = child
+
+    if best is not None and best.verdict == 'APPROVE':
+        parent = best
+    return parent, rows
+
+_WORKER: Dict[str, Any] = {}
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    _WORKER['agents'] = build_agents(config)
+    _WORKER['seed'] = int(config.get('seed', 1337))
+    _WORKER['refine_attempts'] = int(config.get('refine_attempts', 2))
+    _WORKER['retention'] = str(config.get('retention', 'summary'))
+
+def _evaluate_chunk(parent, children, indices, g: int):
+    cache = _WORKER['agents'].get('cache')
+    before = cache.stats() if cache is not None else {}
+    out = evaluate_children(_WORKER['agents'], parent, children, indices, g,
+                            _WORKER['seed'], _WORKER['refine_attempts'], retention=_WORKER['retention'])
+    # Trajectories are not needed past verification; keep them out of the IPC payload.
+    for c in out:
+        c.telemetry = None
+    counters = {}
+    if cache is not None:
+        after = cache.stats()
+        counters = {k: after[k] - before[k] for k in ('hits', 'disk_hits', 'misses')}
+    return out, counters
+
+def _chunks(n: int, k: int):
+    step = -(-n // max(k, 1))
+    return [list(range(a, min(a + step, n))) for a in range(0, n, step)]
+
+def _checkpoint_arrays(parent, archive) -> Dict[str, np.ndarray]:
+    arrays = {'parent_genome': np.array(parent.genome, copy=True)}
+    arrays.update({f'archive_{k}': v for k, v in archive.to_arrays().items()})
+    return arrays
+
+def resume(run_path: str) -> Dict[str, Any]:
+    """Continue a run from its last checkpoint; the result matches an uninterrupted run."""
+    with open(os.path.join(run_path, 'config.json'), 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    return run(config, resume_from=run_path)
+
+def run(config: Dict[str, Any], resume_from: Optional[str] = None) -> Dict[str, Any]:
+    if int(dict(config.get('islands', {}) or {}).get('count', 1)) > 1:
+        if resume_from is not None:
+            raise ValueError("island runs cannot be resumed from a checkpoint")
+        from .islands import run_islands
+        return run_islands(config)
+
     seed = int(config.get('seed', 1337))
-    rng  = np.random.default_rng(seed)
 
-    threshold = float(config.get('threshold_h7', 0.70))
-    alpha     = float(config.get('alpha', 0.70))
-    steps     = int(config.get('steps_per_candidate', 24))
     pop       = int(config.get('population', 16))
     gens      = int(config.get('generations', 24))
     refine_attempts = int(config.get('refine_attempts', 2))
-    dphi_mode = str(config.get('dphi_mode', 'l2'))
+    workers   = max(int(config.get('workers', 1)), 1)
+    retention = str(config.get('retention', 'summary'))
 
     bins = tuple(config.get('archive', {}).get('bins', [16,16]))
     out_dir = str(config.get('run', {}).get('out_dir', 'data/archives'))
 
-    telemetry = TelemetryAgent(steps=steps, noise=0.02, seed=seed)
-    proposer  = ProposerAgent(sigma=0.12, step_cap=0.50)
-    verifier  = VerifierAgent(threshold_h7=threshold, dphi_mode=dphi_mode, refine_floor=0.50)
-    selector  = SelectorAgent(alpha=alpha)
-    archivist = ArchivistAgent(bins=bins)
-
-    D = int(config.get('genome_dim', 64))
-    parent = Candidate(id='parent_0000', genome=rng.normal(0.0, 0.5, size=(D,)).astype(np.float32))
+    agents    = build_agents(config)
+    proposer  = agents['proposer']
+    selector  = agents['selector']
+    archivist = ArchivistAgent(bins=bins, kind=str(config.get('archive', {}).get('kind', 'map')))
 
-    verdict_counts = { 'APPROVE': 0, 'REFINE': 0, 'REJECT': 0 }
-    h7_trace = []
-    f_trace  = []
+    cfg_hash = sha256_json(config)
+    if resume_from is None:
+        run_path = new_run_path(out_dir, cfg_hash)
+        with open(os.path.join(run_path, 'config.json'), 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2, sort_keys=True)
+        ckpt = None
+    else:
+        run_path = str(resume_from)
+        ckpt = load_checkpoint(os.path.join(run_path, CHECKPOINT_FILE))
 
-    run_tag  = f'run_{now_tag()}'
-    run_path = os.path.join(out_dir, run_tag)
-    os.makedirs(run_path, exist_ok=True)
+    if ckpt is None:
+        rng = np.random.default_rng(seed)
+        D = int(config.get('genome_dim', 64))
+        parent = Candidate(id='parent_0000', genome=rng.normal(0.0, 0.5, size=(D,)).astype(np.float32))
+        g_start = 0
+        verdict_counts = { 'APPROVE': 0, 'REFINE': 0, 'REJECT': 0 }
+        h7_sum = f_sum = 0.0
+        n_scored = 0
+    else:
+        state, arrays = ckpt
+        rng = np.random.default_rng()
+        rng.bit_generator.state = state['rng']
+        parent = Candidate(id=str(state['parent']['id']), genome=arrays['parent_genome'])
+        parent.score_f = float(state['parent']['score_f'])
+        proposer.sigma = float(state['sigma'])
+        g_start = int(state['generation'])
+        verdict_counts = dict(state['verdict_counts'])
+        h7_sum, f_sum, n_scored = float(state['h7_sum']), float(state['f_sum']), int(state['n_scored'])
+        archivist.archive = archive_from_arrays({k[len('archive_'):]: v for k, v in arrays.items()
+                                                 if k.startswith('archive_')})
 
     ledger_path = os.path.join(run_path, 'ledger.jsonl')
 
-    def ledger(row: Dict[str, Any]):
-        with open(ledger_path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(row) + '\n')
+    ledger_cfg = dict(config.get('ledger', {}) or {})
+    ledger_format = str(ledger_cfg.get('format', 'jsonl'))
+    jsonl = columnar = None
+    if ledger_format in ('jsonl', 'both'):
+        if ckpt is not None and os.path.exists(ledger_path):
+            # Rows past the checkpoint are regenerated identically below.
+            os.truncate(ledger_path, int(ckpt[0]['ledger_bytes']))
+        jsonl = LedgerWriter(
+            ledger_path,
+            flush_rows=int(ledger_cfg.get('flush_rows', 1024)),
+            flush_bytes=int(ledger_cfg.get('flush_bytes', 1 << 20)),
+            background=bool(ledger_cfg.get('background', False)),
+            fsync=bool(ledger_cfg.get('fsync', True)),
+        )
+    if ledger_format in ('columnar', 'both'):
+        columnar = ColumnarLedgerWriter(os.path.join(run_path, COLUMNAR_DIR), ledger_columns(config),
+                                        fsync=bool(ledger_cfg.get('fsync', True)),
+                                        rows=None if ckpt is None else int(ckpt[0]['ledger_rows']))
+    ledgers = [w for w in (jsonl, columnar) if w is not None]
 
-    for g in range(gens):
-        best = None
+    ckpt_cfg = dict(config.get('checkpoint', {}) or {})
+    checkpointer = Checkpointer(run_path, every=int(ckpt_cfg.get('every', 0)),
+                                seconds=float(ckpt_cfg.get('seconds', 0.0)),
+                                background=bool(ckpt_cfg.get('background', True)))
 
-        for i in range(pop):
-            cid = f'g{g:03d}_c{i:03d}'
-            child = proposer.step(parent, rng=rng, child_id=cid)
+    def snapshot(g_next: int):
+        state = {
+            'version': 1,
+            'generation': int(g_next),
+            'rng': rng.bit_generator.state,
+            'parent': {'id': str(parent.id), 'score_f': float(parent.score_f)},
+            'sigma': float(proposer.sigma),
+            'verdict_counts': dict(verdict_counts),
+            'h7_sum': h7_sum,
+            'f_sum': f_sum,
+            'n_scored': n_scored,
+            'ledger_bytes': jsonl.tell() if jsonl is not None else 0,
+            'ledger_rows': columnar.tell() if columnar is not None else 0,
+        }
+        return state, _checkpoint_arrays(parent, archivist.archive)
 
-            telemetry.seed = seed + (g * 10000) + i
-            child = telemetry.step(child)
-            child = verifier.step(child)
-
-            if child.verdict == 'REFINE':
-                attempts = 0
-                sigma0 = proposer.sigma
-                while attempts < refine_attempts and child.verdict == 'REFINE':
-                    attempts += 1
-                    proposer.sigma = sigma0 * (0.75 ** attempts)
-                    child2 = proposer.step(parent, rng=rng, child_id=f'{cid}_r{attempts}')
-                    telemetry.seed = seed + (g * 10000) + i + attempts
-                    child2 = telemetry.step(child2)
-                    child2 = verifier.step(child2)
-                    child = child2
-                proposer.sigma = sigma0
-
-            child = selector.step(child)
-            admitted = archivist.step(child)
-
-            verdict_counts[child.verdict] = verdict_counts.get(child.verdict, 0) + 1
-            h7 = float(child.dphi.h7) if child.dphi else 0.0
-            h7_trace.append(h7)
-            f_trace.append(float(child.score_f))
-
-            ledger({
-                'gen': g,
-                'idx': i,
-                'id': child.id,
-                'verdict': child.verdict,
-                'reason': child.reason,
-                'h7': h7,
-                'h7_weighted': float(child.dphi.summary.get('h7_weighted', 0.0)) if child.dphi else 0.0,
-                'h7_cusp': float(child.dphi.summary.get('h7_cusp', 0.0)) if child.dphi else 0.0,
-                'kappa_bound': float(child.dphi.summary.get('kappa_bound', 0.0)) if child.dphi else 0.0,
-                'q': float(child.score_q),
-                'f': float(child.score_f),
-                'admitted': bool(admitted),
-                'dphi_mean': float(child.dphi.summary.get('dphi_mean', 0.0)) if child.dphi else 0.0,
-                'C_mean': float(child.dphi.summary.get('C_mean', 0.0)) if child.dphi else 0.0,
-                'delta_norm': float(child.tags.get('delta_norm', 0.0)),
-            })
-
-            if (best is None) or (child.score_f > best.score_f):
-                best = child
-
-        if best is not None and best.verdict == 'APPROVE':
-            parent = best
+    profiler = make_profiler(run_path, config.get('profile'))
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,))
+
+    try:
+        for g in range(g_start, gens):
+            with profiler.span('propose'):
+                children = proposer.step_batch(parent, rng=rng, n=pop, id_prefix=f'g{g:03d}_c')
+            if pool is None:
+                children = evaluate_children(agents, parent, children, list(range(pop)), g, seed, refine_attempts,
+                                             profiler, retention)
+            else:
+                with profiler.span('evaluate'):
+                    lean = type(parent)(id=parent.id, genome=parent.genome)
+                    parts = _chunks(pop, workers)
+                    futures = [pool.submit(_evaluate_chunk, lean, [children[i] for i in idx], idx, g) for idx in parts]
+                    children = []
+                    for fut in futures:
+                        part, counters = fut.result()
+                        children.extend(part)
+                        if agents['cache'] is not None:
+                            agents['cache'].absorb(counters)
+            if profiler.enabled:
+                attempts = [c.tags.get('refine_attempts') for c in children]
+                profiler.count('refined', sum(a is not None for a in attempts))
+                profiler.count('refine_retries', sum(a or 0 for a in attempts))
+
+            parent, rows = advance(selector, archivist, parent, children, g, profiler, retention)
+            with profiler.span('ledger'):
+                for row in rows:
+                    for w in ledgers:
+                        w.write(row)
+            for row in rows:
+                verdict_counts[row['verdict']] = verdict_counts.get(row['verdict'], 0) + 1
+                h7_sum += row['h7']
+                f_sum += row['f']
+                n_scored += 1
+
+            with profiler.span('ledger'):
+                for w in ledgers:
+                    w.sync()
+            if checkpointer.enabled and checkpointer.due(g + 1):
+                with profiler.span('checkpoint'):
+                    checkpointer.save(*snapshot(g + 1))
+            profiler.end_generation(g, pop)
+
+        if checkpointer.enabled:
+            checkpointer.save(*snapshot(gens))
+    finally:
+        for w in ledgers:
+            w.close()
+        if pool is not None:
+            pool.shutdown()
+        checkpointer.wait()
+
+    cache_stats = agents['cache'].stats() if agents['cache'] is not None else None
+    return finalize_run(config, run_path, archivist.archive, verdict_counts, h7_sum, f_sum, n_scored,
+                        profiler, extra={'eval_cache': cache_stats} if cache_stats is not None else None)
+
+def finalize_run(config: Dict[str, Any], run_path: str, archive, verdict_counts: Dict[str, int],
+                 h7_sum: float, f_sum: float, n_scored: int, profiler=NULL_PROFILER,
+                 extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Write archive, stats, metadata and artifacts for a finished run; returns the run summary."""
+    threshold = float(config.get('threshold_h7', 0.70))
+    cfg_hash = sha256_json(config)
 
     archive_pkl = os.path.join(run_path, 'archive.pkl')
     with open(archive_pkl, 'wb') as f:
-        pickle.dump(archivist.archive, f)
+        pickle.dump(archive, f)
+    save_archive(os.path.join(run_path, 'archive.npz'), archive)
 
-    stats = archivist.archive.stats()
+    stats = archive.stats()
     stats.update({
         'threshold_h7': threshold,
-        'alpha': alpha,
+        'alpha': float(config.get('alpha', 0.70)),
         'verdict_counts': verdict_counts,
-        'mean_H7': float(np.mean(h7_trace)) if h7_trace else 0.0,
-        'mean_F':  float(np.mean(f_trace)) if f_trace else 0.0,
+        'mean_H7': float(h7_sum / n_scored) if n_scored else 0.0,
+        'mean_F':  float(f_sum / n_scored) if n_scored else 0.0,
     })
+    stats.update(extra or {})
 
     with open(os.path.join(run_path, 'archive_stats.json'), 'w', encoding='utf-8') as f:
         json.dump(stats, f, indent=2)
 
-    cfg_hash = sha256_json(config)
     git_hash = os.environ.get('ATHANOR_GIT_HASH', '')
 
     meta = {
         'timestamp_utc': datetime.now(timezone.utc).isoformat().replace('+00:00','Z'),
-        'seed': seed,
+        'seed': int(config.get('seed', 1337)),
         'config_hash': cfg_hash,
         'git_commit': git_hash,
     }
@@ -140,11 +467,14 @@ def run(config: Dict[str, Any]) -> Dict[str, Any]:
         for k,v in meta.items():
             f.write(f'{k}: {v}\n')
 
+    artifacts_cfg = dict(config.get('artifacts', {}) or {})
+    artifacts_mode = str(artifacts_cfg.get('mode', 'sync'))
     try:
-        plot_h7(ledger_path, os.path.join(run_path, 'h7_trace.png'), h7_threshold=threshold)
-        plot_fitness(ledger_path, os.path.join(run_path, 'fitness_trace.png'))
-        render_dashboard(run_path, threshold_h7=threshold)
-    except Exception as exc:
-        log.warning("artifact generation failed: %s", exc)
+        with profiler.span('artifacts'):
+            launch_artifacts(run_path, threshold_h7=threshold,
+                             max_points=int(artifacts_cfg.get('max_points', 5000)),
+                             mode=artifacts_mode, stats=stats)
+    finally:
+        profiler.close()
 
-    return { 'run_path': run_path, 'stats': stats, 'config_hash': cfg_hash }
+    return { 'run_path': run_path, 'stats': stats, 'config_hash': cfg_hash, 'artifacts': artifacts_mode }
@@ -0,0 +1,219 @@
+from __future__ import annotations
+import json, os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import numpy as np
+
+from ..core.types import Candidate
+from ..agents import ArchivistAgent
+from .archive import archive_from_arrays, tree_merge
+from .dgm_loop import advance, build_agents, evaluate_children, finalize_run, new_run_path, sha256_json
+from ..utils.logging import LedgerWriter
+from ..utils.columnar import COLUMNAR_DIR, ColumnarLedgerWriter, ledger_columns
+from ..utils.profiling import make_profiler
+
+
+def ring(k: int, n: int) -> List[int]:
+    """Island ``k`` receives from its predecessor."""
+    return [(k - 1) % n] if n > 1 else []
+
+
+def fully_connected(k: int, n: int) -> List[int]:
+    """Island ``k`` receives from every other island."""
+    return [j for j in range(n) if j != k]
+
+
+# Migration topologies: ``sources(k, n)`` lists the islands that send elites to island ``k``.
+TOPOLOGIES: Dict[str, Callable[[int, int], List[int]]] = {'ring': ring, 'full': fully_connected}
+
+
+def island_seed(seed: int, k: int) -> int:
+    """Independent, reproducible seed for island ``k`` of a run seeded with ``seed``."""
+    return int(np.random.SeedSequence([int(seed), int(k)]).generate_state(1)[0])
+
+
+def island_config(config: Dict[str, Any], k: int) -> Dict[str, Any]:
+    return {**config, 'seed': island_seed(int(config.get('seed', 1337)), k)}
+
+
+def init_island(config: Dict[str, Any], k: int) -> Dict[str, Any]:
+    """Generation-0 state of island ``k``: plain arrays and JSON values, so it can cross process boundaries."""
+    cfg = island_config(config, k)
+    rng = np.random.default_rng(int(cfg['seed']))
+    D = int(config.get('genome_dim', 64))
+    genome = rng.normal(0.0, 0.5, size=(D,)).astype(np.float32)
+    archivist = ArchivistAgent(bins=tuple(config.get('archive', {}).get('bins', [16, 16])),
+                               kind=str(config.get('archive', {}).get('kind', 'map')))
+    return {
+        'island': int(k),
+        'rng': rng.bit_generator.state,
+        'parent': {'id': f'i{k:02d}_parent_0000', 'score_f': 0.0, 'genome': genome},
+        'archive': archivist.archive.to_arrays(),
+        'verdict_counts': {'APPROVE': 0, 'REFINE': 0, 'REJECT': 0},
+        'h7_sum': 0.0,
+        'f_sum': 0.0,
+        'n_scored': 0,
+    }
+
+
+def run_epoch(config: Dict[str, Any], state: Dict[str, Any], g0: int, g1: int):
+    """Evolve one island from generation ``g0`` up to ``g1``; returns the new state and its ledger rows.
+
+    Each island evaluates serially with its own agents and RNG stream, so the
+    result depends only on ``state`` and not on which process runs it.
+    """
+    k = int(state['island'])
+    cfg = island_config(config, k)
+    seed = int(cfg['seed'])
+    pop = int(config.get('population', 16))
+    refine_attempts = int(config.get('refine_attempts', 2))
+    retention = str(config.get('retention', 'summary'))
+
+    agents = build_agents(cfg)
+    proposer, selector = agents['proposer'], agents['selector']
+    archivist = ArchivistAgent(archive=archive_from_arrays(state['archive']))
+    rng = np.random.default_rng()
+    rng.bit_generator.state = state['rng']
+    parent = Candidate(id=str(state['parent']['id']), genome=np.asarray(state['parent']['genome']))
+    parent.score_f = float(state['parent']['score_f'])
+
+    verdict_counts = dict(state['verdict_counts'])
+    h7_sum, f_sum, n_scored = float(state['h7_sum']), float(state['f_sum']), int(state['n_scored'])
+    rows: List[Dict[str, Any]] = []
+    for g in range(g0, g1):
+        children = proposer.step_batch(parent, rng=rng, n=pop, id_prefix=f'g{g:03d}_c')
+        children = evaluate_children(agents, parent, children, list(range(pop)), g, seed, refine_attempts,
+                                     retention=retention)
+        for c in children:
+            # Ids (including REFINE retries) are unique across islands in the merged archive and ledger.
+            c.id = f'i{k:02d}_{c.id}'
+        parent, gen_rows = advance(selector, archivist, parent, children, g, retention=retention)
+        for row in gen_rows:
+            row['island'] = k
+            verdict_counts[row['verdict']] = verdict_counts.get(row['verdict'], 0) + 1
+            h7_sum += row['h7']
+            f_sum += row['f']
+            n_scored += 1
+        rows.extend(gen_rows)
+
+    out = {
+        'island': k,
+        'rng': rng.bit_generator.state,
+        'parent': {'id': str(parent.id), 'score_f': float(parent.score_f),
+                   'genome': np.array(parent.genome, dtype=np.float32, copy=True)},
+        'archive': archivist.archive.to_arrays(),
+        'verdict_counts': verdict_counts,
+        'h7_sum': h7_sum,
+        'f_sum': f_sum,
+        'n_scored': n_scored,
+    }
+    return out, rows
+
+
+def migrate(states: Sequence[Dict[str, Any]], topology: Callable[[int, int], List[int]]) -> List[int]:
+    """Exchange elites along ``topology``; returns, per island, the source it adopted (or -1).
+
+    An island's elite is its current parent (the best approved lineage
+    member). Each island takes the best incoming elite if it scores strictly
+    higher than its own parent; ties go to the lowest source index. All
+    islands read the elites as they were before this exchange.
+    """
+    elites = [dict(s['parent']) for s in states]
+    adopted = []
+    for k, state in enumerate(states):
+        best = -1
+        for j in sorted(topology(k, len(states))):
+            if best < 0 or elites[j]['score_f'] > elites[best]['score_f']:
+                best = j
+        if best >= 0 and elites[best]['score_f'] > state['parent']['score_f']:
+            state['parent'] = {**elites[best], 'genome': np.array(elites[best]['genome'], copy=True)}
+            adopted.append(best)
+        else:
+            adopted.append(-1)
+    return adopted
+
+
+def run_islands(config: Dict[str, Any], executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """Island-model run: ``islands.count`` independent loops exchanging elites every ``islands.migrate_every`` generations.
+
+    Islands run as epoch tasks on a process pool of ``islands.processes``
+    (default: one per island); ``executor`` may be any
+    ``concurrent.futures.Executor`` instead, e.g. one spanning several hosts,
+    since epoch tasks only carry plain arrays and JSON values. Ledger rows are
+    written in (epoch, island, generation) order with an ``island`` column, so
+    the merged ledger, archive and stats do not depend on the pool size.
+    """
+    isl = dict(config.get('islands', {}) or {})
+    n = int(isl.get('count', 1))
+    every = int(isl.get('migrate_every', 5))
+    topology = isl.get('topology', 'ring')
+    sources = topology if callable(topology) else TOPOLOGIES[str(topology)]
+    gens = int(config.get('generations', 24))
+    processes = int(isl.get('processes', 0) or n)
+
+    out_dir = str(config.get('run', {}).get('out_dir', 'data/archives'))
+    run_path = new_run_path(out_dir, sha256_json(config))
+    with open(os.path.join(run_path, 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2, sort_keys=True)
+
+    ledger_cfg = dict(config.get('ledger', {}) or {})
+    ledger_format = str(ledger_cfg.get('format', 'jsonl'))
+    ledgers = []
+    if ledger_format in ('jsonl', 'both'):
+        ledgers.append(LedgerWriter(os.path.join(run_path, 'ledger.jsonl'),
+                                    flush_rows=int(ledger_cfg.get('flush_rows', 1024)),
+                                    flush_bytes=int(ledger_cfg.get('flush_bytes', 1 << 20)),
+                                    background=bool(ledger_cfg.get('background', False)),
+                                    fsync=bool(ledger_cfg.get('fsync', True))))
+    if ledger_format in ('columnar', 'both'):
+        ledgers.append(ColumnarLedgerWriter(os.path.join(run_path, COLUMNAR_DIR), ledger_columns(config),
+                                            fsync=bool(ledger_cfg.get('fsync', True))))
+
+    profiler = make_profiler(run_path, config.get('profile'))
+    pop = int(config.get('population', 16))
+    states = [init_island(config, k) for k in range(n)]
+    migrations = 0
+    own_pool = executor is None and processes > 1
+    pool = ProcessPoolExecutor(max_workers=min(processes, n)) if own_pool else executor
+    try:
+        for g0 in range(0, gens, every):
+            g1 = min(g0 + every, gens)
+            with profiler.span('epoch'):
+                if pool is None:
+                    results = [run_epoch(config, s, g0, g1) for s in states]
+                else:
+                    futures = [pool.submit(run_epoch, config, s, g0, g1) for s in states]
+                    results = [fut.result() for fut in futures]
+            states = [r[0] for r in results]
+            with profiler.span('ledger'):
+                for _, rows in results:
+                    for row in rows:
+                        for w in ledgers:
+                            w.write(row)
+                for w in ledgers:
+                    w.sync()
+            if g1 < gens:
+                with profiler.span('migrate'):
+                    adopted = migrate(states, sources)
+                migrations += sum(a >= 0 for a in adopted)
+                profiler.count('migrations', sum(a >= 0 for a in adopted))
+            profiler.end_generation(g1 - 1, n * pop * (g1 - g0))
+    finally:
+        for w in ledgers:
+            w.close()
+        if own_pool:
+            pool.shutdown()
+
+    archives = [archive_from_arrays(s['archive']) for s in states]
+    verdict_counts: Dict[str, int] = {}
+    for s in states:
+        for v, c in s['verdict_counts'].items():
+            verdict_counts[v] = verdict_counts.get(v, 0) + int(c)
+    extra = {
+        'islands': [{'island': s['island'], 'parent_id': s['parent']['id'], 'parent_f': s['parent']['score_f'],
+                     **a.stats()} for s, a in zip(states, archives)],
+        'migrations': migrations,
+    }
+    return finalize_run(config, run_path, tree_merge(archives), verdict_counts,
+                        sum(s['h7_sum'] for s in states), sum(s['f_sum'] for s in states),
+                        sum(s['n_scored'] for s in states), profiler, extra=extra)
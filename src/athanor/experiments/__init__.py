@@ -1,2 +1,3 @@
 from .registry import load_config
-__all__ = ["load_config"]
\ No newline at end of file
+from .sweep import expand_sweep, load_sweep, run_sweep
+__all__ = ["load_config", "expand_sweep", "load_sweep", "run_sweep"]
\ No newline at end of file
@@ -1,6 +1,9 @@
 from __future__ import annotations
 import os
-import yaml
+
+from ..backends import backend_names
+from ..core.precision import PRECISIONS
+from ..evolution.archive import DESCRIPTOR_FEATURES
 
 
 def validate_config(cfg: dict) -> dict:
@@ -25,15 +28,40 @@ def validate_config(cfg: dict) -> dict:
     positive_int('generations', 24)
     positive_int('refine_attempts', 2, min_value=0)
     positive_int('genome_dim', 64)
+    positive_int('workers', 1)
+
+    retention = str(out.get('retention', 'summary')).strip().lower()
+    if retention not in {'none', 'summary', 'full'}:
+        raise ValueError(f"retention must be 'none', 'summary' or 'full', got {retention}")
+    out['retention'] = retention
 
     mode = str(out.get('dphi_mode', 'l2')).strip().lower()
     if mode not in {'l2', 'cosine'}:
         raise ValueError(f"dphi_mode must be 'l2' or 'cosine', got {mode}")
     out['dphi_mode'] = mode
 
+    backend = str(out.get('backend', 'numpy')).strip().lower()
+    if backend not in backend_names():
+        raise ValueError(f"backend must be one of {backend_names()}, got {backend}")
+    out['backend'] = backend
+
+    precision = str(out.get('precision', 'float32')).strip().lower()
+    if precision not in PRECISIONS:
+        raise ValueError(f"precision must be one of {sorted(PRECISIONS)}, got {precision}")
+    out['precision'] = precision
+
     archive = dict(out.get('archive', {}) or {})
+    kind = str(archive.get('kind', 'map')).strip().lower()
+    if kind not in {'map', 'dense'}:
+        raise ValueError(f"archive.kind must be 'map' or 'dense', got {kind}")
+    archive['kind'] = kind
     bins = archive.get('bins', [16, 16])
-    if not isinstance(bins, (list, tuple)) or len(bins) != 2:
+    if kind == 'dense':
+        # One descriptor axis per bin count, taken from DESCRIPTOR_FEATURES in order.
+        if not isinstance(bins, (list, tuple)) or not 1 <= len(bins) <= len(DESCRIPTOR_FEATURES):
+            raise ValueError(f"archive.bins must be a list or tuple of length 1 to {len(DESCRIPTOR_FEATURES)} "
+                             f"for a dense archive")
+    elif not isinstance(bins, (list, tuple)) or len(bins) != 2:
         raise ValueError("archive.bins must be a list or tuple of length 2")
     bins = tuple(int(b) for b in bins)
     if any(b < 1 for b in bins):
@@ -41,6 +69,101 @@ def validate_config(cfg: dict) -> dict:
     archive['bins'] = list(bins)
     out['archive'] = archive
 
+    ledger = dict(out.get('ledger', {}) or {})
+    for key, default in (('flush_rows', 1024), ('flush_bytes', 1 << 20)):
+        v = int(ledger.get(key, default))
+        if v < 1:
+            raise ValueError(f"ledger.{key} must be >= 1, got {v}")
+        ledger[key] = v
+    fmt = str(ledger.get('format', 'jsonl')).strip().lower()
+    if fmt not in {'jsonl', 'columnar', 'both'}:
+        raise ValueError(f"ledger.format must be 'jsonl', 'columnar' or 'both', got {fmt}")
+    ledger['format'] = fmt
+    ledger['background'] = bool(ledger.get('background', False))
+    ledger['fsync'] = bool(ledger.get('fsync', True))
+    out['ledger'] = ledger
+
+    checkpoint = dict(out.get('checkpoint', {}) or {})
+    every = int(checkpoint.get('every', 0))
+    if every < 0:
+        raise ValueError(f"checkpoint.every must be >= 0, got {every}")
+    seconds = float(checkpoint.get('seconds', 0.0))
+    if seconds < 0.0:
+        raise ValueError(f"checkpoint.seconds must be >= 0, got {seconds}")
+    checkpoint['every'] = every
+    checkpoint['seconds'] = seconds
+    checkpoint['background'] = bool(checkpoint.get('background', True))
+    out['checkpoint'] = checkpoint
+
+    verify = dict(out.get('verify', {}) or {})
+    verify['early_exit'] = bool(verify.get('early_exit', False))
+    chunk = int(verify.get('chunk', 8))
+    if chunk < 1:
+        raise ValueError(f"verify.chunk must be >= 1, got {chunk}")
+    verify['chunk'] = chunk
+    robust = dict(verify.get('robustness', {}) or {})
+    samples = int(robust.get('samples', 0))
+    if samples < 0:
+        raise ValueError(f"verify.robustness.samples must be >= 0, got {samples}")
+    sigma = float(robust.get('sigma', 0.05))
+    if sigma < 0.0:
+        raise ValueError(f"verify.robustness.sigma must be >= 0, got {sigma}")
+    floor = robust.get('floor')
+    if floor is not None:
+        floor = float(floor)
+        if not 0.0 <= floor <= 1.0:
+            raise ValueError(f"verify.robustness.floor must be in [0,1], got {floor}")
+        if samples == 0:
+            raise ValueError("verify.robustness.floor needs verify.robustness.samples >= 1")
+    verify['robustness'] = {'samples': samples, 'sigma': sigma, 'floor': floor}
+    out['verify'] = verify
+
+    cache = dict(out.get('cache', {}) or {})
+    cache['enabled'] = bool(cache.get('enabled', False))
+    max_bytes = int(cache.get('max_bytes', 64 << 20))
+    if max_bytes < 0:
+        raise ValueError(f"cache.max_bytes must be >= 0, got {max_bytes}")
+    cache['max_bytes'] = max_bytes
+    cache_dir = cache.get('dir')
+    cache['dir'] = str(cache_dir).strip() or None if cache_dir else None
+    out['cache'] = cache
+
+    artifacts = dict(out.get('artifacts', {}) or {})
+    art_mode = str(artifacts.get('mode', 'sync')).strip().lower()
+    if art_mode not in {'sync', 'background', 'off'}:
+        raise ValueError(f"artifacts.mode must be 'sync', 'background' or 'off', got {art_mode}")
+    artifacts['mode'] = art_mode
+    max_points = int(artifacts.get('max_points', 5000))
+    if max_points < 2:
+        raise ValueError(f"artifacts.max_points must be >= 2, got {max_points}")
+    artifacts['max_points'] = max_points
+    out['artifacts'] = artifacts
+
+    islands = dict(out.get('islands', {}) or {})
+    for key, default, lo in (('count', 1, 1), ('migrate_every', 5, 1), ('processes', 0, 0)):
+        v = int(islands.get(key, default))
+        if v < lo:
+            raise ValueError(f"islands.{key} must be >= {lo}, got {v}")
+        islands[key] = v
+    topology = str(islands.get('topology', 'ring')).strip().lower()
+    if topology not in {'ring', 'full'}:
+        raise ValueError(f"islands.topology must be 'ring' or 'full', got {topology}")
+    islands['topology'] = topology
+    if islands['count'] > 1 and (checkpoint.get('every') or checkpoint.get('seconds')):
+        raise ValueError("checkpoint is not supported with islands.count > 1")
+    if islands['count'] > 1 and out['workers'] > 1:
+        # Each island evaluates serially inside its epoch task; islands.processes sets the parallelism.
+        raise ValueError("workers > 1 is not supported with islands.count > 1; use islands.processes")
+    out['islands'] = islands
+
+    profile = dict(out.get('profile', {}) or {})
+    profile['enabled'] = bool(profile.get('enabled', False))
+    memory = str(profile.get('memory', 'rss')).strip().lower()
+    if memory not in {'rss', 'tracemalloc', 'none'}:
+        raise ValueError(f"profile.memory must be 'rss', 'tracemalloc' or 'none', got {memory}")
+    profile['memory'] = memory
+    out['profile'] = profile
+
     run = dict(out.get('run', {}) or {})
     out_dir = str(run.get('out_dir', 'data/archives')).strip()
     if not out_dir:
@@ -52,6 +175,8 @@ def validate_config(cfg: dict) -> dict:
 
 
 def load_config(path: str) -> dict:
+    import yaml  # deferred: only config loading needs it, not `athanor --help` or pooled workers
+
     with open(path, 'r', encoding='utf-8') as f:
         cfg = yaml.safe_load(f) or {}
     inh = cfg.get('inherits')
@@ -0,0 +1,205 @@
+from __future__ import annotations
+import csv, itertools, json, os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+
+from .registry import load_config, validate_config
+from ..evolution.dgm_loop import now_tag, run, sha256_json
+
+SUMMARY_STATS = ('filled', 'mean_best_f', 'max_best_f', 'mean_H7', 'mean_F')
+
+
+def load_sweep(path: str) -> Dict[str, Any]:
+    import yaml
+
+    with open(path, 'r', encoding='utf-8') as f:
+        spec = yaml.safe_load(f) or {}
+    if not isinstance(spec, dict):
+        raise ValueError(f"sweep spec must be a mapping, got {type(spec).__name__}")
+    return spec
+
+
+def _set_path(cfg: Dict[str, Any], key: str, value: Any) -> None:
+    """Assign ``value`` at a dotted key (``archive.bins``), copying nested dicts on the way."""
+    parts = key.split('.')
+    node = cfg
+    for p in parts[:-1]:
+        child = dict(node.get(p, {}) or {})
+        node[p] = child
+        node = child
+    node[parts[-1]] = value
+
+
+def _draw(rng: np.random.Generator, key: str, dist: Any) -> Any:
+    if isinstance(dist, list):
+        if not dist:
+            raise ValueError(f"random.params.{key} must not be empty")
+        return dist[int(rng.integers(len(dist)))]
+    if isinstance(dist, dict) and 'low' in dist and 'high' in dist:
+        lo, hi = dist['low'], dist['high']
+        if dist.get('int', False):
+            return int(rng.integers(int(lo), int(hi) + 1))
+        return float(rng.uniform(float(lo), float(hi)))
+    raise ValueError(f"random.params.{key} must be a list of choices or a {{low, high}} range")
+
+
+def expand_sweep(spec: Dict[str, Any], base_dir: str = '.') -> List[Dict[str, Any]]:
+    """Variants of a sweep spec, each ``{'params', 'config', 'config_hash'}``.
+
+    ``base`` (a config path relative to ``base_dir``) is loaded through the
+    registry, ``overrides`` apply to every variant, ``grid`` lists values per
+    (dotted) key and expands to their cartesian product, and ``random`` draws
+    ``samples`` assignments per grid point from ``params`` (choice lists or
+    ``{low, high, int}`` ranges) with a fixed ``seed``. Every variant is
+    validated; variants with identical configs are kept once.
+    """
+    base: Dict[str, Any] = {}
+    if spec.get('base'):
+        base = load_config(os.path.join(base_dir, str(spec['base'])))
+    base.pop('inherits', None)
+    for k, v in dict(spec.get('overrides', {}) or {}).items():
+        _set_path(base, k, v)
+
+    grid = dict(spec.get('grid', {}) or {})
+    for k, vals in grid.items():
+        if not isinstance(vals, list) or not vals:
+            raise ValueError(f"grid.{k} must be a non-empty list")
+    keys = sorted(grid)
+    points = [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+    random = dict(spec.get('random', {}) or {})
+    if random:
+        samples = int(random.get('samples', 1))
+        if samples < 1:
+            raise ValueError(f"random.samples must be >= 1, got {samples}")
+        params = dict(random.get('params', {}) or {})
+        rng = np.random.default_rng(int(random.get('seed', 0)))
+        points = [{**p, **{k: _draw(rng, k, params[k]) for k in sorted(params)}}
+                  for p in points for _ in range(samples)]
+
+    variants, seen = [], set()
+    for params in points:
+        cfg = json.loads(json.dumps(base))
+        for k, v in params.items():
+            _set_path(cfg, k, v)
+        cfg = validate_config(cfg)
+        h = sha256_json(cfg)
+        if h in seen:
+            continue
+        seen.add(h)
+        variants.append({'params': params, 'config': cfg, 'config_hash': h})
+    return variants
+
+
+def completed_runs(out_dir: str) -> Dict[str, str]:
+    """``config_hash -> run_path`` for finished runs under ``out_dir``.
+
+    ``metadata.yaml`` is written after the ledger, archive and stats, so its
+    presence marks a completed run.
+    """
+    done: Dict[str, str] = {}
+    if not os.path.isdir(out_dir):
+        return done
+    for name in sorted(os.listdir(out_dir)):
+        meta = os.path.join(out_dir, name, 'metadata.yaml')
+        if not name.startswith('run_') or not os.path.exists(meta):
+            continue
+        with open(meta, 'r', encoding='utf-8') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key.strip() == 'config_hash':
+                    done.setdefault(value.strip(), os.path.join(out_dir, name))
+    return done
+
+
+def _run_variant(config: Dict[str, Any]) -> Dict[str, Any]:
+    out = run(config)
+    return {'run_path': out['run_path'], 'config_hash': out['config_hash'], 'stats': out['stats']}
+
+
+def _stats_for(run_path: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(run_path, 'archive_stats.json'), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def run_sweep(variants: List[Dict[str, Any]], max_workers: Optional[int] = None,
+              summary_path: Optional[str] = None,
+              progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Run every variant without a completed run, ``max_workers`` at a time, and write one CSV summary.
+
+    Pool workers are reused across variants, so interpreter startup and
+    imports are paid once per worker rather than once per variant. A failing
+    variant is recorded in the summary and does not stop the sweep.
+    """
+    max_workers = max(int(max_workers or os.cpu_count() or 1), 1)
+    rows: Dict[str, Dict[str, Any]] = {}
+    pending = []
+    done_by_dir: Dict[str, Dict[str, str]] = {}
+    for v in variants:
+        out_dir = str(v['config'].get('run', {}).get('out_dir', 'data/archives'))
+        if out_dir not in done_by_dir:
+            done_by_dir[out_dir] = completed_runs(out_dir)
+        prior = done_by_dir[out_dir].get(v['config_hash'])
+        if prior is not None:
+            rows[v['config_hash']] = {'status': 'skipped', 'run_path': prior, 'stats': _stats_for(prior)}
+        else:
+            pending.append(v)
+
+    def record(v, result=None, error=None):
+        if error is None:
+            row = {'status': 'ran', 'run_path': result['run_path'], 'stats': result['stats']}
+        else:
+            row = {'status': 'failed', 'run_path': '', 'stats': {}, 'error': f'{type(error).__name__}: {error}'}
+        rows[v['config_hash']] = row
+        if progress is not None:
+            progress({'config_hash': v['config_hash'], 'params': v['params'], **row})
+
+    if max_workers == 1 or len(pending) <= 1:
+        for v in pending:
+            try:
+                record(v, _run_variant(v['config']))
+            except Exception as exc:
+                record(v, error=exc)
+    elif pending:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+            futures = {pool.submit(_run_variant, v['config']): v for v in pending}
+            for fut in as_completed(futures):
+                v = futures[fut]
+                try:
+                    record(v, fut.result())
+                except Exception as exc:
+                    record(v, error=exc)
+
+    if summary_path is None:
+        out_dir = str(variants[0]['config'].get('run', {}).get('out_dir', 'data/archives')) if variants else '.'
+        summary_path = os.path.join(out_dir, f'sweep_{now_tag()}.csv')
+    table = write_summary(summary_path, variants, rows)
+    counts = {s: sum(1 for r in table if r['status'] == s) for s in ('ran', 'skipped', 'failed')}
+    return {'summary_path': summary_path, 'variants': len(variants), **counts}
+
+
+def write_summary(path: str, variants: List[Dict[str, Any]], rows: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """One row per variant: status, hash, run folder, swept parameters and headline stats."""
+    param_keys = sorted({k for v in variants for k in v['params']})
+    fields = ['status', 'config_hash', 'run_path', *param_keys, *SUMMARY_STATS, 'error']
+    table = []
+    for v in variants:
+        r = rows.get(v['config_hash'], {'status': 'failed', 'run_path': '', 'stats': {}})
+        stats = r.get('stats') or {}
+        table.append({
+            'status': r['status'], 'config_hash': v['config_hash'], 'run_path': r['run_path'],
+            **{k: json.dumps(v['params'][k]) if isinstance(v['params'].get(k), (list, dict))
+               else v['params'].get(k, '') for k in param_keys},
+            **{k: stats.get(k, '') for k in SUMMARY_STATS},
+            'error': r.get('error', ''),
+        })
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        w = csv.DictWriter(f, fieldnames=fields)
+        w.writeheader()
+        w.writerows(table)
+    return table
@@ -1,13 +1,131 @@
 from __future__ import annotations
-import argparse, json
-from ..experiments.registry import load_config
-from ..evolution.dgm_loop import run as run_loop
-
-def main():
-    ap = argparse.ArgumentParser(prog='athanor')
-    ap.add_argument('--config', required=True)
-    args = ap.parse_args()
+import argparse, json, os, sys
+
+# The loop, numpy and yaml are imported inside the commands, after argument
+# parsing, so `athanor --help` and argument errors stay cheap.
+
+def bench_main(argv=None) -> int:
+    from ..benchmarks import CASES, compare_results, load_results, run_suite, save_results, scaling_exponents
+    from ..evolution.dgm_loop import now_tag
+
+    ap = argparse.ArgumentParser(prog='athanor bench',
+                                 description='time core kernels and the full loop over a size sweep')
+    ap.add_argument('--cases', nargs='+', choices=sorted(CASES), default=None,
+                    help='subset of benchmark cases (default: all)')
+    ap.add_argument('--quick', action='store_true', help='small sweep for smoke checks')
+    ap.add_argument('--repeat', type=int, default=5)
+    ap.add_argument('--min-time', type=float, default=0.05,
+                    help='minimum seconds per timing round (calls are batched to reach it)')
+    ap.add_argument('--out', default=None,
+                    help='result JSON path (default: data/benchmarks/bench_<timestamp>.json)')
+    ap.add_argument('--compare', metavar='BASELINE', default=None,
+                    help='baseline JSON; exit 1 if any case regresses beyond --tolerance')
+    ap.add_argument('--tolerance', type=float, default=0.10)
+    ap.add_argument('--memory-tolerance', type=float, default=0.25)
+    args = ap.parse_args(argv)
+
+    def progress(rec):
+        print(f"{rec['key']:<72} {rec['min_s'] * 1e3:10.3f} ms {rec['peak_bytes'] / 1024:10.1f} KiB",
+              file=sys.stderr)
+
+    results = run_suite(cases=args.cases, quick=args.quick, repeat=args.repeat,
+                        min_time=args.min_time, progress=progress)
+    results['scaling'] = scaling_exponents(results)
+    out_path = args.out or os.path.join('data', 'benchmarks', f'bench_{now_tag()}.json')
+    save_results(out_path, results)
+
+    summary = {'results_path': out_path, 'cases': len(results['results']), 'scaling': results['scaling']}
+    code = 0
+    if args.compare:
+        rows = compare_results(results, load_results(args.compare),
+                               tolerance=args.tolerance, memory_tolerance=args.memory_tolerance)
+        regressions = [r for r in rows if r['status'] == 'regression']
+        for r in regressions:
+            print(f"REGRESSION {r['key']}: time x{r['time_ratio']:.2f}, memory x{r['memory_ratio']:.2f}",
+                  file=sys.stderr)
+        summary['regressions'] = [r['key'] for r in regressions]
+        summary['improvements'] = [r['key'] for r in rows if r['status'] == 'improvement']
+        code = 1 if regressions else 0
+    print(json.dumps(summary))
+    return code
+
+def sweep_main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog='athanor sweep',
+                                 description='run a grid/random sweep of config variants over a process pool')
+    ap.add_argument('spec', help='sweep spec YAML (base, overrides, grid, random, max_workers)')
+    ap.add_argument('--max-workers', type=int, default=None,
+                    help='concurrent variants (default: spec max_workers, else CPU count)')
+    ap.add_argument('--summary', default=None,
+                    help='summary CSV path (default: <out_dir>/sweep_<timestamp>.csv)')
+    ap.add_argument('--dry-run', action='store_true', help='list variants and skips without running')
+    ap.add_argument('--no-artifacts', action='store_true',
+                    help='skip plots and dashboard in every variant (same as artifacts.mode: off)')
+    args = ap.parse_args(argv)
+    from ..experiments.sweep import completed_runs, expand_sweep, load_sweep, run_sweep
+
+    spec = load_sweep(args.spec)
+    if args.no_artifacts:
+        spec['overrides'] = {**(spec.get('overrides') or {}), 'artifacts.mode': 'off'}
+    variants = expand_sweep(spec, base_dir=os.path.dirname(os.path.abspath(args.spec)))
+    if args.dry_run:
+        done = {}
+        for v in variants:
+            out_dir = str(v['config'].get('run', {}).get('out_dir', 'data/archives'))
+            done.update(completed_runs(out_dir))
+        for v in variants:
+            print(json.dumps({'config_hash': v['config_hash'], 'params': v['params'],
+                              'completed': done.get(v['config_hash'])}))
+        return 0
+
+    def progress(rec):
+        print(f"{rec['status']:<7} {rec['config_hash'][:12]} {json.dumps(rec['params'])} {rec.get('error', '')}",
+              file=sys.stderr)
+
+    summary = run_sweep(variants, max_workers=args.max_workers or spec.get('max_workers'),
+                        summary_path=args.summary, progress=progress)
+    print(json.dumps(summary))
+    return 1 if summary['failed'] else 0
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == 'bench':
+        return bench_main(argv[1:])
+    if argv and argv[0] == 'sweep':
+        return sweep_main(argv[1:])
+
+    ap = argparse.ArgumentParser(prog='athanor',
+                                 epilog="run 'athanor bench --help' for the benchmark suite and "
+                                        "'athanor sweep --help' for parameter sweeps")
+    src = ap.add_mutually_exclusive_group(required=True)
+    src.add_argument('--config')
+    src.add_argument('--resume', metavar='RUN_PATH',
+                     help='continue an interrupted run from its checkpoint.npz')
+    ap.add_argument('--workers', type=int, default=None,
+                    help='evaluate candidates in a process pool of this size (overrides config)')
+    ap.add_argument('--profile', action='store_true',
+                    help='write per-stage timings to metrics.jsonl / metrics.prom in the run folder')
+    ap.add_argument('--no-artifacts', action='store_true',
+                    help='skip plots and dashboard (same as artifacts.mode: off)')
+    args = ap.parse_args(argv)
+    if args.resume:
+        # A resumed run continues with its saved config.json, which these flags would contradict.
+        given = [flag for flag, on in (('--workers', args.workers is not None), ('--profile', args.profile),
+                                       ('--no-artifacts', args.no_artifacts)) if on]
+        if given:
+            ap.error(f"{', '.join(given)} cannot be combined with --resume (the run keeps its saved config)")
+    from ..experiments.registry import load_config, validate_config
+    from ..evolution.dgm_loop import run as run_loop, resume as resume_loop
+
+    if args.resume:
+        print(json.dumps(resume_loop(args.resume)))
+        return 0
     cfg = load_config(args.config)
+    if args.workers is not None:
+        cfg = validate_config({**cfg, 'workers': args.workers})
+    if args.profile:
+        cfg = validate_config({**cfg, 'profile': {**cfg.get('profile', {}), 'enabled': True}})
+    if args.no_artifacts:
+        cfg = validate_config({**cfg, 'artifacts': {**cfg.get('artifacts', {}), 'mode': 'off'}})
     out = run_loop(cfg)
     print(json.dumps(out))
-    return 0
\ No newline at end of file
+    return 0
@@ -1,4 +1,16 @@
-from .logging import log_jsonl
+from .logging import log_jsonl, LedgerWriter, RowEncoder
+from .columnar import ColumnarLedger, ColumnarLedgerWriter, open_columnar
+from .artifacts import launch_artifacts, render_artifacts
+from .profiling import NULL_PROFILER, StageProfiler, make_profiler
 from .seeding import make_rng
-from .visualization import plot_h7, plot_fitness, render_dashboard
-__all__ = ["log_jsonl", "make_rng", "plot_h7", "plot_fitness", "render_dashboard"]
\ No newline at end of file
+__all__ = ["log_jsonl", "LedgerWriter", "RowEncoder", "ColumnarLedger", "ColumnarLedgerWriter", "open_columnar", "launch_artifacts", "render_artifacts", "NULL_PROFILER", "StageProfiler", "make_profiler", "make_rng", "plot_h7", "plot_fitness", "render_dashboard", "load_ledger_columns"]
+
+# Plotting pulls in matplotlib; resolve these names on first access only.
+_VISUALIZATION = ("plot_h7", "plot_fitness", "render_dashboard", "load_ledger_columns")
+
+
+def __getattr__(name):
+    if name in _VISUALIZATION:
+        from . import visualization
+        return getattr(visualization, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+from __future__ import annotations
+import argparse, logging, os, subprocess, sys
+from typing import Any, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+ARTIFACT_LOG = 'artifacts.log'
+ARTIFACT_MODES = ('sync', 'background', 'off')
+
+
+def render_artifacts(run_path: str, threshold_h7: float = 0.70, max_points: int = 5000,
+                     stats: Optional[Dict[str, Any]] = None) -> None:
+    """Read the ledger once and render both traces and the dashboard from that data."""
+    from .visualization import plot_series, read_ledger, render_dashboard
+
+    ledger_path = os.path.join(run_path, 'ledger.jsonl')
+    cols, last = read_ledger(ledger_path, ('gen', 'h7', 'f'))
+    plot_series(cols['h7'], os.path.join(run_path, 'h7_trace.png'), 'ATHANOR: H7 over candidates', 'H7',
+                gen=cols['gen'], threshold=threshold_h7, max_points=max_points)
+    plot_series(cols['f'], os.path.join(run_path, 'fitness_trace.png'), 'ATHANOR: fitness F over candidates', 'F',
+                gen=cols['gen'], max_points=max_points)
+    render_dashboard(run_path, threshold_h7=threshold_h7, stats=stats, last=last)
+
+
+def launch_artifacts(run_path: str, threshold_h7: float = 0.70, max_points: int = 5000,
+                     mode: str = 'sync', stats: Optional[Dict[str, Any]] = None) -> Optional[subprocess.Popen]:
+    """Render artifacts now (``sync``), in a detached child process (``background``) or not at all (``off``).
+
+    The background process writes its output to ``artifacts.log`` in the run
+    folder and outlives the caller, so ``run()`` can return as soon as the
+    ledger, archive and stats are on disk. Failures are logged, never raised.
+    """
+    if mode not in ARTIFACT_MODES:
+        raise ValueError(f"artifact mode must be one of {ARTIFACT_MODES}, got {mode!r}")
+    if mode == 'off':
+        return None
+    if mode == 'sync':
+        try:
+            render_artifacts(run_path, threshold_h7=threshold_h7, max_points=max_points, stats=stats)
+        except Exception as exc:
+            log.warning("artifact generation failed: %s", exc)
+        return None
+
+    cmd = [sys.executable, '-m', 'athanor.utils.artifacts', str(run_path),
+           '--threshold', repr(float(threshold_h7)), '--max-points', str(int(max_points))]
+    try:
+        with open(os.path.join(run_path, ARTIFACT_LOG), 'ab') as out:
+            return subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=out, stderr=subprocess.STDOUT,
+                                    start_new_session=True)
+    except OSError as exc:
+        log.warning("could not start background artifact rendering: %s", exc)
+        return None
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog='python -m athanor.utils.artifacts',
+                                 description='render plots and dashboard for a finished run folder')
+    ap.add_argument('run_path')
+    ap.add_argument('--threshold', type=float, default=0.70)
+    ap.add_argument('--max-points', type=int, default=5000)
+    args = ap.parse_args(argv)
+    render_artifacts(args.run_path, threshold_h7=args.threshold, max_points=args.max_points)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,292 @@
+from __future__ import annotations
+import json, os
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+
+# Column layout of the binary ledger. Strings that repeat (verdict, reason) are
+# dictionary-encoded; candidate ids are fixed-width bytes.
+LEDGER_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('gen', '<i4'),
+    ('idx', '<i4'),
+    ('id', 'S32'),
+    ('verdict', 'dict'),
+    ('reason', 'dict'),
+    ('h7', '<f8'),
+    ('h7_weighted', '<f8'),
+    ('h7_cusp', '<f8'),
+    ('kappa_bound', '<f8'),
+    ('q', '<f8'),
+    ('f', '<f8'),
+    ('admitted', '?'),
+    ('dphi_mean', '<f8'),
+    ('C_mean', '<f8'),
+    ('delta_norm', '<f8'),
+)
+
+# Early-exit verification (``verify.early_exit``).
+EARLY_EXIT_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('steps_simulated', '<i4'),
+)
+
+# Island-model runs (``islands.count > 1``).
+ISLAND_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('island', '<i4'),
+)
+
+# Verifier robustness stage (``verify.robustness.samples > 0``).
+ROBUSTNESS_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('immunity_mean', '<f8'),
+    ('immunity_q05', '<f8'),
+    ('immunity_q50', '<f8'),
+    ('drift_q05', '<f8'),
+    ('drift_q50', '<f8'),
+    ('drift_q95', '<f8'),
+)
+
+DICT_CODE_DTYPE = '<u2'
+SCHEMA_FILE = 'schema.json'
+COLUMNAR_DIR = 'ledger.cols'
+
+
+def ledger_columns(config: Optional[Dict[str, Any]] = None) -> Tuple[Tuple[str, str], ...]:
+    """Columns for a run of ``config``: ``LEDGER_COLUMNS`` plus the optional groups it enables."""
+    cfg = config or {}
+    verify = dict(cfg.get('verify', {}) or {})
+    robust = dict(verify.get('robustness', {}) or {})
+    columns = LEDGER_COLUMNS
+    if bool(verify.get('early_exit', False)):
+        columns += EARLY_EXIT_COLUMNS
+    if int(dict(cfg.get('islands', {}) or {}).get('count', 1)) > 1:
+        columns += ISLAND_COLUMNS
+    if int(robust.get('samples', 0)) > 0:
+        columns += ROBUSTNESS_COLUMNS
+    return columns
+
+
+def _storage_dtype(kind: str) -> np.dtype:
+    return np.dtype(DICT_CODE_DTYPE if kind == 'dict' else kind)
+
+
+def _write_json_atomic(path: str, obj: Any) -> None:
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(obj, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class ColumnarLedgerWriter:
+    """Append-only columnar ledger: one raw little-endian file per column.
+
+    Rows are staged in memory and appended to the column files on ``sync()``
+    (one call per generation). The committed row count lives in
+    ``schema.json``, which is replaced atomically after the column data has
+    been fsync'ed, so readers never see a half-written generation. Row keys
+    outside ``columns`` are ignored; missing keys are stored as zero/empty.
+    Columns that no row has supplied are listed as not ``produced`` and left
+    out of the rows read back, so exports match the rows that were written.
+    Passing ``rows`` reopens an existing ledger truncated to that many rows.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Sequence[Tuple[str, str]] = LEDGER_COLUMNS,
+        fsync: bool = True,
+        rows: Optional[int] = None,
+    ):
+        self.path = str(path)
+        self.fsync = bool(fsync)
+        os.makedirs(self.path, exist_ok=True)
+
+        schema_path = os.path.join(self.path, SCHEMA_FILE)
+        if os.path.exists(schema_path):
+            with open(schema_path, 'r', encoding='utf-8') as f:
+                schema = json.load(f)
+            self.columns = [tuple(c) for c in schema['columns']]
+            self.rows = int(schema['rows'])
+            self.dictionaries = {k: list(v) for k, v in schema['dictionaries'].items()}
+            self.produced = set(schema.get('produced', (n for n, _ in self.columns)))
+            if rows is not None:
+                # Roll back to an earlier commit point (used when resuming a run).
+                self.rows = min(self.rows, int(rows))
+        else:
+            self.columns = [tuple(c) for c in columns]
+            self.rows = 0
+            self.dictionaries = {name: [] for name, kind in self.columns if kind == 'dict'}
+            self.produced = set()
+
+        self._codes = {name: {v: i for i, v in enumerate(vals)} for name, vals in self.dictionaries.items()}
+        self._staged: Dict[str, List[Any]] = {name: [] for name, _ in self.columns}
+        self._files = {}
+        for name, kind in self.columns:
+            fpath = os.path.join(self.path, f'{name}.bin')
+            f = open(fpath, 'ab')
+            # Drop bytes past the committed row count (left over from a crash).
+            committed = self.rows * _storage_dtype(kind).itemsize
+            if f.tell() != committed:
+                f.truncate(committed)
+                f.seek(committed)
+            self._files[name] = f
+        self._commit()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        for name, kind in self.columns:
+            v = row.get(name)
+            if v is not None:
+                self.produced.add(name)
+            if kind == 'dict':
+                s = '' if v is None else str(v)
+                code = self._codes[name].get(s)
+                if code is None:
+                    code = len(self.dictionaries[name])
+                    self.dictionaries[name].append(s)
+                    self._codes[name][s] = code
+                self._staged[name].append(code)
+            else:
+                self._staged[name].append(0 if v is None else v)
+
+    def flush(self) -> None:
+        pending = len(self._staged[self.columns[0][0]])
+        if not pending:
+            return
+        blocks = []
+        for name, kind in self.columns:
+            dt = _storage_dtype(kind)
+            vals = self._staged[name]
+            if dt.kind == 'S':
+                vals = [str(v).encode('utf-8') for v in vals]
+                if any(len(v) > dt.itemsize for v in vals):
+                    raise ValueError(f"ledger column {name!r} value longer than {dt.itemsize} bytes")
+            blocks.append((name, np.asarray(vals, dtype=dt).tobytes()))
+        for name, data in blocks:
+            self._files[name].write(data)
+            self._staged[name].clear()
+        self.rows += pending
+
+    def sync(self) -> None:
+        """Generation boundary: append staged rows, fsync columns, commit the row count."""
+        self.flush()
+        for f in self._files.values():
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._commit()
+
+    def tell(self) -> int:
+        return self.rows
+
+    def close(self) -> None:
+        if not self._files:
+            return
+        try:
+            self.sync()
+        finally:
+            for f in self._files.values():
+                f.close()
+            self._files = {}
+
+    def _commit(self) -> None:
+        _write_json_atomic(os.path.join(self.path, SCHEMA_FILE), {
+            'version': 1,
+            'columns': [list(c) for c in self.columns],
+            'rows': self.rows,
+            'dictionaries': self.dictionaries,
+            'produced': [n for n, _ in self.columns if n in self.produced],
+        })
+
+    def __enter__(self) -> "ColumnarLedgerWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ColumnarLedger:
+    """Read-only view over a columnar ledger; columns are ``np.memmap`` arrays."""
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        with open(os.path.join(self.path, SCHEMA_FILE), 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+        self.columns = [tuple(c) for c in schema['columns']]
+        self.kinds = dict(self.columns)
+        self.rows = int(schema['rows'])
+        self.dictionaries = {k: list(v) for k, v in schema['dictionaries'].items()}
+        # Columns some row supplied; the others hold only zero fill and are left out of decoded rows.
+        produced = set(schema.get('produced', self.kinds))
+        self.produced = [n for n, _ in self.columns if n in produced]
+        self._cache: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.kinds
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Raw column (dictionary codes for dict columns), memory-mapped without copying."""
+        col = self._cache.get(name)
+        if col is None:
+            dt = _storage_dtype(self.kinds[name])
+            if self.rows == 0:
+                col = np.zeros((0,), dtype=dt)
+            else:
+                col = np.memmap(os.path.join(self.path, f'{name}.bin'), dtype=dt, mode='r', shape=(self.rows,))
+            self._cache[name] = col
+        return col
+
+    def decode(self, name: str) -> np.ndarray:
+        """Dictionary column expanded to an array of strings."""
+        vocab = np.array(self.dictionaries[name] or [''], dtype=object)
+        return vocab[np.asarray(self[name])]
+
+    def row(self, k: int) -> Dict[str, Any]:
+        k = int(k)
+        if k < 0:
+            k += self.rows
+        if not 0 <= k < self.rows:
+            raise IndexError(f"row {k} out of range for ledger with {self.rows} rows")
+        out: Dict[str, Any] = {}
+        for name in self.produced:
+            kind = self.kinds[name]
+            v = self[name][k]
+            if kind == 'dict':
+                out[name] = self.dictionaries[name][int(v)]
+            elif kind.startswith('S'):
+                out[name] = bytes(v).decode('utf-8')
+            else:
+                out[name] = v.item()
+        return out
+
+    def iter_rows(self, chunk: int = 65536) -> Iterator[Dict[str, Any]]:
+        names = self.produced
+        for a in range(0, self.rows, chunk):
+            b = min(a + chunk, self.rows)
+            cols = []
+            for name in names:
+                kind = self.kinds[name]
+                if kind == 'dict':
+                    vocab = self.dictionaries[name]
+                    cols.append([vocab[c] for c in self[name][a:b].tolist()])
+                elif kind.startswith('S'):
+                    cols.append([v.decode('utf-8') for v in self[name][a:b].tolist()])
+                else:
+                    cols.append(self[name][a:b].tolist())
+            for vals in zip(*cols):
+                yield dict(zip(names, vals))
+
+    def to_jsonl(self, out_path: str) -> int:
+        with open(out_path, 'w', encoding='utf-8') as f:
+            n = 0
+            for row in self.iter_rows():
+                f.write(json.dumps(row) + '\n')
+                n += 1
+        return n
+
+
+def open_columnar(path: str) -> Optional[ColumnarLedger]:
+    if os.path.exists(os.path.join(str(path), SCHEMA_FILE)):
+        return ColumnarLedger(path)
+    return None
@@ -1,7 +1,169 @@
 from __future__ import annotations
-import json
-from typing import Any, Dict
+import json, os, queue, threading
+from json.encoder import encode_basestring_ascii
+from operator import itemgetter
+from typing import Any, Dict, Optional
 
 def log_jsonl(path: str, row: Dict[str, Any]):
     with open(path, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(row) + '\\n')
\ No newline at end of file
+        f.write(json.dumps(row) + '\n')
+
+
+class RowEncoder:
+    """JSON-lines encoder specialised to a fixed row schema.
+
+    The key order and value types of the first row are compiled into a single
+    %-format template. Rows that match it are rendered with one format call;
+    anything else (new keys, other types, NaN/inf) falls back to ``json.dumps``
+    so the output is always identical to ``json.dumps(row) + '\\n'``.
+    """
+
+    def __init__(self):
+        self._keys = None
+
+    def _compile(self, row: Dict[str, Any]) -> None:
+        keys = tuple(row)
+        types = tuple(type(row[k]) for k in keys)
+        codes = []
+        for t in types:
+            if t is str or t is bool:
+                codes.append('%s')
+            elif t is int:
+                codes.append('%d')
+            elif t is float:
+                codes.append('%r')
+            else:
+                self._keys = ()
+                return
+        self._keys = keys
+        self._types = types
+        self._get = itemgetter(*keys) if len(keys) > 1 else (lambda r, k=keys[0]: (r[k],))
+        self._str = [i for i, t in enumerate(types) if t is str]
+        self._bool = [i for i, t in enumerate(types) if t is bool]
+        self._float = [i for i, t in enumerate(types) if t is float]
+        self._tmpl = '{' + ', '.join(f'{encode_basestring_ascii(k)}: {c}' for k, c in zip(keys, codes)) + '}\n'
+
+    def encode(self, row: Dict[str, Any]) -> str:
+        if self._keys is None and row:
+            self._compile(row)
+        if not self._keys or tuple(row) != self._keys:
+            return json.dumps(row) + '\n'
+        vals = list(self._get(row))
+        if tuple(map(type, vals)) != self._types:
+            return json.dumps(row) + '\n'
+        if self._float:
+            s = sum(vals[i] for i in self._float)
+            if s - s != 0.0:
+                return json.dumps(row) + '\n'
+        for i in self._str:
+            vals[i] = encode_basestring_ascii(vals[i])
+        for i in self._bool:
+            vals[i] = 'true' if vals[i] else 'false'
+        return self._tmpl % tuple(vals)
+
+
+class LedgerWriter:
+    """Append-only JSONL writer that keeps the file open for the whole run.
+
+    Rows are encoded as they arrive and buffered in memory; the buffer is
+    written out once ``flush_rows`` rows or ``flush_bytes`` bytes accumulate.
+    ``sync()`` marks a generation boundary: everything buffered is written and
+    fsync'ed, so after a crash the ledger ends on a complete generation or on
+    a partially flushed later one, never mid-row. With ``background=True`` the
+    writes happen on a dedicated thread and ``sync()`` waits for it to drain.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_rows: int = 1024,
+        flush_bytes: int = 1 << 20,
+        background: bool = False,
+        fsync: bool = True,
+    ):
+        self.path = str(path)
+        self.flush_rows = max(int(flush_rows), 1)
+        self.flush_bytes = max(int(flush_bytes), 1)
+        self.fsync = bool(fsync)
+        self.rows_written = 0
+        self._encoder = RowEncoder()
+        self._buf: list[str] = []
+        self._buf_bytes = 0
+        self._f = open(self.path, 'ab')
+        self._error: Optional[BaseException] = None
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(maxsize=64)
+            self._thread = threading.Thread(target=self._drain, name='athanor-ledger', daemon=True)
+            self._thread.start()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        line = self._encoder.encode(row)
+        self._buf.append(line)
+        self._buf_bytes += len(line)
+        self.rows_written += 1
+        if len(self._buf) >= self.flush_rows or self._buf_bytes >= self.flush_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand buffered rows to the file (or the writer thread) without fsync."""
+        self._raise_pending()
+        if not self._buf:
+            return
+        chunk = ''.join(self._buf).encode('utf-8')
+        self._buf.clear()
+        self._buf_bytes = 0
+        if self._queue is not None:
+            self._queue.put(chunk)
+        else:
+            self._f.write(chunk)
+
+    def sync(self) -> None:
+        """Generation boundary: flush, wait for pending writes and fsync."""
+        self.flush()
+        if self._queue is not None:
+            self._queue.join()
+            self._raise_pending()
+        self._f.flush()
+        if self.fsync:
+            os.fsync(self._f.fileno())
+
+    def tell(self) -> int:
+        """Byte offset of the durable end of the ledger (valid right after ``sync``)."""
+        return self._f.tell()
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        try:
+            self.sync()
+        finally:
+            if self._queue is not None:
+                self._queue.put(None)
+                self._thread.join()
+            self._f.close()
+
+    def _drain(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            try:
+                if chunk is None:
+                    return
+                if self._error is None:
+                    self._f.write(chunk)
+            except BaseException as exc:
+                self._error = exc
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending(self) -> None:
+        if self._error is not None:
+            exc, self._error = self._error, None
+            raise exc
+
+    def __enter__(self) -> "LedgerWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
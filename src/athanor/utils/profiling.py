@@ -0,0 +1,212 @@
+from __future__ import annotations
+import json, os, sys, time, tracemalloc
+from typing import Any, Dict, Optional
+
+METRICS_FILE = 'metrics.jsonl'
+OPENMETRICS_FILE = 'metrics.prom'
+MEMORY_MODES = ('rss', 'tracemalloc', 'none')
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, or None where ``resource`` is unavailable."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    # Linux reports KiB, macOS bytes.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullProfiler:
+    """Disabled profiler: every hook is a constant-time no-op."""
+
+    enabled = False
+
+    def span(self, name: str) -> _NullSpan:
+        return _NULL_SPAN
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def end_generation(self, g: int, candidates: int) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class _Span:
+    __slots__ = ('prof', 'name', 'w0', 'c0')
+
+    def __init__(self, prof: "StageProfiler", name: str):
+        self.prof = prof
+        self.name = name
+
+    def __enter__(self):
+        self.w0 = time.perf_counter()
+        self.c0 = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        self.prof._record(self.name, time.perf_counter() - self.w0, time.process_time() - self.c0)
+        return False
+
+
+class StageProfiler:
+    """Per-stage wall/CPU timings, counters and memory, one ``metrics.jsonl`` row per generation.
+
+    Spans nest freely; each stage accumulates its own wall and CPU seconds
+    and call count. ``end_generation`` writes the generation's row
+    (including candidates/sec and peak memory) and resets the per-generation
+    accumulators; ``close`` writes run totals as OpenMetrics text.
+    With ``memory='tracemalloc'`` the traced peak is reset every generation,
+    so it is a true per-generation peak; ``'rss'`` reports the process peak so far.
+    """
+
+    enabled = True
+
+    def __init__(self, run_path: str, memory: str = 'rss'):
+        if memory not in MEMORY_MODES:
+            raise ValueError(f"memory must be one of {MEMORY_MODES}, got {memory!r}")
+        self.metrics_path = os.path.join(run_path, METRICS_FILE)
+        self.openmetrics_path = os.path.join(run_path, OPENMETRICS_FILE)
+        self.memory = memory
+        self._f = open(self.metrics_path, 'a', encoding='utf-8')
+        self._stages: Dict[str, list] = {}
+        self._counters: Dict[str, int] = {}
+        self._total_stages: Dict[str, list] = {}
+        self._total_counters: Dict[str, int] = {}
+        self._generations = 0
+        self._candidates = 0
+        self._peak_memory = 0
+        self._owns_tracemalloc = False
+        if memory == 'tracemalloc' and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._t_gen = time.perf_counter()
+        self._t_run = self._t_gen
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + int(n)
+        self._total_counters[name] = self._total_counters.get(name, 0) + int(n)
+
+    def _record(self, name: str, wall: float, cpu: float) -> None:
+        for acc in (self._stages, self._total_stages):
+            s = acc.get(name)
+            if s is None:
+                acc[name] = [wall, cpu, 1]
+            else:
+                s[0] += wall
+                s[1] += cpu
+                s[2] += 1
+
+    def _memory(self) -> Optional[int]:
+        if self.memory == 'rss':
+            return peak_rss_bytes()
+        if self.memory == 'tracemalloc' and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            return int(peak)
+        return None
+
+    def end_generation(self, g: int, candidates: int) -> None:
+        now = time.perf_counter()
+        wall = now - self._t_gen
+        self._t_gen = now
+        mem = self._memory()
+        if mem is not None:
+            self._peak_memory = max(self._peak_memory, mem)
+        self._generations += 1
+        self._candidates += int(candidates)
+        row: Dict[str, Any] = {
+            'gen': int(g),
+            'wall_s': wall,
+            'candidates': int(candidates),
+            'candidates_per_s': (candidates / wall) if wall > 0 else 0.0,
+            'stages': {k: {'wall_s': v[0], 'cpu_s': v[1], 'calls': v[2]} for k, v in self._stages.items()},
+            'counters': dict(self._counters),
+        }
+        if mem is not None:
+            row[f'peak_{self.memory}_bytes'] = mem
+        self._f.write(json.dumps(row) + '\n')
+        self._f.flush()
+        self._stages.clear()
+        self._counters.clear()
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        wall = time.perf_counter() - self._t_run
+        # Spans recorded after the last generation (e.g. artifact rendering) get a summary row.
+        if self._stages or self._counters:
+            self._f.write(json.dumps({
+                'gen': None,
+                'stages': {k: {'wall_s': v[0], 'cpu_s': v[1], 'calls': v[2]} for k, v in self._stages.items()},
+                'counters': dict(self._counters),
+            }) + '\n')
+        self._f.close()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+        with open(self.openmetrics_path, 'w', encoding='utf-8') as f:
+            f.write(self.openmetrics(wall))
+
+    def openmetrics(self, wall: float) -> str:
+        """Run totals in OpenMetrics text exposition format."""
+        lines = [
+            '# TYPE athanor_stage_wall_seconds counter',
+            '# HELP athanor_stage_wall_seconds Wall-clock seconds spent per loop stage.',
+        ]
+        lines += [f'athanor_stage_wall_seconds_total{{stage="{k}"}} {v[0]!r}' for k, v in self._total_stages.items()]
+        lines += [
+            '# TYPE athanor_stage_cpu_seconds counter',
+            '# HELP athanor_stage_cpu_seconds Process CPU seconds spent per loop stage.',
+        ]
+        lines += [f'athanor_stage_cpu_seconds_total{{stage="{k}"}} {v[1]!r}' for k, v in self._total_stages.items()]
+        lines += [
+            '# TYPE athanor_stage_calls counter',
+            '# HELP athanor_stage_calls Number of timed spans per loop stage.',
+        ]
+        lines += [f'athanor_stage_calls_total{{stage="{k}"}} {v[2]}' for k, v in self._total_stages.items()]
+        lines += ['# TYPE athanor_events counter', '# HELP athanor_events Loop event counters.']
+        lines += [f'athanor_events_total{{event="{k}"}} {v}' for k, v in self._total_counters.items()]
+        lines += [
+            '# TYPE athanor_generations counter',
+            f'athanor_generations_total {self._generations}',
+            '# TYPE athanor_candidates counter',
+            f'athanor_candidates_total {self._candidates}',
+            '# TYPE athanor_candidates_per_second gauge',
+            f'athanor_candidates_per_second {(self._candidates / wall) if wall > 0 else 0.0!r}',
+        ]
+        if self.memory != 'none':
+            lines += ['# TYPE athanor_peak_memory_bytes gauge',
+                      f'athanor_peak_memory_bytes{{source="{self.memory}"}} {self._peak_memory}']
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+
+def make_profiler(run_path: str, profile_cfg: Optional[Dict[str, Any]] = None):
+    """``StageProfiler`` when ``profile.enabled`` is set, else the shared no-op profiler."""
+    cfg = dict(profile_cfg or {})
+    if not cfg.get('enabled', False):
+        return NULL_PROFILER
+    return StageProfiler(run_path, memory=str(cfg.get('memory', 'rss')))
@@ -3,6 +3,8 @@ import json, os
 import numpy as np
 import matplotlib.pyplot as plt
 
+from .columnar import COLUMNAR_DIR, open_columnar
+
 def load_ledger(path: str):
     rows = []
     with open(path, 'r', encoding='utf-8') as f:
@@ -12,49 +14,111 @@ def load_ledger(path: str):
                 rows.append(json.loads(line))
     return rows
 
-def plot_h7(path_ledger: str, out_png: str, h7_threshold: float = 0.70):
-    rows = load_ledger(path_ledger)
-    h7 = np.array([r.get('h7',0.0) for r in rows], dtype=np.float32)
-    plt.figure()
-    plt.plot(h7)
-    plt.axhline(float(h7_threshold), linestyle='--')
-    plt.title('ATHANOR: H7 over candidates')
-    plt.xlabel('candidate index')
-    plt.ylabel('H7')
-    plt.savefig(out_png, bbox_inches='tight')
-    plt.close()
+def columnar_path(path_ledger: str) -> str:
+    return os.path.join(os.path.dirname(path_ledger), COLUMNAR_DIR)
+
+def load_ledger_columns(path_ledger: str, names):
+    """Numeric ledger columns by name.
+
+    Reads the memory-mapped columnar ledger next to ``path_ledger`` when one
+    exists (zero-copy), otherwise parses the JSONL file once.
+    """
+    return read_ledger(path_ledger, names)[0]
+
+def last_ledger_row(path_ledger: str):
+    cols = open_columnar(columnar_path(path_ledger))
+    if cols is not None and len(cols):
+        return cols.row(-1)
+    last = {}
+    with open(path_ledger, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                last = json.loads(line)
+    return last
 
-def plot_fitness(path_ledger: str, out_png: str):
-    rows = load_ledger(path_ledger)
-    f = np.array([r.get('f',0.0) for r in rows], dtype=np.float32)
+def read_ledger(path_ledger: str, names):
+    """Numeric columns plus the last row, in a single pass over the ledger."""
+    names = tuple(names)
+    cols = open_columnar(columnar_path(path_ledger))
+    if cols is not None and all(n in cols for n in names):
+        return {n: cols[n] for n in names}, (cols.row(-1) if len(cols) else {})
+    acc = {n: [] for n in names}
+    last = {}
+    with open(path_ledger, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                last = json.loads(line)
+                for n in names:
+                    acc[n].append(last.get(n, 0.0))
+    return {n: np.asarray(v, dtype=np.float64) for n, v in acc.items()}, last
+
+def aggregate_by_generation(gen: np.ndarray, y: np.ndarray):
+    """Per-generation (generation, mean, min, max) of ``y``; rows are grouped by ``gen`` value."""
+    gen = np.asarray(gen)
+    y = np.asarray(y, dtype=np.float64)
+    if y.size == 0:
+        empty = np.zeros((0,), dtype=np.float64)
+        return empty, empty, empty, empty
+    order = np.argsort(gen, kind='stable')
+    g, y = gen[order], y[order]
+    starts = np.flatnonzero(np.r_[True, g[1:] != g[:-1]])
+    counts = np.diff(np.r_[starts, g.size])
+    mean = np.add.reduceat(y, starts) / counts
+    return g[starts].astype(np.float64), mean, np.minimum.reduceat(y, starts), np.maximum.reduceat(y, starts)
+
+def plot_series(y, out_png: str, title: str, ylabel: str, gen=None, threshold=None, max_points: int = 5000):
+    """Line plot per candidate, or per-generation mean with a min/max band once ``y`` exceeds ``max_points``."""
+    y = np.asarray(y, dtype=np.float64)
     plt.figure()
-    plt.plot(f)
-    plt.title('ATHANOR: fitness F over candidates')
-    plt.xlabel('candidate index')
-    plt.ylabel('F')
+    if gen is not None and y.size > max_points:
+        x, mean, lo, hi = aggregate_by_generation(gen, y)
+        plt.fill_between(x, lo, hi, alpha=0.25, linewidth=0)
+        plt.plot(x, mean)
+        plt.xlabel('generation (mean, min-max band)')
+    else:
+        if y.size > max_points:
+            # No generation column: keep an evenly strided subsample.
+            idx = np.linspace(0, y.size - 1, max_points).astype(np.int64)
+            plt.plot(idx, y[idx])
+        else:
+            plt.plot(y)
+        plt.xlabel('candidate index')
+    if threshold is not None:
+        plt.axhline(float(threshold), linestyle='--')
+    plt.title(title)
+    plt.ylabel(ylabel)
     plt.savefig(out_png, bbox_inches='tight')
     plt.close()
 
-def render_dashboard(run_path: str, threshold_h7: float = 0.70):
+def plot_h7(path_ledger: str, out_png: str, h7_threshold: float = 0.70, max_points: int = 5000):
+    cols, _ = read_ledger(path_ledger, ('gen', 'h7'))
+    plot_series(cols['h7'], out_png, 'ATHANOR: H7 over candidates', 'H7',
+                gen=cols['gen'], threshold=h7_threshold, max_points=max_points)
+
+def plot_fitness(path_ledger: str, out_png: str, max_points: int = 5000):
+    cols, _ = read_ledger(path_ledger, ('gen', 'f'))
+    plot_series(cols['f'], out_png, 'ATHANOR: fitness F over candidates', 'F',
+                gen=cols['gen'], max_points=max_points)
+
+def render_dashboard(run_path: str, threshold_h7: float = 0.70, stats=None, last=None):
+    """Write dashboard.html; ``stats``/``last`` skip re-reading them when the caller already has them."""
     stats_path = os.path.join(run_path, 'archive_stats.json')
     ledger_path = os.path.join(run_path, 'ledger.jsonl')
     dash   = os.path.join(run_path, 'dashboard.html')
 
-    stats = {}
-    try:
-        with open(stats_path, 'r', encoding='utf-8') as f:
-            stats = json.load(f) or {}
-    except Exception:
-        stats = {}
+    if stats is None:
+        try:
+            with open(stats_path, 'r', encoding='utf-8') as f:
+                stats = json.load(f) or {}
+        except Exception:
+            stats = {}
 
-    last = {}
-    try:
-        with open(ledger_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    last = json.loads(line)
-    except Exception:
-        last = {}
+    if last is None:
+        try:
+            last = last_ledger_row(ledger_path)
+        except Exception:
+            last = {}
 
     def esc(s: str) -> str:
         return (str(s)
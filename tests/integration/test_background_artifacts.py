@@ -0,0 +1,25 @@
+import os
+import time
+
+from athanor.evolution.dgm_loop import run
+from athanor.experiments.registry import validate_config
+
+
+def test_background_artifacts_render_after_run_returns(tmp_path):
+    cfg = validate_config({
+        'seed': 3, 'population': 6, 'generations': 2, 'steps_per_candidate': 10, 'genome_dim': 8,
+        'artifacts': {'mode': 'background'},
+        'run': {'out_dir': str(tmp_path)},
+    })
+    out = run(cfg)
+    assert out['artifacts'] == 'background'
+    assert os.path.exists(os.path.join(out['run_path'], 'archive_stats.json'))
+
+    expected = ('h7_trace.png', 'fitness_trace.png', 'dashboard.html')
+    deadline = time.monotonic() + 60.0
+    while time.monotonic() < deadline:
+        if all(os.path.exists(os.path.join(out['run_path'], name)) for name in expected):
+            break
+        time.sleep(0.1)
+    for name in expected:
+        assert os.path.exists(os.path.join(out['run_path'], name)), name
@@ -0,0 +1,25 @@
+import json, subprocess, sys
+from pathlib import Path
+
+
+def test_cli_bench_writes_results_and_compares(tmp_path):
+    root = Path(__file__).resolve().parents[2]
+    out = tmp_path / 'bench.json'
+    cmd = [sys.executable, '-m', 'athanor', 'bench', '--quick', '--repeat', '1', '--min-time', '0',
+           '--cases', 'estimate', 'propose', '--out', str(out)]
+    p = subprocess.run(cmd, cwd=str(root), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    assert p.returncode == 0, p.stderr
+    data = json.loads(out.read_text(encoding='utf-8'))
+    assert {r['name'] for r in data['results']} == {'estimate', 'propose'}
+    assert all(r['peak_bytes'] > 0 for r in data['results'])
+
+    # A baseline that is impossibly fast must be reported as a regression.
+    for r in data['results']:
+        r['min_s'] /= 100.0
+    fast = tmp_path / 'fast.json'
+    fast.write_text(json.dumps(data), encoding='utf-8')
+    p = subprocess.run(cmd[:-1] + [str(tmp_path / 'again.json'), '--compare', str(fast)],
+                       cwd=str(root), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    assert p.returncode == 1
+    summary = json.loads(p.stdout.strip().splitlines()[-1])
+    assert len(summary['regressions']) == len(data['results'])
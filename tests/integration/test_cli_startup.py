@@ -0,0 +1,60 @@
+import json, subprocess, sys
+from pathlib import Path
+
+import pytest
+
+# Cumulative import time of the CLI module for `athanor --help`. Loading
+# matplotlib alone costs several hundred milliseconds, so this budget only
+# holds while heavy dependencies stay out of the startup path.
+IMPORT_BUDGET_US = 150_000
+HEAVY = ('matplotlib', 'yaml', 'numpy')
+
+
+def _importtime(stderr: str):
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cum, name = line[len('import time:'):].split('|')
+        cumulative[name.strip()] = int(cum)
+    return cumulative
+
+
+def test_help_stays_within_import_budget():
+    p = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'athanor', '--help'],
+                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    assert p.returncode == 0, p.stderr
+    assert '--no-artifacts' in p.stdout
+    cumulative = _importtime(p.stderr)
+    assert not [m for m in cumulative if m.split('.')[0] in HEAVY]
+    assert cumulative['athanor.scripts.cli'] < IMPORT_BUDGET_US, cumulative['athanor.scripts.cli']
+
+
+def test_no_artifacts_run_skips_plotting(tmp_path):
+    cfg = tmp_path / 'tiny.yaml'
+    cfg.write_text(f"generations: 2\npopulation: 4\nsteps_per_candidate: 8\ngenome_dim: 8\n"
+                   f"run:\n  out_dir: {json.dumps(str(tmp_path))}\n", encoding='utf-8')
+    code = ("import sys\nfrom athanor.scripts.cli import main\n"
+            "main(['--config', sys.argv[1], '--no-artifacts'])\n"
+            "print('matplotlib' in sys.modules)")
+    p = subprocess.run([sys.executable, '-c', code, str(cfg)],
+                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    assert p.returncode == 0, p.stderr
+    lines = p.stdout.strip().splitlines()
+    out = json.loads(lines[-2])
+    assert lines[-1] == 'False'
+    assert out['artifacts'] == 'off'
+    run_path = Path(out['run_path'])
+    assert (run_path / 'ledger.jsonl').exists()
+    assert not (run_path / 'dashboard.html').exists()
+    assert not (run_path / 'h7_trace.png').exists()
+
+
+def test_resume_rejects_run_overrides(tmp_path, capsys):
+    from athanor.scripts.cli import main
+
+    for flags in (['--workers', '2'], ['--profile'], ['--no-artifacts']):
+        with pytest.raises(SystemExit) as exc:
+            main(['--resume', str(tmp_path), *flags])
+        assert exc.value.code == 2
+        assert f'{flags[0]} cannot be combined with --resume' in capsys.readouterr().err
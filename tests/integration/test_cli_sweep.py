@@ -0,0 +1,32 @@
+import csv, json, subprocess, sys
+from pathlib import Path
+
+
+def test_cli_sweep_runs_variants_then_skips_them(tmp_path):
+    root = Path(__file__).resolve().parents[2]
+    spec = tmp_path / 'sweep.yaml'
+    spec.write_text(
+        f"base: {json.dumps(str(root / 'configs' / 'toy_experiment.yaml'))}\n"
+        "max_workers: 2\n"
+        f"overrides: {{generations: 2, population: 4, run.out_dir: {json.dumps(str(tmp_path / 'runs'))}}}\n"
+        "grid: {seed: [1, 2], threshold_h7: [0.6, 0.8]}\n",
+        encoding='utf-8')
+    cmd = [sys.executable, '-m', 'athanor', 'sweep', str(spec), '--no-artifacts']
+
+    p = subprocess.run(cmd + ['--summary', str(tmp_path / 'first.csv')],
+                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    assert p.returncode == 0, p.stderr
+    summary = json.loads(p.stdout.strip().splitlines()[-1])
+    assert (summary['variants'], summary['ran'], summary['skipped']) == (4, 4, 0)
+    with open(tmp_path / 'first.csv', 'r', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    assert len({r['run_path'] for r in rows}) == 4
+    assert all(r['mean_H7'] for r in rows)
+
+    p = subprocess.run(cmd + ['--summary', str(tmp_path / 'second.csv')],
+                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    assert p.returncode == 0, p.stderr
+    again = json.loads(p.stdout.strip().splitlines()[-1])
+    assert (again['ran'], again['skipped']) == (0, 4)
+    with open(tmp_path / 'second.csv', 'r', encoding='utf-8') as f:
+        assert sorted(r['run_path'] for r in csv.DictReader(f)) == sorted(r['run_path'] for r in rows)
@@ -0,0 +1,44 @@
+import json
+
+from athanor.evolution.dgm_loop import run
+from athanor.experiments.registry import validate_config
+
+
+def read_rows(run_path):
+    with open(f'{run_path}/ledger.jsonl', 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_early_exit_keeps_first_generation_verdicts(tmp_path):
+    base = {
+        'seed': 3,
+        'population': 8,
+        'generations': 2,
+        'steps_per_candidate': 60,
+        'genome_dim': 12,
+        'threshold_h7': 0.9,
+    }
+    full = read_rows(run(validate_config({**base, 'run': {'out_dir': str(tmp_path / 'full')}}))['run_path'])
+    early_cfg = {**base, 'verify': {'early_exit': True, 'chunk': 4}}
+    early = read_rows(run(validate_config({**early_cfg, 'run': {'out_dir': str(tmp_path / 'early')}}))['run_path'])
+    pooled = run(validate_config({**early_cfg, 'workers': 2, 'run': {'out_dir': str(tmp_path / 'pooled')}}))
+
+    # Later generations may diverge: h7 is reported over the simulated prefix, which feeds selection.
+    first = lambda rows: [(r['id'], r['verdict']) for r in rows if r['gen'] == 0]
+    assert first(early) == first(full)
+    assert not any('steps_simulated' in r for r in full)
+    assert all(1 <= r['steps_simulated'] <= 60 for r in early)
+    assert sum(r['steps_simulated'] for r in early) < 60 * len(full)
+    assert read_rows(pooled['run_path']) == early
+
+
+def test_reduced_and_double_precision_runs(tmp_path):
+    base = {'seed': 5, 'population': 6, 'generations': 2, 'steps_per_candidate': 24, 'genome_dim': 8,
+            'verify': {'early_exit': True, 'chunk': 4}}
+    verdicts = {}
+    for precision in ('float16', 'float32', 'float64'):
+        out = run(validate_config({**base, 'precision': precision, 'run': {'out_dir': str(tmp_path / precision)}}))
+        rows = read_rows(out['run_path'])
+        assert len(rows) == 12
+        verdicts[precision] = [r['verdict'] for r in rows if r['gen'] == 0]
+    assert verdicts['float64'] == verdicts['float32']
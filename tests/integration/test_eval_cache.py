@@ -0,0 +1,31 @@
+import json
+
+from athanor.evolution.dgm_loop import run
+from athanor.experiments.registry import validate_config
+
+
+def read_rows(run_path):
+    with open(f'{run_path}/ledger.jsonl', 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_cached_runs_match_and_reuse_disk_tier(tmp_path):
+    base = {
+        'seed': 5,
+        'population': 7,
+        'generations': 3,
+        'steps_per_candidate': 10,
+        'genome_dim': 12,
+        'threshold_h7': 0.92,
+    }
+    cached = {**base, 'cache': {'enabled': True, 'dir': str(tmp_path / 'cache')}}
+    plain = run(validate_config({**base, 'run': {'out_dir': str(tmp_path / 'plain')}}))
+    first = run(validate_config({**cached, 'run': {'out_dir': str(tmp_path / 'first')}}))
+    second = run(validate_config({**cached, 'workers': 2, 'run': {'out_dir': str(tmp_path / 'second')}}))
+
+    assert read_rows(first['run_path']) == read_rows(plain['run_path'])
+    assert read_rows(second['run_path']) == read_rows(plain['run_path'])
+    assert first['stats']['eval_cache']['misses'] > 0
+    # The replay is served entirely from the on-disk tier, inside the worker processes.
+    assert second['stats']['eval_cache']['misses'] == 0
+    assert second['stats']['eval_cache']['disk_hits'] == first['stats']['eval_cache']['misses']
@@ -0,0 +1,54 @@
+import json
+
+from athanor.evolution.dgm_loop import run
+from athanor.experiments.registry import validate_config
+from athanor.utils.columnar import ColumnarLedger, ledger_columns
+
+
+def _run(tmp_path, processes, **extra):
+    cfg = validate_config({
+        'seed': 4, 'population': 5, 'generations': 5, 'steps_per_candidate': 10, 'genome_dim': 8,
+        'threshold_h7': 0.9, 'artifacts': {'mode': 'off'}, 'ledger': {'format': 'both'},
+        'islands': {'count': 3, 'migrate_every': 2, 'processes': processes, 'topology': 'full'},
+        'run': {'out_dir': str(tmp_path / f'p{processes}')}, **extra,
+    })
+    out = run(cfg)
+    with open(f"{out['run_path']}/ledger.jsonl", 'r', encoding='utf-8') as f:
+        return out, [json.loads(line) for line in f]
+
+
+def test_island_run_is_independent_of_process_count(tmp_path):
+    serial, rows = _run(tmp_path, 1)
+    pooled, pooled_rows = _run(tmp_path, 3)
+    assert rows == pooled_rows
+    assert serial['stats'] == pooled['stats']
+
+    assert len(rows) == 3 * 5 * 5
+    assert sorted({r['island'] for r in rows}) == [0, 1, 2]
+    assert list(ColumnarLedger(f"{serial['run_path']}/ledger.cols").iter_rows()) == rows
+    assert len({r['id'] for r in rows}) == len(rows)
+    stats = serial['stats']
+    assert sum(stats['verdict_counts'].values()) == len(rows)
+    assert stats['filled'] >= max(i['filled'] for i in stats['islands'])
+
+
+def test_island_config_is_validated():
+    try:
+        validate_config({'workers': 2, 'islands': {'count': 2}})
+    except ValueError as exc:
+        assert 'islands.processes' in str(exc)
+    else:
+        raise AssertionError('Expected ValueError for workers with islands')
+    assert validate_config({'workers': 2, 'islands': {'count': 1}})['workers'] == 2
+    for bad in ({'topology': 'star'}, {'count': 0}, {'migrate_every': 0}):
+        try:
+            validate_config({'islands': bad})
+        except ValueError as exc:
+            assert 'islands.' in str(exc)
+        else:
+            raise AssertionError(f'Expected ValueError for {bad}')
+
+
+def test_island_column_only_for_island_runs():
+    assert 'island' not in dict(ledger_columns(validate_config({})))
+    assert 'island' in dict(ledger_columns(validate_config({'islands': {'count': 2}})))
@@ -0,0 +1,66 @@
+import json
+
+import numpy as np
+
+from athanor.core.types import Candidate
+from athanor.evolution.dgm_loop import build_agents, evaluate_children, run
+from athanor.experiments.registry import validate_config
+
+
+def read_rows(run_path):
+    with open(f'{run_path}/ledger.jsonl', 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_worker_pool_matches_serial_run(tmp_path):
+    base = {
+        'seed': 5,
+        'population': 7,
+        'generations': 3,
+        'steps_per_candidate': 10,
+        'genome_dim': 12,
+        'threshold_h7': 0.92,
+    }
+    serial = run(validate_config({**base, 'run': {'out_dir': str(tmp_path / 'serial')}}))
+    pooled = run(validate_config({**base, 'workers': 3, 'run': {'out_dir': str(tmp_path / 'pooled')}}))
+
+    rows_s = read_rows(serial['run_path'])
+    rows_p = read_rows(pooled['run_path'])
+    assert len(rows_s) == 21
+    assert any(r['id'].endswith('_r1') for r in rows_s)
+    assert rows_s == rows_p
+    assert serial['stats']['verdict_counts'] == pooled['stats']['verdict_counts']
+    assert serial['stats']['max_best_f'] == pooled['stats']['max_best_f']
+
+
+def test_refine_rounds_do_not_depend_on_grouping(tmp_path):
+    cfg = validate_config({'seed': 5, 'steps_per_candidate': 10, 'genome_dim': 12, 'threshold_h7': 0.92})
+    agents = build_agents(cfg)
+    rng = np.random.default_rng(0)
+    parent = Candidate(id='p', genome=rng.normal(0.0, 0.5, size=(12,)).astype(np.float32))
+    make = lambda: [agents['proposer'].step(parent, rng=np.random.default_rng(i), child_id=f'g000_c{i:03d}')
+                    for i in range(9)]
+
+    together = evaluate_children(agents, parent, make(), list(range(9)), 0, 5, 2)
+    kids = make()
+    apart = [evaluate_children(agents, parent, [kids[i]], [i], 0, 5, 2)[0] for i in range(9)]
+
+    assert any(c.id.endswith('_r1') or c.id.endswith('_r2') for c in together)
+    assert [(c.id, c.verdict, c.dphi.h7) for c in together] == [(c.id, c.verdict, c.dphi.h7) for c in apart]
+    assert agents['proposer'].sigma == 0.12
+
+
+def test_retention_policies_do_not_change_the_ledger(tmp_path):
+    base = {
+        'seed': 5,
+        'population': 5,
+        'generations': 3,
+        'steps_per_candidate': 10,
+        'genome_dim': 12,
+        'threshold_h7': 0.92,
+    }
+    ledgers = [
+        read_rows(run(validate_config({**base, 'retention': r, 'run': {'out_dir': str(tmp_path / r)}}))['run_path'])
+        for r in ('full', 'summary', 'none')
+    ]
+    assert ledgers[0] == ledgers[1] == ledgers[2]
@@ -0,0 +1,28 @@
+import json
+
+from athanor.evolution.dgm_loop import run
+from athanor.experiments.registry import validate_config
+
+
+def test_profiled_run_records_stages_and_retries(tmp_path):
+    cfg = validate_config({
+        'seed': 5, 'population': 7, 'generations': 3, 'steps_per_candidate': 10, 'genome_dim': 12,
+        'threshold_h7': 0.92, 'profile': {'enabled': True},
+        'run': {'out_dir': str(tmp_path)},
+    })
+    out = run(cfg)
+    with open(f"{out['run_path']}/metrics.jsonl", 'r', encoding='utf-8') as f:
+        metrics = [json.loads(line) for line in f]
+    with open(f"{out['run_path']}/ledger.jsonl", 'r', encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+
+    gens = [m for m in metrics if m['gen'] is not None]
+    assert [m['gen'] for m in gens] == [0, 1, 2]
+    assert {'propose', 'telemetry', 'verify', 'refine', 'select', 'archive', 'ledger'} <= set(gens[0]['stages'])
+    refined = sum(m['counters'].get('refined', 0) for m in gens)
+    retries = sum(m['counters'].get('refine_retries', 0) for m in gens)
+    assert refined == sum(1 for r in rows if '_r' in r['id']) > 0
+    assert retries >= refined
+    assert 'artifacts' in metrics[-1]['stages']
+    with open(f"{out['run_path']}/metrics.prom", 'r', encoding='utf-8') as f:
+        assert f.read().endswith('# EOF\n')
@@ -0,0 +1,48 @@
+import json
+
+from athanor.core.coherence import ROBUSTNESS_FIELDS
+from athanor.evolution.dgm_loop import run
+from athanor.experiments.registry import validate_config
+from athanor.utils.columnar import ColumnarLedger
+
+
+def read_rows(run_path):
+    with open(f'{run_path}/ledger.jsonl', 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_robustness_stage_logs_quantiles_and_gates(tmp_path):
+    base = {
+        'seed': 2,
+        'population': 8,
+        'generations': 3,
+        'steps_per_candidate': 20,
+        'genome_dim': 8,
+        'threshold_h7': 0.6,
+        'ledger': {'format': 'both'},
+    }
+    robust = {'samples': 256, 'sigma': 0.3}
+    plain_path = run(validate_config({**base, 'run': {'out_dir': str(tmp_path / 'plain')}}))['run_path']
+    plain = read_rows(plain_path)
+    logged = run(validate_config({**base, 'verify': {'robustness': robust}, 'run': {'out_dir': str(tmp_path / 'a')}}))
+    rows = read_rows(logged['run_path'])
+
+    assert all(set(ROBUSTNESS_FIELDS) <= set(r) for r in rows)
+    assert not any(set(ROBUSTNESS_FIELDS) & set(r) for r in plain)
+    # Without a floor the stage only reports: verdicts and lineage are unchanged.
+    assert [(r['id'], r['verdict']) for r in rows] == [(r['id'], r['verdict']) for r in plain]
+    cols = ColumnarLedger(f"{logged['run_path']}/ledger.cols")
+    assert list(cols.iter_rows()) == rows
+    # Runs without the stage have no robustness columns, so their export matches ledger.jsonl too.
+    plain_cols = ColumnarLedger(f"{plain_path}/ledger.cols")
+    assert not any(f in plain_cols for f in ROBUSTNESS_FIELDS)
+    assert list(plain_cols.iter_rows()) == plain
+
+    pooled = run(validate_config({**base, 'workers': 2, 'verify': {'robustness': robust},
+                                  'run': {'out_dir': str(tmp_path / 'b')}}))
+    assert read_rows(pooled['run_path']) == rows
+
+    gated = read_rows(run(validate_config({**base, 'verify': {'robustness': {**robust, 'floor': 1.0}},
+                                           'run': {'out_dir': str(tmp_path / 'c')}}))['run_path'])
+    assert not any(r['verdict'] == 'APPROVE' for r in gated)
+    assert any(r['reason'] == 'robustness below floor' for r in gated)
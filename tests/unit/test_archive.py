@@ -0,0 +1,150 @@
+import numpy as np
+
+from athanor.core.types import Candidate, DeltaPhiEstimate
+from athanor.evolution.archive import (DenseMapElitesArchive, MapElitesArchive, load_archive, save_archive, shard_bounds,
+                                      tree_merge, union_archives)
+
+
+def make_cand(i, h7, dn, f):
+    c = Candidate(id=f'c{i}', genome=np.zeros((2,), dtype=np.float32))
+    c.dphi = DeltaPhiEstimate(dphi=np.zeros(0), coherence=np.zeros(0), h7=h7, summary={})
+    c.tags['delta_norm'] = dn
+    c.score_f = f
+    c.verdict = 'APPROVE'
+    return c
+
+
+def test_dense_archive_matches_dict_archive():
+    rng = np.random.default_rng(0)
+    ref = MapElitesArchive(bins=(4, 5))
+    dense = DenseMapElitesArchive(bins=(4, 5))
+    for i in range(200):
+        c = make_cand(i, float(rng.uniform(-0.1, 1.1)), float(rng.uniform(0, 1.2)), float(rng.normal()))
+        assert ref.add(c) == dense.add(c)
+
+    for (i, j), cell in ref.cells.items():
+        flat = i * 5 + j
+        assert dense.filled[flat]
+        assert dense.best_f[flat] == cell.best_f
+        assert dense.label(dense.best_id[flat]) == cell.best_id
+    assert len(dense) == len(ref.cells)
+    assert len(dense._labels) == len(ref.cells)
+
+    s_ref, s_dense = ref.stats(), dense.stats()
+    assert s_dense['filled'] == s_ref['filled']
+    assert abs(s_dense['mean_best_f'] - s_ref['mean_best_f']) < 1e-5
+    assert abs(s_dense['max_best_f'] - s_ref['max_best_f']) < 1e-6
+
+
+def test_dense_add_candidates_matches_sequential_adds():
+    rng = np.random.default_rng(2)
+    cands = [make_cand(i, float(rng.uniform(0, 1)), float(rng.uniform(0, 1)), float(rng.normal()))
+             for i in range(60)]
+    one, batched = DenseMapElitesArchive(bins=(3, 3)), DenseMapElitesArchive(bins=(3, 3))
+    seq = [one.add(c) for c in cands[:30]] + [one.add(c) for c in cands[30:]]
+    ok = np.concatenate([batched.add_candidates(cands[:30]), batched.add_candidates(cands[30:])])
+    np.testing.assert_array_equal(batched.best_f, one.best_f)
+    assert [batched.label(i) for i in batched.best_id[batched.filled]] == \
+        [one.label(i) for i in one.best_id[one.filled]]
+    assert batched.stats() == one.stats()
+    # Only each improved cell's in-batch winner counts as admitted.
+    assert ok.sum() <= sum(seq) and set(np.flatnonzero(ok)) <= set(np.flatnonzero(seq))
+
+
+def test_dense_archive_places_candidates_on_any_number_of_axes():
+    c = make_cand(0, 0.9, 0.2, 1.0)
+    c.dphi.summary.update({'h7_cusp': 0.6, 'h7_weighted': 0.3})
+    arch = DenseMapElitesArchive(bins=(10, 10, 10, 10))
+    assert arch.add(c)
+    assert np.unravel_index(int(np.flatnonzero(arch.filled)[0]), arch.bins) == (9, 2, 6, 3)
+    flat = DenseMapElitesArchive(bins=(5,))
+    assert flat.add(c) and flat.filled.tolist() == [False] * 4 + [True]
+
+
+def test_dense_add_batch_resolves_collisions_by_argmax():
+    arch = DenseMapElitesArchive(bins=(2, 2, 3), ranges=[(0, 1), (0, 1), (-1, 1)])
+    desc = np.array([[0.1, 0.1, 0.0], [0.2, 0.3, 0.1], [0.9, 0.9, 0.9], [0.2, 0.2, 0.2]])
+    admitted = arch.add_batch(desc, [1.0, 3.0, 2.0, 3.0], ids=[10, 11, 12, 13])
+    assert admitted.tolist() == [False, True, True, False]
+    assert arch.stats() == {'filled': 2, 'mean_best_f': 2.5, 'max_best_f': 3.0, 'qd_score': 5.0}
+
+    admitted = arch.add_batch(desc[:1], [5.0], ids=[14])
+    assert admitted.tolist() == [True]
+    assert arch.best_id[arch.cells(desc[:1])[0]] == 14
+    assert arch.stats()['qd_score'] == 7.0
+    assert arch.grid().shape == (2, 2, 3)
+
+
+def test_dense_archive_million_cells_stays_compact():
+    arch = DenseMapElitesArchive(bins=(1000, 1000))
+    nbytes = arch.best_f.nbytes + arch.filled.nbytes + arch.best_id.nbytes + arch.verdict.nbytes
+    nbytes += sum(col.nbytes for col in arch.meta.values())
+    assert nbytes < 40 * 1024 * 1024
+
+    rng = np.random.default_rng(1)
+    arch.add_batch(rng.uniform(0, 1, size=(50000, 2)), rng.normal(size=50000))
+    assert arch.stats()['filled'] == int(arch.filled.sum())
+    assert abs(arch.stats()['qd_score'] - float(arch.best_f[arch.filled].sum())) < 1e-6
+
+
+def _cells(arch):
+    if isinstance(arch, MapElitesArchive):
+        return {k: (v.best_id, v.best_f) for k, v in arch.cells.items()}
+    return {int(c): (arch.label(arch.best_id[c]), float(arch.best_f[c])) for c in np.flatnonzero(arch.filled)}
+
+
+def test_merge_is_order_independent_and_matches_sequential_add():
+    rng = np.random.default_rng(1)
+    cands = [make_cand(i, float(rng.uniform(0, 1)), float(rng.uniform(0, 1)), float(rng.normal())) for i in range(90)]
+    for cls in (MapElitesArchive, DenseMapElitesArchive):
+        parts = [cls(bins=(4, 4)) for _ in range(3)]
+        whole = cls(bins=(4, 4))
+        for i, c in enumerate(cands):
+            parts[i % 3].add(c)
+            whole.add(c)
+        ab_c = tree_merge([tree_merge(parts[:2]), parts[2]])
+        a_bc = tree_merge([parts[0], tree_merge(parts[1:])])
+        reverse = tree_merge(parts[::-1])
+        assert _cells(ab_c) == _cells(a_bc) == _cells(reverse) == _cells(whole)
+        assert abs(ab_c.stats()['mean_best_f'] - whole.stats()['mean_best_f']) < 1e-9
+        assert _cells(parts[0]) != _cells(whole)  # inputs are left untouched
+
+
+def test_merge_breaks_fitness_ties_by_smaller_id():
+    for cls in (MapElitesArchive, DenseMapElitesArchive):
+        a, b = cls(bins=(2, 2)), cls(bins=(2, 2))
+        a.add(make_cand('b', 0.1, 0.1, 1.0))
+        b.add(make_cand('a', 0.1, 0.1, 1.0))
+        assert list(_cells(tree_merge([a, b])).values()) == [('ca', 1.0)]
+        assert list(_cells(tree_merge([b, a])).values()) == [('ca', 1.0)]
+
+
+def test_shards_partition_cells_and_merge_back():
+    rng = np.random.default_rng(2)
+    for cls in (MapElitesArchive, DenseMapElitesArchive):
+        arch = cls(bins=(6, 5))
+        for i in range(120):
+            arch.add(make_cand(i, float(rng.uniform(0, 1)), float(rng.uniform(0, 1)), float(rng.normal())))
+        shards = arch.shard(4, axis=0)
+        assert sum(s.stats()['filled'] for s in shards) == arch.stats()['filled']
+        assert all(not (_cells(a).keys() & _cells(b).keys()) for a, b in zip(shards, shards[1:]))
+        back = tree_merge(shards)
+        assert _cells(back) == _cells(arch)
+        assert abs(back.stats()['mean_best_f'] - arch.stats()['mean_best_f']) < 1e-9
+    assert shard_bounds(6, 4) == [(0, 2), (2, 3), (3, 4), (4, 6)]
+
+
+def test_saved_archives_union_streams_from_disk(tmp_path):
+    rng = np.random.default_rng(3)
+    for cls in (MapElitesArchive, DenseMapElitesArchive):
+        parts, paths = [], []
+        for k in range(3):
+            arch = cls(bins=(4, 4))
+            for i in range(30):
+                arch.add(make_cand(f'{k}_{i}', float(rng.uniform(0, 1)), float(rng.uniform(0, 1)), float(rng.normal())))
+            path = str(tmp_path / f'{cls.__name__}_{k}.npz')
+            save_archive(path, arch)
+            parts.append(arch)
+            paths.append(path)
+        assert _cells(load_archive(paths[0])) == _cells(parts[0])
+        assert _cells(union_archives(paths)) == _cells(tree_merge(parts))
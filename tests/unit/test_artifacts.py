@@ -0,0 +1,32 @@
+import json
+
+import numpy as np
+
+from athanor.utils.visualization import aggregate_by_generation, plot_series, read_ledger
+
+
+def test_aggregate_by_generation_groups_rows():
+    gen = np.array([0, 0, 1, 1, 1, 2])
+    y = np.array([1.0, 3.0, 2.0, 4.0, 6.0, 5.0])
+    x, mean, lo, hi = aggregate_by_generation(gen, y)
+    assert x.tolist() == [0, 1, 2]
+    assert np.allclose(mean, [2.0, 4.0, 5.0])
+    assert lo.tolist() == [1.0, 2.0, 5.0]
+    assert hi.tolist() == [3.0, 6.0, 5.0]
+
+
+def test_read_ledger_returns_columns_and_last_row(tmp_path):
+    path = tmp_path / 'ledger.jsonl'
+    rows = [{'gen': g, 'id': f'c{g}', 'h7': 0.1 * g, 'f': float(g)} for g in range(4)]
+    path.write_text(''.join(json.dumps(r) + '\n' for r in rows), encoding='utf-8')
+    cols, last = read_ledger(str(path), ('gen', 'h7', 'f'))
+    assert cols['f'].tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert last['id'] == 'c3'
+
+
+def test_plot_series_aggregates_large_ledgers(tmp_path):
+    gen = np.repeat(np.arange(50), 40)
+    y = np.random.default_rng(0).random(gen.size)
+    out = tmp_path / 'trace.png'
+    plot_series(y, str(out), 'trace', 'y', gen=gen, threshold=0.5, max_points=100)
+    assert out.stat().st_size > 0
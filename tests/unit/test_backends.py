@@ -0,0 +1,112 @@
+import logging
+
+import numpy as np
+import pytest
+
+import athanor.backends as backends
+from athanor.agents import TelemetryAgent, VerifierAgent
+from athanor.backends import NumpyBackend, available_backends, backend_names, get_backend
+from athanor.backends.numba_backend import NumbaBackend
+from athanor.core.coherence import estimate_batch
+from athanor.core.telemetry import capture_trajectory_batch
+from athanor.core.types import Candidate
+from athanor.evolution.dgm_loop import evaluate, evaluation_path
+from athanor.experiments.registry import validate_config
+
+SUMMARY_KEYS = ('dphi_mean', 'dphi_std', 'C_mean', 'C_std', 'h7', 'h7_weighted', 'h7_cusp', 'kappa_bound')
+
+
+def all_backends():
+    # The compiled kernels run interpreted when numba is missing, so their logic is checked either way.
+    return [NumpyBackend(), NumbaBackend()] + [get_backend(n) for n in available_backends() if n not in ('numpy', 'numba')]
+
+
+def genomes(P, D, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0.0, rng.uniform(0.1, 3.0), size=(P, D)).astype(np.float32)
+
+
+@pytest.mark.parametrize('backend', all_backends(), ids=lambda b: b.name)
+def test_trajectories_match_reference(backend):
+    G, seeds = genomes(4, 8), [3, 5, 7, 11]
+    ref = capture_trajectory_batch(G, seeds, steps=10, noise=0.02)
+    got = backend.capture_trajectory_batch(G, seeds, steps=10, noise=0.02)
+    assert got.traj.shape == ref.traj.shape and got.traj.dtype == np.float32
+    np.testing.assert_allclose(got.traj, ref.traj, rtol=1e-5, atol=1e-6)
+    assert got.meta['seeds'] == ref.meta['seeds']
+
+
+@pytest.mark.parametrize('backend', all_backends(), ids=lambda b: b.name)
+@pytest.mark.parametrize('mode', ['l2', 'cosine'])
+def test_estimates_match_reference(backend, mode):
+    traj = capture_trajectory_batch(genomes(4, 8, seed=1), [0, 1, 2, 3], steps=10, noise=0.05).traj
+    ref = estimate_batch(traj, threshold=0.9, mode=mode)
+    got = backend.estimate_batch(traj, threshold=0.9, mode=mode)
+    np.testing.assert_allclose(backend.delta_phi_batch(traj, mode=mode), np.stack([e.dphi for e in ref]),
+                               rtol=1e-5, atol=1e-6)
+    for r, e in zip(ref, got):
+        np.testing.assert_allclose(e.coherence, r.coherence, rtol=1e-5, atol=1e-6)
+        assert e.h7 == r.h7
+        assert list(e.summary) == list(r.summary)
+        for k in SUMMARY_KEYS:
+            assert e.summary[k] == pytest.approx(r.summary[k], rel=1e-5, abs=1e-6)
+
+
+def test_numba_summary_std_survives_low_variance():
+    # Values a few float32 ulps apart around 1e4: E[x^2] - mean^2 cancels, the two-pass std does not.
+    ulps = np.random.default_rng(1).integers(-2, 3, size=(2, 500))
+    d = (1e4 + ulps * np.spacing(np.float32(1e4))).astype(np.float32)
+    C = (1.0 / (1.0 + d)).astype(np.float32)
+    for row, est in zip(d, NumbaBackend._estimates(d, C, 0.5, 'l2')):
+        assert est.summary['dphi_std'] == pytest.approx(float(row.astype(np.float64).std()), rel=1e-9)
+
+
+@pytest.mark.parametrize('backend', all_backends(), ids=lambda b: b.name)
+def test_fused_pass_matches_separate_stages(backend):
+    G, seeds = genomes(3, 8, seed=2), [4, 5, 6]
+    batch, ests = backend.capture_and_estimate(G, seeds, steps=9, noise=0.02, threshold=0.95, mode='l2')
+    ref = backend.estimate_batch(backend.capture_trajectory_batch(G, seeds, steps=9, noise=0.02).traj, threshold=0.95)
+    np.testing.assert_array_equal(batch.traj, backend.capture_trajectory_batch(G, seeds, steps=9, noise=0.02).traj)
+    for r, e in zip(ref, ests):
+        np.testing.assert_array_equal(e.dphi, r.dphi)
+        assert e.summary == r.summary
+
+
+def test_registry_names_and_fallback(monkeypatch, caplog):
+    assert isinstance(get_backend('symbolic'), NumpyBackend)
+    assert {'numpy', 'numba', 'symbolic'} <= set(backend_names())
+    with pytest.raises(ValueError):
+        get_backend('cuda')
+    with pytest.raises(ValueError):
+        validate_config({'backend': 'cuda'})
+    assert validate_config({'backend': 'NumPy'})['backend'] == 'numpy'
+
+    import athanor.backends.numba_backend as nb
+    monkeypatch.setattr(nb, 'NUMBA_AVAILABLE', False)
+    with caplog.at_level(logging.WARNING, logger='athanor.backends'):
+        b = get_backend('numba')
+    assert type(b) is NumpyBackend and 'numba is not installed' in caplog.text
+
+
+def test_register_backend_rejects_non_backends(monkeypatch):
+    monkeypatch.setattr(backends, 'BACKENDS', dict(backends.BACKENDS))
+    with pytest.raises(ValueError):
+        backends.register_backend('bogus', object)
+    backends.register_backend('copy', NumpyBackend)
+    assert isinstance(get_backend('copy'), NumpyBackend)
+
+
+def test_loop_uses_fused_path_with_same_verdicts():
+    def children():
+        return [Candidate(id=f'c{i}', genome=g) for i, g in enumerate(genomes(6, 8, seed=3))]
+
+    seeds = list(range(6))
+    ref = evaluate(TelemetryAgent(steps=12, noise=0.02, seed=0), VerifierAgent(threshold_h7=0.9), children(), seeds)
+
+    fused = NumbaBackend()
+    telemetry = TelemetryAgent(steps=12, noise=0.02, seed=0, backend=fused)
+    verifier = VerifierAgent(threshold_h7=0.9, backend=fused)
+    assert evaluation_path(telemetry, verifier) == 'fused'
+    out = evaluate(telemetry, verifier, children(), seeds)
+    assert [c.verdict for c in out] == [c.verdict for c in ref]
+    assert all(c.telemetry.traj.shape == (12, 8) for c in out)
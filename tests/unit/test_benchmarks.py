@@ -0,0 +1,33 @@
+from athanor.benchmarks import compare_results, measure, run_suite, scaling_exponents
+
+
+def record(key, min_s, peak, name='k', params=None):
+    return {'key': key, 'name': name, 'params': params or {}, 'min_s': min_s, 'peak_bytes': peak}
+
+
+def test_measure_reports_time_and_peak_memory():
+    import numpy as np
+    out = measure(lambda: np.ones(1 << 16), repeat=2, min_time=0.0)
+    assert out['repeat'] == 2 and out['number'] >= 1
+    assert 0.0 < out['min_s'] <= out['median_s']
+    assert out['peak_bytes'] >= 8 * (1 << 16)
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    base = {'results': [record('a', 1.0, 100), record('b', 1.0, 100), record('c', 1.0, 100), record('d', 1.0, 100)]}
+    cur = {'results': [record('a', 1.05, 100), record('b', 1.5, 100), record('c', 0.5, 100),
+                       record('d', 1.0, 200), record('e', 1.0, 1)]}
+    status = {r['key']: r['status'] for r in compare_results(cur, base, tolerance=0.10)}
+    assert status == {'a': 'ok', 'b': 'regression', 'c': 'improvement', 'd': 'regression', 'e': 'new'}
+
+
+def test_scaling_exponents_recover_power_law():
+    rows = [record(f'x{n}', 1e-6 * n ** 2, 0, name='quad', params={'n': n, 'm': m}) for n in (8, 16, 32) for m in (1, 2)]
+    slopes = scaling_exponents({'results': rows})
+    assert abs(slopes['quad']['n'] - 2.0) < 1e-9
+
+
+def test_run_suite_quick_case():
+    out = run_suite(cases=['archive_add'], quick=True, repeat=1, min_time=0.0)
+    assert [r['params']['population'] for r in out['results']] == [4, 16]
+    assert out['meta']['quick'] is True
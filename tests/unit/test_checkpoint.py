@@ -0,0 +1,49 @@
+import numpy as np
+
+from athanor.core.types import Candidate, DeltaPhiEstimate
+from athanor.evolution.archive import DenseMapElitesArchive, MapElitesArchive, archive_from_arrays
+from athanor.evolution.checkpoint import Checkpointer, load_checkpoint, save_checkpoint
+
+
+def make_cand(i, h7, dn, f):
+    c = Candidate(id=f'c{i}', genome=np.zeros((2,), dtype=np.float32))
+    c.dphi = DeltaPhiEstimate(dphi=np.zeros(0), coherence=np.zeros(0), h7=h7, summary={})
+    c.tags['delta_norm'] = dn
+    c.score_f = f
+    c.verdict = 'APPROVE'
+    return c
+
+
+def test_checkpoint_round_trip(tmp_path):
+    rng = np.random.default_rng(3)
+    rng.normal(size=5)
+    state = {'generation': 4, 'rng': rng.bit_generator.state, 'counts': {'APPROVE': 2}}
+    path = str(tmp_path / 'checkpoint.npz')
+    save_checkpoint(path, state, {'genome': np.arange(6, dtype=np.float32)})
+
+    loaded, arrays = load_checkpoint(path)
+    assert loaded['generation'] == 4 and loaded['counts'] == {'APPROVE': 2}
+    assert arrays['genome'].dtype == np.float32
+    restored = np.random.default_rng()
+    restored.bit_generator.state = loaded['rng']
+    assert np.array_equal(restored.normal(size=3), rng.normal(size=3))
+
+
+def test_archives_round_trip_through_arrays():
+    rng = np.random.default_rng(1)
+    for arch in (MapElitesArchive(bins=(4, 4)), DenseMapElitesArchive(bins=(4, 4))):
+        for i in range(50):
+            arch.add(make_cand(i, float(rng.uniform()), float(rng.uniform()), float(rng.normal())))
+        back = archive_from_arrays(arch.to_arrays())
+        assert type(back) is type(arch)
+        assert back.stats() == arch.stats()
+        c = make_cand(99, 0.5, 0.5, 10.0)
+        assert back.add(c) == arch.add(c)
+        assert back.stats() == arch.stats()
+
+
+def test_checkpointer_due_every():
+    ck = Checkpointer('.', every=3)
+    assert ck.enabled
+    assert [g for g in range(1, 10) if ck.due(g)] == [3, 6, 9]
+    assert not Checkpointer('.').enabled
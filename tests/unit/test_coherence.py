@@ -1,5 +1,7 @@
 import numpy as np
 from athanor.core.coherence import (
+    estimate,
+    estimate_batch,
     delta_phi,
     coherence_from_dphi,
     h7_horizon,
@@ -9,9 +11,15 @@ from athanor.core.coherence import (
     immunity_index,
     basin_drift,
     inject_bounded_noise,
+    robustness_ensemble,
+    robustness_summary,
+    robustness_summaries,
     boundary_excess,
     commensurability_suppression_score,
+    commensurability_suppression_scores,
+    boundary_invariant_scores,
     select_boundary_invariant,
+    top_k_boundary_invariants,
 )
 
 def test_delta_phi_l2_basic():
@@ -55,6 +63,25 @@ def test_h20_noise_immunity_helpers():
     assert isinstance(b20, float)
     assert 0.0 <= kappa <= 1.0
 
+def test_robustness_ensemble_matches_per_draw_helpers():
+    d = np.abs(np.random.default_rng(2).normal(0.0, 0.3, size=(40,))).astype(np.float32)
+    c = coherence_from_dphi(d)
+    immunity, drift = robustness_ensemble(d, sigma=0.05, samples=64, rng=np.random.default_rng(9))
+    assert immunity.shape == drift.shape == (64,)
+
+    rng = np.random.default_rng(9)
+    for k in range(64):
+        c_pert = coherence_from_dphi(inject_bounded_noise(d, sigma=0.05, rng=rng))
+        assert abs(immunity[k] - immunity_index(c, c_pert)) < 1e-6
+        assert abs(drift[k] - basin_drift(c, c_pert)) < 1e-6
+
+    s = robustness_summary(immunity, drift)
+    assert s['drift_q05'] <= s['drift_q50'] <= s['drift_q95']
+    assert 0.0 <= s['immunity_q05'] <= s['immunity_q50'] <= 1.0
+    assert robustness_ensemble(d[:0], sigma=0.05, samples=8)[0].tolist() == [0.0] * 8
+    stacked = robustness_summaries(np.stack([immunity, immunity[::-1]]), np.stack([drift, -drift]))
+    assert stacked[0] == s and stacked[1]['immunity_q05'] == s['immunity_q05']
+
 def test_h44_boundary_algebra_helpers():
     assert abs(boundary_excess(1.7, 1.0) - 0.7) < 1e-9
 
@@ -73,3 +100,64 @@ def test_noise_seed_reproducible():
     a = inject_bounded_noise(d, sigma=0.1, seed=11)
     b = inject_bounded_noise(d, sigma=0.1, seed=11)
     assert np.allclose(a, b)
+
+
+def test_estimate_batch_matches_estimate():
+    traj = np.random.default_rng(2).normal(0.0, 0.3, size=(5, 12, 8)).astype(np.float32)
+    traj[0] *= 0.01
+    for mode in ("l2", "cosine"):
+        batch = estimate_batch(traj, threshold=0.7, mode=mode)
+        assert len(batch) == 5
+        for k, est in enumerate(batch):
+            ref = estimate(traj[k], threshold=0.7, mode=mode)
+            np.testing.assert_array_equal(est.dphi, ref.dphi)
+            assert est.h7 == ref.h7
+            assert est.summary == ref.summary
+
+
+def test_multi_mode_estimate_matches_single_mode():
+    traj = np.random.default_rng(4).normal(0.0, 0.3, size=(3, 20, 8)).astype(np.float32)
+    for thr in (0.3, 0.8):
+        both = estimate(traj[0], threshold=thr, modes=("cosine", "l2", "cosine"))
+        batch = estimate_batch(traj, threshold=thr, modes=("l2", "cosine"))
+        assert list(both) == ["cosine", "l2"] and list(batch) == ["l2", "cosine"]
+        for mode in ("l2", "cosine"):
+            ref = estimate(traj[0], threshold=thr, mode=mode)
+            np.testing.assert_array_equal(both[mode].dphi, ref.dphi)
+            assert both[mode].summary == ref.summary
+            assert [e.summary for e in batch[mode]] == [e.summary for e in estimate_batch(traj, thr, mode)]
+            C = ref.coherence
+            assert ref.h7 == h7_horizon(C, thr)
+            assert ref.summary["h7_weighted"] == weighted_coherence_mean(C)
+            assert ref.summary["h7_cusp"] == cusp_limited_h7(C, thr, survival_floor=0.5)
+            assert ref.summary["dphi_std"] == float(ref.dphi.std())
+            assert ref.summary["C_mean"] == float(C.mean())
+
+
+def test_vectorized_suppression_matches_scalar():
+    rng = np.random.default_rng(0)
+    vals = np.concatenate([
+        rng.uniform(-4.0, 4.0, 500),
+        rng.integers(-9, 9, 40) / rng.integers(1, 80, 40),
+        [0.0, 1.0, -1.0, 0.5, (1.0 + np.sqrt(5.0)) / 2.0, np.pi, 1e-9, 1.0 / 3.0],
+    ])
+    for m in (1, 2, 7, 64, 251):
+        ref = np.array([commensurability_suppression_score(float(v), max_denominator=m) for v in vals])
+        got = commensurability_suppression_scores(vals, max_denominator=m, chunk=97)
+        assert np.array_equal(got, ref), m
+    assert np.isnan(commensurability_suppression_scores([np.inf, np.nan])).all()
+
+
+def test_top_k_boundary_invariants_orders_and_matches_selector():
+    rng = np.random.default_rng(4)
+    cands = np.concatenate([rng.uniform(1.0, 2.2, 300), [1.5, 1.5]])
+    best = select_boundary_invariant(list(cands), degree=2, suppression_weight=0.5)
+    top = top_k_boundary_invariants(cands, k=5, degree=2, suppression_weight=0.5, chunk=64)
+
+    assert len(top["selected"]) == 5
+    assert top["selected"][0] == best["selected"]
+    assert abs(top["scores"][0] - best["score"]) < 1e-12
+    assert top["scores"] == sorted(top["scores"], reverse=True)
+
+    scores = boundary_invariant_scores(cands, degree=2, suppression_weight=0.5)
+    assert top["indices"] == [int(i) for i in np.argsort(-scores, kind="stable")[:5]]
@@ -0,0 +1,65 @@
+import json
+
+import numpy as np
+
+from athanor.utils.columnar import LEDGER_COLUMNS, ColumnarLedger, ColumnarLedgerWriter, ledger_columns
+
+
+def make_row(i):
+    return {
+        'gen': i // 3, 'idx': i % 3, 'id': f'g{i // 3:03d}_c{i % 3:03d}',
+        'verdict': ['APPROVE', 'REFINE', 'REJECT'][i % 3], 'reason': 'r' + str(i % 2),
+        'h7': i / 10.0, 'h7_weighted': 0.5, 'h7_cusp': 0.25, 'kappa_bound': 0.1,
+        'q': 1.0 / (1.0 + i), 'f': 0.3 * i, 'admitted': bool(i % 2),
+        'dphi_mean': 0.01 * i, 'C_mean': 0.9, 'delta_norm': 0.5,
+    }
+
+
+def test_columnar_roundtrip_and_jsonl_export(tmp_path):
+    path = tmp_path / 'ledger.cols'
+    rows = [make_row(i) for i in range(7)]
+    with ColumnarLedgerWriter(str(path)) as w:
+        for r in rows[:4]:
+            w.write(r)
+        w.sync()
+        for r in rows[4:]:
+            w.write(r)
+
+    led = ColumnarLedger(str(path))
+    assert len(led) == 7
+    assert isinstance(led['h7'], np.memmap)
+    assert np.allclose(led['f'], [r['f'] for r in rows])
+    assert list(led.decode('verdict')) == [r['verdict'] for r in rows]
+    assert led.row(-1) == rows[-1]
+    assert list(led.iter_rows(chunk=3)) == rows
+
+    out = tmp_path / 'export.jsonl'
+    assert led.to_jsonl(str(out)) == 7
+    assert out.read_text().splitlines() == [json.dumps(r) for r in rows]
+
+
+def test_columnar_writer_drops_uncommitted_tail(tmp_path):
+    path = tmp_path / 'ledger.cols'
+    w = ColumnarLedgerWriter(str(path))
+    for i in range(3):
+        w.write(make_row(i))
+    w.sync()
+    w.write(make_row(3))
+    w.flush()  # bytes on disk but row count never committed
+    for f in w._files.values():
+        f.close()
+
+    w2 = ColumnarLedgerWriter(str(path))
+    w2.write(make_row(9))
+    w2.close()
+    led = ColumnarLedger(str(path))
+    assert list(led['idx']) == [0, 1, 2, 0]
+    assert led.row(3)['id'] == 'g003_c000'
+
+
+def test_ledger_columns_add_optional_groups_only_when_enabled():
+    assert ledger_columns({}) == LEDGER_COLUMNS
+    names = lambda cfg: [n for n, _ in ledger_columns(cfg)][len(LEDGER_COLUMNS):]
+    assert names({'verify': {'early_exit': True}}) == ['steps_simulated']
+    assert names({'verify': {'early_exit': False, 'robustness': {'samples': 0}}}) == []
+    assert names({'verify': {'robustness': {'samples': 4}}})[0] == 'immunity_mean'
@@ -0,0 +1,43 @@
+import numpy as np
+
+from athanor.agents import EvaluationCache, TelemetryAgent, VerifierAgent, evaluation_key
+from athanor.core.types import DeltaPhiEstimate
+
+
+def make_est(h7):
+    return DeltaPhiEstimate(dphi=np.ones(5, dtype=np.float32), coherence=np.ones(5, dtype=np.float32),
+                            h7=h7, summary={'h7': h7, 'C_mean': 0.8})
+
+
+def test_key_covers_every_evaluation_input():
+    g = np.arange(4, dtype=np.float32)
+    tel, ver = TelemetryAgent(steps=24, noise=0.02, seed=0), VerifierAgent(threshold_h7=0.7)
+    base = evaluation_key(g, 1, tel, ver)
+    assert base == evaluation_key(g.astype(np.float64), 1, tel, ver)
+    assert base != evaluation_key(g + 1e-6, 1, tel, ver)
+    assert base != evaluation_key(g, 2, tel, ver)
+    assert base != evaluation_key(g, 1, TelemetryAgent(steps=25, noise=0.02, seed=0), ver)
+    assert base != evaluation_key(g, 1, tel, VerifierAgent(threshold_h7=0.8))
+    assert base != evaluation_key(g, 1, tel, VerifierAgent(threshold_h7=0.7, dphi_mode='cosine'))
+    assert base != evaluation_key(g, 1, tel, ver, path='serial')
+
+
+def test_lru_respects_byte_budget_and_counts():
+    cache = EvaluationCache(max_bytes=2000)
+    for i in range(20):
+        cache.put(f'k{i}', make_est(i / 20))
+    assert cache.bytes <= 2000 and cache.evictions > 0
+    assert cache.get('k0') is None
+    hit = cache.get('k19')
+    assert hit.h7 == 19 / 20 and hit.summary['C_mean'] == 0.8
+    assert hit.dphi.size == 0 and hit.coherence.size == 0
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_disk_tier_is_shared_between_instances(tmp_path):
+    a = EvaluationCache(directory=str(tmp_path))
+    a.put('ab' * 32, make_est(0.25))
+    b = EvaluationCache(directory=str(tmp_path))
+    assert b.get('ab' * 32).h7 == 0.25
+    assert b.get('ab' * 32).h7 == 0.25
+    assert (b.disk_hits, b.hits, b.misses) == (1, 1, 0)
@@ -0,0 +1,34 @@
+import numpy as np
+
+from athanor.evolution import archive as archive_mod
+from athanor.evolution.islands import fully_connected, init_island, migrate, ring, run_epoch
+from athanor.experiments.registry import validate_config
+
+
+def test_topologies():
+    assert [ring(k, 4) for k in range(4)] == [[3], [0], [1], [2]]
+    assert fully_connected(1, 3) == [0, 2]
+    assert ring(0, 1) == [] and fully_connected(0, 1) == []
+
+
+def test_migrate_adopts_strictly_better_elites_from_pre_exchange_state():
+    states = [{'parent': {'id': f'p{k}', 'score_f': f, 'genome': np.full(2, k, dtype=np.float32)}}
+              for k, f in enumerate([0.5, 0.9, 0.2])]
+    assert migrate(states, ring) == [-1, -1, 1]
+    assert [s['parent']['id'] for s in states] == ['p0', 'p1', 'p1']
+    # Island 0 saw island 2's elite as it was before the exchange (0.2), not the adopted one.
+    assert states[0]['parent']['score_f'] == 0.5
+    states[2]['parent']['genome'][0] = -1.0
+    assert states[1]['parent']['genome'][0] == 1.0
+
+
+def test_run_epoch_keeps_the_restored_archive(monkeypatch):
+    cfg = validate_config({'population': 3, 'steps_per_candidate': 8, 'genome_dim': 4,
+                           'archive': {'kind': 'dense', 'bins': [4, 4]}, 'islands': {'count': 2}})
+    state = init_island(cfg, 1)
+    built = []
+    monkeypatch.setattr(archive_mod.MapElitesArchive, '__init__',
+                        lambda self, *a, **k: built.append(1) or None)
+    out, rows = run_epoch(cfg, state, 0, 2)
+    assert not built and len(rows) == 6
+    assert str(out['archive']['kind']) == 'dense'
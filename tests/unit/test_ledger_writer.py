@@ -0,0 +1,54 @@
+import json
+
+from athanor.utils.logging import LedgerWriter, RowEncoder, log_jsonl
+
+
+ROW = {
+    'gen': 1, 'idx': 2, 'id': 'g001_c002', 'verdict': 'APPROVE', 'reason': 'H7>=threshold',
+    'h7': 0.875, 'q': 0.6666666666666666, 'admitted': True, 'delta_norm': 0.5,
+}
+
+
+def test_row_encoder_matches_json_dumps():
+    enc = RowEncoder()
+    rows = [
+        ROW,
+        {**ROW, 'id': 'gé"\\', 'admitted': False, 'h7': 1e-12},
+        {**ROW, 'h7': float('nan')},
+        {**ROW, 'q': float('inf')},
+        {**ROW, 'gen': 1.5},
+        {'other': [1, 2]},
+        dict(reversed(list(ROW.items()))),
+    ]
+    for row in rows:
+        assert enc.encode(row) == json.dumps(row) + '\n'
+
+
+def test_ledger_writer_buffers_until_flush(tmp_path):
+    path = tmp_path / 'ledger.jsonl'
+    w = LedgerWriter(str(path), flush_rows=3)
+    w.write(ROW)
+    w.write(ROW)
+    assert path.read_text() == ''
+    w.write(ROW)
+    w.write(ROW)
+    w.sync()
+    assert len(path.read_text().splitlines()) == 4
+    assert w.tell() == path.stat().st_size
+    w.close()
+
+
+def test_ledger_writer_background_thread(tmp_path):
+    path = tmp_path / 'ledger.jsonl'
+    with LedgerWriter(str(path), flush_rows=2, background=True) as w:
+        for i in range(7):
+            w.write({**ROW, 'idx': i})
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r['idx'] for r in rows] == list(range(7))
+
+
+def test_log_jsonl_writes_one_row_per_line(tmp_path):
+    path = tmp_path / 'log.jsonl'
+    log_jsonl(str(path), {'a': 1})
+    log_jsonl(str(path), {'a': 2})
+    assert [json.loads(line)['a'] for line in path.read_text().splitlines()] == [1, 2]
@@ -0,0 +1,41 @@
+import json
+
+from athanor.utils.profiling import NULL_PROFILER, StageProfiler, make_profiler
+
+
+def test_disabled_profiler_is_shared_noop(tmp_path):
+    prof = make_profiler(str(tmp_path), {'enabled': False})
+    assert prof is NULL_PROFILER and not prof.enabled
+    with prof.span('x'):
+        prof.count('y')
+    prof.end_generation(0, 4)
+    prof.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stage_profiler_writes_generation_rows_and_openmetrics(tmp_path):
+    prof = StageProfiler(str(tmp_path), memory='tracemalloc')
+    for g in range(2):
+        with prof.span('telemetry'):
+            bytearray(1 << 16)
+        with prof.span('verify'):
+            pass
+        prof.count('refine_retries', 2)
+        prof.end_generation(g, 8)
+    with prof.span('artifacts'):
+        pass
+    prof.close()
+
+    rows = [json.loads(l) for l in (tmp_path / 'metrics.jsonl').read_text().splitlines()]
+    assert [r['gen'] for r in rows] == [0, 1, None]
+    assert rows[0]['stages']['telemetry']['calls'] == 1
+    assert rows[1]['counters'] == {'refine_retries': 2}
+    assert rows[0]['candidates'] == 8 and rows[0]['candidates_per_s'] > 0
+    assert rows[0]['peak_tracemalloc_bytes'] >= 1 << 16
+    assert set(rows[2]['stages']) == {'artifacts'}
+
+    prom = (tmp_path / 'metrics.prom').read_text()
+    assert 'athanor_stage_calls_total{stage="telemetry"} 2' in prom
+    assert 'athanor_events_total{event="refine_retries"} 4' in prom
+    assert 'athanor_candidates_total 16' in prom
+    assert prom.endswith('# EOF\n')
@@ -1,8 +1,8 @@
 import numpy as np
 
-from athanor.adapters import ProposerAdapter
+from athanor.adapters import GaussianNoiseAdapter, ProposerAdapter
 from athanor.agents.proposer_agent import ProposerAgent
-from athanor.core.types import Candidate
+from athanor.core.types import Candidate, CandidateBatch, stack_genomes
 
 
 class StubAdapter(ProposerAdapter):
@@ -39,3 +39,57 @@ def test_proposer_agent_defaults_to_gaussian_noise_adapter():
 
     assert "delta_norm" in child.tags
     assert child.tags["proposer_adapter"] == "gaussian_noise"
+
+
+def test_per_call_sigma_leaves_proposer_untouched():
+    proposer = ProposerAgent(sigma=0.12, step_cap=100.0)
+    parent = Candidate(id="parent", genome=np.zeros((64,), dtype=np.float32))
+
+    small = proposer.step(parent=parent, rng=np.random.default_rng(7), child_id="a", sigma=0.12 * 0.75 ** 2)
+    base = proposer.step(parent=parent, rng=np.random.default_rng(7), child_id="b")
+
+    assert proposer.sigma == 0.12
+    assert np.allclose(small.genome, base.genome * 0.75 ** 2, atol=1e-6)
+
+
+def test_adapters_without_sigma_argument_ignore_override():
+    adapter = StubAdapter()
+    proposer = ProposerAgent(adapter=adapter)
+    parent = Candidate(id="parent", genome=np.zeros((4,), dtype=np.float32))
+
+    child = proposer.step(parent=parent, rng=np.random.default_rng(0), child_id="c", sigma=0.01)
+
+    assert adapter.calls == 1 and child.id == "c"
+
+
+def test_gaussian_propose_batch_matches_sequential_proposals():
+    parent = Candidate(id="parent", genome=np.random.default_rng(0).normal(size=(32,)).astype(np.float32))
+    for step_cap in (0.5, 100.0):
+        adapter = GaussianNoiseAdapter(sigma=0.12, step_cap=step_cap)
+        r_loop, r_batch = np.random.default_rng(9), np.random.default_rng(9)
+        loop = [adapter.propose(parent, r_loop, f"g001_c{i:03d}") for i in range(40)]
+        batch = adapter.propose_batch(parent, r_batch, 40, "g001_c")
+        for a, b in zip(loop, batch):
+            assert a.id == b.id
+            assert np.array_equal(a.genome, b.genome)
+            assert a.tags == b.tags
+            assert b.tags["delta_norm"] <= step_cap + 1e-6
+        assert r_loop.random() == r_batch.random()
+        block = stack_genomes(batch)
+        assert isinstance(batch, CandidateBatch) and block is batch.genomes
+        assert block.shape == (40, 32) and np.shares_memory(block, batch[0].genome)
+        # Any reordering or subset is a plain list and gets stacked.
+        np.testing.assert_array_equal(stack_genomes(batch[::-1]), block[::-1])
+        assert not np.shares_memory(stack_genomes(batch[::-1]), block)
+        assert not np.shares_memory(stack_genomes(list(batch)), block)
+
+
+def test_propose_batch_default_falls_back_to_propose():
+    adapter = StubAdapter()
+    proposer = ProposerAgent(adapter=adapter)
+    parent = Candidate(id="parent", genome=np.zeros((4,), dtype=np.float32))
+
+    children = proposer.step_batch(parent, rng=np.random.default_rng(0), n=3, id_prefix="g000_c", sigma=0.5)
+
+    assert adapter.calls == 3
+    assert [c.id for c in children] == ["g000_c000", "g000_c001", "g000_c002"]
@@ -23,3 +23,39 @@ def test_validate_config_rejects_mode():
         assert 'dphi_mode' in str(exc)
     else:
         raise AssertionError('Expected ValueError for dphi_mode')
+
+
+def test_validate_config_precision():
+    assert validate_config({})['precision'] == 'float32'
+    assert validate_config({'precision': 'Float16'})['precision'] == 'float16'
+    try:
+        validate_config({'precision': 'bfloat16'})
+    except ValueError as exc:
+        assert 'precision' in str(exc)
+    else:
+        raise AssertionError('Expected ValueError for precision')
+
+
+def test_validate_config_robustness():
+    out = validate_config({})['verify']['robustness']
+    assert out == {'samples': 0, 'sigma': 0.05, 'floor': None}
+    for bad in ({'samples': -1}, {'sigma': -0.1}, {'samples': 8, 'floor': 1.5}, {'floor': 0.5}):
+        try:
+            validate_config({'verify': {'robustness': bad}})
+        except ValueError as exc:
+            assert 'verify.robustness' in str(exc)
+        else:
+            raise AssertionError(f'Expected ValueError for {bad}')
+
+
+def test_validate_config_archive_bins():
+    assert validate_config({'archive': {'kind': 'dense', 'bins': [8, 4, 2]}})['archive']['bins'] == [8, 4, 2]
+    assert validate_config({'archive': {'kind': 'dense', 'bins': [32]}})['archive']['bins'] == [32]
+    for bad in ({'bins': [8, 4, 2]}, {'kind': 'dense', 'bins': []}, {'kind': 'dense', 'bins': [2] * 6},
+                {'kind': 'dense', 'bins': [4, 0]}):
+        try:
+            validate_config({'archive': bad})
+        except ValueError as exc:
+            assert 'archive.bins' in str(exc)
+        else:
+            raise AssertionError(f'Expected ValueError for {bad}')
@@ -0,0 +1,72 @@
+import numpy as np
+
+from athanor.core.coherence import estimate
+from athanor.core.streaming import OnlineCoherenceEstimator
+
+
+def traj(n=40, d=6, seed=0):
+    x = np.random.default_rng(seed).normal(0.0, 0.2, size=(n, d)).astype(np.float32)
+    return np.cumsum(x * 0.5, axis=0).astype(np.float32)
+
+
+def assert_summary_close(got, ref):
+    assert got.keys() == ref.keys()
+    for k, v in ref.items():
+        if isinstance(v, float):
+            assert abs(got[k] - v) < 1e-5, k
+        else:
+            assert got[k] == v, k
+
+
+def test_online_matches_batch_at_any_prefix():
+    x = traj()
+    for mode in ("l2", "cosine"):
+        on = OnlineCoherenceEstimator(threshold=0.8, mode=mode)
+        pos = 0
+        for k in (1, 1, 5, 3, 12, 18):
+            on.update(x[pos:pos + k])
+            pos += k
+            ref = estimate(x[:pos], threshold=0.8, mode=mode)
+            assert on.n == max(pos - 1, 0)
+            assert on.h7 == ref.h7
+            assert_summary_close(on.summary(), ref.summary)
+
+
+def test_online_single_frames_and_keep_series():
+    x = traj(n=15)
+    on = OnlineCoherenceEstimator(threshold=0.8, keep_series=True)
+    for frame in x:
+        on.update(frame)
+    ref = estimate(x, threshold=0.8)
+    res = on.result()
+    assert np.allclose(res.dphi, ref.dphi)
+    assert np.allclose(res.coherence, ref.coherence)
+    assert_summary_close(res.summary, ref.summary)
+
+
+def test_online_sliding_window_tracks_recent_transitions():
+    x = traj(n=60, seed=3)
+    on = OnlineCoherenceEstimator(threshold=0.8, window=10)
+    for t in range(0, 60, 7):
+        on.update(x[t:t + 7])
+        end = min(t + 7, 60)
+        ref = estimate(x[max(end - 11, 0):end], threshold=0.8)
+        assert on.n == min(end - 1, 10)
+        assert_summary_close(on.summary(), ref.summary)
+
+
+def test_online_float64_precision_matches_batch():
+    x = traj(n=50, seed=5).astype(np.float64)
+    ref = estimate(x, threshold=0.8, mode="cosine")
+    # A threshold on one of the float64 C values: float32 rounding would move it across.
+    thr = float(np.sort(ref.coherence)[len(ref.coherence) // 2])
+    ref = estimate(x, threshold=thr, mode="cosine")
+    on = OnlineCoherenceEstimator(threshold=thr, mode="cosine", precision="float64", keep_series=True)
+    for k in range(0, 50, 9):
+        on.update(x[k:k + 9])
+    res = on.result()
+    assert res.coherence.dtype == np.float64
+    np.testing.assert_array_equal(res.coherence, ref.coherence)
+    assert on.h7 == ref.h7
+    assert_summary_close(res.summary, ref.summary)
+    assert abs(on.summary()["C_mean"] - ref.summary["C_mean"]) < 1e-12
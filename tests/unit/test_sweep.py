@@ -0,0 +1,38 @@
+import os
+
+from athanor.evolution.dgm_loop import new_run_path
+from athanor.experiments.sweep import completed_runs, expand_sweep
+
+
+def test_expand_sweep_grid_product_and_dotted_keys():
+    spec = {'overrides': {'generations': 2},
+            'grid': {'seed': [1, 2], 'archive.bins': [[4, 4], [8, 8]]}}
+    variants = expand_sweep(spec)
+    assert len(variants) == 4
+    assert {tuple(v['config']['archive']['bins']) for v in variants} == {(4, 4), (8, 8)}
+    assert all(v['config']['generations'] == 2 for v in variants)
+    assert len({v['config_hash'] for v in variants}) == 4
+
+
+def test_expand_sweep_random_is_seeded_and_validated():
+    spec = {'grid': {'seed': [1]},
+            'random': {'samples': 3, 'seed': 7,
+                       'params': {'alpha': {'low': 0.5, 'high': 0.9}, 'population': [8, 16]}}}
+    a, b = expand_sweep(spec), expand_sweep(spec)
+    assert [v['config_hash'] for v in a] == [v['config_hash'] for v in b]
+    assert all(0.5 <= v['config']['alpha'] <= 0.9 for v in a)
+    try:
+        expand_sweep({'grid': {'threshold_h7': [1.5]}})
+    except ValueError as exc:
+        assert 'threshold_h7' in str(exc)
+    else:
+        raise AssertionError('Expected ValueError for threshold_h7')
+
+
+def test_completed_runs_reads_metadata_and_run_paths_are_unique(tmp_path):
+    h = 'ab' * 32
+    first, second = new_run_path(str(tmp_path), h), new_run_path(str(tmp_path), h)
+    assert first != second
+    with open(os.path.join(first, 'metadata.yaml'), 'w', encoding='utf-8') as f:
+        f.write(f'seed: 1\nconfig_hash: {h}\n')
+    assert completed_runs(str(tmp_path)) == {h: first}
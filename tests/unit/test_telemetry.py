@@ -0,0 +1,103 @@
+import numpy as np
+
+from athanor.core.telemetry import TrajectoryStream, capture_trajectory, capture_trajectory_batch
+
+
+def dense_reference(genome, steps, noise, seed):
+    rng = np.random.default_rng(int(seed))
+    D = int(genome.size)
+    A = np.eye(D, dtype=np.float32) + 0.05 * np.tanh(genome.astype(np.float32))
+    x = np.zeros((int(steps), D), dtype=np.float32)
+    s = rng.normal(0.0, 0.1, size=(D,)).astype(np.float32)
+    for t in range(int(steps)):
+        x[t] = s
+        s = (A @ s) + rng.normal(0.0, float(noise), size=(D,)).astype(np.float32)
+    return x
+
+
+def test_capture_trajectory_matches_dense_dynamics():
+    genome = np.random.default_rng(3).normal(0.0, 0.5, size=(96,)).astype(np.float32)
+    ref = dense_reference(genome, steps=20, noise=0.02, seed=41)
+    out = capture_trajectory(genome, steps=20, noise=0.02, seed=41)
+
+    assert out.traj.shape == (20, 96)
+    assert out.traj.dtype == np.float32
+    assert np.array_equal(out.traj[0], ref[0])
+    assert np.allclose(out.traj, ref, atol=1e-5)
+
+
+def test_capture_trajectory_seed_reproducible():
+    genome = np.linspace(-1.0, 1.0, 16, dtype=np.float32)
+    a = capture_trajectory(genome, steps=12, seed=7).traj
+    b = capture_trajectory(genome, steps=12, seed=7).traj
+    c = capture_trajectory(genome, steps=12, seed=8).traj
+    assert np.array_equal(a, b)
+    assert not np.array_equal(a, c)
+
+
+def test_capture_trajectory_degenerate_steps():
+    genome = np.zeros((4,), dtype=np.float32)
+    assert capture_trajectory(genome, steps=0).traj.shape == (0, 4)
+    assert capture_trajectory(genome, steps=1).traj.shape == (1, 4)
+
+
+def test_capture_trajectory_batch_matches_single():
+    genomes = np.random.default_rng(5).normal(0.0, 0.5, size=(4, 32)).astype(np.float32)
+    seeds = [11, 12, 13, 99]
+    batch = capture_trajectory_batch(genomes, seeds, steps=15, noise=0.03)
+
+    assert batch.traj.shape == (4, 15, 32)
+    for k, sd in enumerate(seeds):
+        single = capture_trajectory(genomes[k], steps=15, noise=0.03, seed=sd).traj
+        assert np.array_equal(batch.traj[k, 0], single[0])
+        assert np.allclose(batch.traj[k], single, atol=1e-6)
+
+
+def test_trajectory_stream_matches_batch_capture():
+    rng = np.random.default_rng(4)
+    genomes = rng.normal(0.0, 0.5, size=(6, 11)).astype(np.float32)
+    seeds = list(range(20, 26))
+    full = capture_trajectory_batch(genomes, seeds, steps=29).traj
+
+    stream = TrajectoryStream(genomes, seeds, steps=29)
+    parts = [stream.initial()[:, None]]
+    while stream.remaining:
+        parts.append(stream.advance(4))
+    assert np.array_equal(np.concatenate(parts, axis=1), full)
+
+    # Dropping rows does not disturb the frames of the rows that continue.
+    stream = TrajectoryStream(genomes, seeds, steps=29)
+    stream.advance(5)
+    assert np.array_equal(stream.advance(5, rows=[1, 4]), full[[1, 4], 6:11])
+
+
+def test_precision_sets_storage_and_accumulation_dtypes():
+    from athanor.core.coherence import delta_phi_batch, estimate_batch
+
+    genomes = np.random.default_rng(6).normal(0.0, 0.5, size=(3, 16)).astype(np.float32)
+    seeds = [1, 2, 3]
+    ref = capture_trajectory_batch(genomes, seeds, steps=20, precision='float64').traj
+    assert ref.dtype == np.float64
+    for precision, store, acc, tol in (('float16', np.float16, np.float32, 2e-3), ('float32', np.float32, np.float32, 1e-6)):
+        traj = capture_trajectory_batch(genomes, seeds, steps=20, precision=precision).traj
+        assert traj.dtype == store and traj.nbytes == ref.nbytes * np.dtype(store).itemsize // 8
+        assert np.allclose(traj, ref, atol=tol)
+        for mode in ('l2', 'cosine'):
+            assert delta_phi_batch(traj, mode=mode).dtype == acc
+        assert estimate_batch(traj)[0].coherence.dtype == acc
+    assert estimate_batch(ref)[0].coherence.dtype == np.float64
+
+
+def test_precision_stream_and_single_capture_match_batch():
+    genomes = np.random.default_rng(8).normal(0.0, 0.5, size=(4, 9)).astype(np.float32)
+    seeds = [5, 6, 7, 8]
+    for precision in ('float16', 'float64'):
+        full = capture_trajectory_batch(genomes, seeds, steps=17, precision=precision).traj
+        stream = TrajectoryStream(genomes, seeds, steps=17, precision=precision)
+        parts = [stream.initial()[:, None]]
+        while stream.remaining:
+            parts.append(stream.advance(5))
+        assert np.array_equal(np.concatenate(parts, axis=1), full)
+        single = capture_trajectory(genomes[2], steps=17, seed=7, precision=precision).traj
+        assert single.dtype == full.dtype
+        assert np.allclose(single.astype(np.float64), full[2], atol=1e-3 if precision == 'float16' else 1e-12)
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from athanor.core.types import Candidate, DeltaPhiEstimate, TelemetryBatch
+
+
+def make_candidate():
+    c = Candidate(id='c0', genome=np.zeros((3,), dtype=np.float32))
+    c.telemetry = TelemetryBatch(traj=np.ones((24, 3), dtype=np.float32), meta={})
+    c.dphi = DeltaPhiEstimate(dphi=np.ones(23, dtype=np.float32), coherence=np.ones(23, dtype=np.float32),
+                              h7=0.75, summary={'h7': 0.75})
+    return c
+
+
+def test_candidate_and_estimate_use_slots():
+    c = make_candidate()
+    for obj in (c, c.dphi, c.telemetry):
+        assert not hasattr(obj, '__dict__')
+    with pytest.raises(AttributeError):
+        c.extra = 1
+
+
+@pytest.mark.parametrize('retention', ['full', 'summary', 'none'])
+def test_release_follows_retention_policy(retention):
+    c = make_candidate().release(retention)
+    if retention == 'full':
+        assert c.telemetry is not None and c.dphi.dphi.size == 23
+    elif retention == 'summary':
+        assert c.telemetry is None
+        assert c.dphi.dphi.size == 0 and c.dphi.coherence.size == 0
+        assert c.dphi.h7 == 0.75 and c.dphi.summary == {'h7': 0.75}
+    else:
+        assert c.telemetry is None and c.dphi is None
+
+
+def test_release_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        make_candidate().release('some')
@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from athanor.agents import TelemetryAgent, VerifierAgent
+from athanor.core.types import Candidate
+
+
+def make_children(n, dim, seed):
+    rng = np.random.default_rng(seed)
+    return [Candidate(id=f'c{i}', genome=rng.normal(0.0, rng.uniform(0.1, 3.0), size=(dim,)).astype(np.float32))
+            for i in range(n)]
+
+
+@pytest.mark.parametrize('mode', ['l2', 'cosine'])
+@pytest.mark.parametrize('threshold', [0.5, 0.9, 0.97, 0.99])
+def test_early_exit_keeps_every_verdict(mode, threshold):
+    steps = 120
+    telemetry = TelemetryAgent(steps=steps, noise=0.02, seed=0)
+    full = VerifierAgent(threshold_h7=threshold, dphi_mode=mode)
+    early = VerifierAgent(threshold_h7=threshold, dphi_mode=mode, early_exit=True, chunk=5)
+    seeds = list(range(40))
+
+    ref = make_children(40, 16, 1)
+    full.step_batch(ref, batch=telemetry.step_batch(ref, seeds))
+    out = make_children(40, 16, 1)
+    early.step_stream(out, telemetry.stream(out, seeds))
+
+    assert [c.verdict for c in out] == [c.verdict for c in ref]
+    simulated = [c.dphi.summary['steps_simulated'] for c in out]
+    assert all(1 <= s <= steps for s in simulated)
+    for c, r in zip(out, ref):
+        s = c.telemetry.traj.shape[0]
+        assert np.array_equal(c.telemetry.traj, r.telemetry.traj[:s])
+
+
+def test_early_exit_stops_once_decided():
+    v = VerifierAgent(threshold_h7=0.7, refine_floor=0.5)
+    hits = np.array([70, 0, 50, 50, 69])
+    seen = np.array([70, 51, 60, 81, 99])
+    assert v._decided_mask(hits, seen, 100).tolist() == [True, True, False, True, False]
+    assert v._decided_mask(hits, seen, 0).all()
+    assert [v.verdict_for(h)[0] for h in (0.7, 0.69, 0.5, 0.49)] == ['APPROVE', 'REFINE', 'REFINE', 'REJECT']
+    assert v.band(np.array([0.7, 0.5, 0.1])).tolist() == [2, 1, 0]
+
+
+def test_robustness_stage_is_order_independent_and_gates_approve():
+    telemetry = TelemetryAgent(steps=40, noise=0.02, seed=0)
+    seeds = list(range(12))
+
+    def verify(v, children):
+        return v.step_batch(children, batch=telemetry.step_batch(children, seeds))
+
+    plain = verify(VerifierAgent(threshold_h7=0.5), make_children(12, 8, 4))
+    robust = VerifierAgent(threshold_h7=0.5, robust_samples=200, robust_sigma=0.2, robust_seed=3)
+    out = verify(robust, make_children(12, 8, 4))
+    for a, b in zip(out, plain):
+        assert a.verdict == b.verdict
+        assert 0.0 <= a.dphi.summary['immunity_q05'] <= a.dphi.summary['immunity_q50'] <= 1.0
+        assert a.dphi.summary['drift_q05'] <= a.dphi.summary['drift_q95']
+
+    # Same candidates in another order (and batch) get the same ensemble.
+    rev = make_children(12, 8, 4)[::-1]
+    rev = robust.step_batch(rev, batch=telemetry.step_batch(rev, seeds[::-1]))
+    assert [c.dphi.summary for c in rev[::-1]] == [c.dphi.summary for c in out]
+
+    approved = [c for c in out if c.verdict == 'APPROVE']
+    assert approved
+    floor = sorted(c.dphi.summary['immunity_q05'] for c in approved)[len(approved) // 2] + 1e-12
+    gated = verify(VerifierAgent(threshold_h7=0.5, robust_samples=200, robust_sigma=0.2, robust_seed=3,
+                                 robust_floor=floor), make_children(12, 8, 4))
+    for a, b in zip(gated, out):
+        if b.verdict == 'APPROVE' and b.dphi.summary['immunity_q05'] < floor:
+            assert (a.verdict, a.reason) == ('REFINE', 'robustness below floor')
+        else:
+            assert a.verdict == b.verdict
+
+
+@pytest.mark.parametrize('mode', ['l2', 'cosine'])
+def test_early_exit_keeps_verdicts_with_robustness_floor(mode):
+    steps = 80
+    telemetry = TelemetryAgent(steps=steps, noise=0.02, seed=0)
+    seeds = list(range(40))
+    kw = dict(threshold_h7=0.6, dphi_mode=mode, robust_samples=64, robust_sigma=0.3, robust_seed=5)
+
+    probe = make_children(40, 16, 2)
+    VerifierAgent(**kw).step_batch(probe, batch=telemetry.step_batch(probe, seeds))
+    approved = sorted(c.dphi.summary['immunity_q05'] for c in probe if c.verdict == 'APPROVE')
+    assert approved
+    floor = approved[len(approved) // 2]
+
+    ref = make_children(40, 16, 2)
+    VerifierAgent(robust_floor=floor, **kw).step_batch(ref, batch=telemetry.step_batch(ref, seeds))
+    out = make_children(40, 16, 2)
+    early = VerifierAgent(robust_floor=floor, early_exit=True, chunk=5, **kw)
+    early.step_stream(out, telemetry.stream(out, seeds))
+
+    assert [(c.verdict, c.reason) for c in out] == [(c.verdict, c.reason) for c in ref]
+    assert any(c.reason == 'robustness below floor' for c in ref)
+    for c, r in zip(out, ref):
+        if r.verdict == 'APPROVE' or r.reason == 'robustness below floor':
+            assert c.dphi.summary['steps_simulated'] == steps
+            assert c.dphi.summary['immunity_q05'] == r.dphi.summary['immunity_q05']